@@ -29,6 +29,7 @@ from app.services.agentic_analysis_service import run_agentic_analysis_loop
 from app.services.ai_interpreter import interpret_architecture
 from app.services.report_generator import generate_html_report
 from app.services.analysis_state_store import save_state, load_state
+from app.services.incremental_analysis import refresh_cached_state
 
 router = APIRouter(prefix="/repos", tags=["repos"])
 
@@ -177,12 +178,24 @@ async def stream_repo_snapshot_loop(payload: AnalysisLoopRequest):
 
 @router.post("/state", response_model=CachedStateResponse)
 async def get_cached_state(payload: CachedStateRequest):
-    """Return persisted analysis state if it exists and matches current git HEAD."""
-    cached = load_state(
-        repo_id=payload.repo_id,
-        local_path=payload.local_path,
-        cache_dir=_resolve_cache_dir(),
-    )
+    """
+    Return persisted analysis state if it exists and matches current git HEAD.
+    With incremental=true, a state saved at an older commit is updated from the
+    git diff instead of being treated as stale.
+    """
+    if payload.incremental:
+        cached = await asyncio.to_thread(
+            refresh_cached_state,
+            repo_id=payload.repo_id,
+            local_path=payload.local_path,
+            cache_dir=_resolve_cache_dir(),
+        )
+    else:
+        cached = load_state(
+            repo_id=payload.repo_id,
+            local_path=payload.local_path,
+            cache_dir=_resolve_cache_dir(),
+        )
     if cached is None:
         return CachedStateResponse(repo_id=payload.repo_id, found=False)
     return CachedStateResponse(repo_id=payload.repo_id, found=True, final_state=cached)
@@ -6,10 +6,42 @@ class Settings(BaseSettings):
     REPO_BASE_DIR: Path = Path("./data/repos")
     # Directory for persisted analysis state cache
     ANALYSIS_CACHE_DIR: Path = Path("./data/analysis_cache")
+    # Directory for persistent per-repo file fingerprint indexes
+    FILE_INDEX_DIR: Path = Path("./data/file_index")
     # Ollama model used for both agentic loop and architecture interpretation
     OLLAMA_MODEL: str = "qwen2.5-coder:7b"
     # Maximum allowed repo size in MB before clone is rejected (0 = no limit)
     REPO_MAX_SIZE_MB: int = 500
+    # Maximum number of repository scan results kept in memory
+    SCAN_CACHE_MAX_ENTRIES: int = 16
+    # How the scanner lists files: "filesystem", "git" (tracked files only) or "auto" (git for checkouts)
+    SCANNER_BACKEND: str = "filesystem"
+    # Per-repo ignore file (gitignore syntax) applied on top of .gitignore; empty disables it
+    SCANNER_IGNORE_FILE: str = ".codenarratorignore"
+    # Source files larger than this are skipped by the scanner (0 = no limit); skipped files
+    # also drop out of the byte/LOC language breakdown, so the cap is off by default
+    SCANNER_MAX_FILE_SIZE_KB: int = 0
+    # Files at least this large get a binary/minified content sniff (0 = never sniff)
+    SCANNER_SNIFF_MIN_KB: int = 32
+    # Also count lines of every source file during the scan (LOC-weighted language breakdown)
+    SCANNER_COUNT_LINES: bool = False
+    # Extract imports for every scanned file before the agent loop (whole-repo dependency graph)
+    IMPORT_INDEX_ENABLED: bool = True
+    # SQLite file holding extracted imports by content hash, shared by all repos and processes
+    IMPORT_CACHE_PATH: Path = Path("./data/import_cache.sqlite")
+    # Entries kept in the in-process LRU in front of the import cache file
+    IMPORT_CACHE_MEMORY_ENTRIES: int = 4096
+    # Worker processes for bulk import extraction (0 = one per CPU, 1 = in-process)
+    IMPORT_INDEX_WORKERS: int = 0
+    # Files handed to a worker process per batch
+    IMPORT_INDEX_CHUNK_SIZE: int = 64
+    # Fewer files than this left to extract run in-process whatever IMPORT_INDEX_WORKERS says;
+    # starting a process pool costs more than it saves on small batches
+    IMPORT_INDEX_PARALLEL_MIN_FILES: int = 2000
+    # Worker processes for tree-sitter AST extraction (0 = one per CPU, 1 = in-process)
+    AST_WORKERS: int = 0
+    # Files handed to an AST worker process per batch
+    AST_CHUNK_SIZE: int = 64
 
     class Config:
         env_file = ".env"
@@ -60,30 +60,30 @@ LANGUAGE_REGISTRY: Dict[str, LanguageCapabilities] = {
     "cpp": {
         "has_ast": False,
         "parser_backend": ParserBackend.NONE,
-        "supports_import_graph": False,
+        "supports_import_graph": True,
         "supports_entry_points": True,
-        "status": "unknown",
+        "status": "experimental",
     },
     "c": {
         "has_ast": False,
         "parser_backend": ParserBackend.NONE,
-        "supports_import_graph": False,
+        "supports_import_graph": True,
         "supports_entry_points": True,
-        "status": "unknown",
+        "status": "experimental",
     },
     "rust": {
         "has_ast": False,
         "parser_backend": ParserBackend.NONE,
-        "supports_import_graph": False,
+        "supports_import_graph": True,
         "supports_entry_points": True,
-        "status": "unknown",
+        "status": "experimental",
     },
     "go": {
         "has_ast": False,
         "parser_backend": ParserBackend.NONE,
-        "supports_import_graph": False,
+        "supports_import_graph": True,
         "supports_entry_points": True,
-        "status": "unknown",
+        "status": "experimental",
     },
     "unknown": {
         "has_ast": False,
@@ -28,6 +28,8 @@ class RepoSummary(BaseModel):
     file_count: int
     languages: list[str]
     language_breakdown: dict[str, int]
+    language_breakdown_bytes: dict[str, int] = Field(default_factory=dict)
+    language_breakdown_lines: dict[str, int] = Field(default_factory=dict)
     top_level_dirs: list[str]
     entry_points: list[str]
     inspected_languages: list[str] = Field(default_factory=list)
@@ -80,6 +82,8 @@ class AnalysisLoopRequest(BaseModel):
 class CachedStateRequest(BaseModel):
     repo_id: str
     local_path: str
+    # Bring a state saved at an older commit forward by re-inspecting only changed files
+    incremental: bool = False
 
 
 class CachedStateResponse(BaseModel):
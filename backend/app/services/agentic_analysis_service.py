@@ -17,17 +17,27 @@ from app.services.analysis_snapshot_service import (
     _compute_dependency_graph_summary,
     _copy_state,
     _inspect_file,
+    _mark_explored,
     _newly_explored_file,
     _record_dependency_edge,
     _record_inspected_fact,
     _reduce_unknowns,
     _refresh_candidates_for_signal,
     _refine_summary,
-    _resolve_internal_import,
     _resolved_import_targets,
     _update_confidence,
 )
-from app.services.repo_scanner import scan_repository
+from app.services.dependency_graph import attach_dependency_graph, detach_dependency_graph
+from app.services.file_io import iter_lines, read_preview
+from app.services.ignore_rules import NOISE_RULES
+from app.services.import_cache import import_cache_stats
+from app.services.import_indexer import (
+    index_repository_imports,
+    merge_dependency_edges,
+    prune_dependency_edges,
+)
+from app.services.resolution_cache import get_resolution_index, resolution_cache_stats
+from app.services.scan_cache import get_scan_result, scan_cache_stats
 from app.core.config import settings
 
 LOGGER = logging.getLogger(__name__)
@@ -190,14 +200,25 @@ def run_agentic_analysis_loop(
     # Cache the full repo file list once so tool functions don't re-scan on every call.
     repo_path = Path(state["current_summary"]["local_path"]).resolve()
     try:
-        _cached_scan = scan_repository(repo_path)
+        _cached_scan = get_scan_result(repo_path)
         state["_cached_files"] = _cached_scan["files"]
     except Exception:
         state["_cached_files"] = []
 
+    # Whole-repo dependency graph: extract imports for every file up front.
+    if settings.IMPORT_INDEX_ENABLED and state["_cached_files"]:
+        try:
+            merge_dependency_edges(state, index_repository_imports(repo_path))
+        except Exception:
+            LOGGER.exception("Bulk import indexing failed for %s; continuing with explored files only", repo_path)
+    # Built once here; each read_file then folds in only that file's imports.
+    attach_dependency_graph(state)
+
     # Kept separate — not part of AnalysisState model shape.
     architecture_insights: List[Dict] = []
     initial_explored_len = len(state.get("explored_files", []))
+    # Counters are process-wide; the difference at the end is this run's share.
+    resolution_stats_before = resolution_cache_stats()
 
     messages: List = [_build_system_message(state)]
     step_trace: List[Dict] = []
@@ -299,6 +320,24 @@ def run_agentic_analysis_loop(
     state["dependency_graph_summary"] = _compute_dependency_graph_summary(state)
     # Keep candidate_files fresh so AnalysisState validation passes.
     _refresh_candidates_for_signal(state, limit=8)
+    LOGGER.info("Scan cache after analysis of %s: %s", state["repo_id"], scan_cache_stats())
+    LOGGER.info("Import cache after analysis of %s: %s", state["repo_id"], import_cache_stats())
+    LOGGER.info(
+        "Import resolution during analysis of %s: %s",
+        state["repo_id"],
+        {
+            name: count - resolution_stats_before[name]
+            for name, count in resolution_cache_stats().items()
+            if name != "entries"
+        },
+    )
+    # The file list is a view into the shared scan cache entry and the graph
+    # is derived from dependency_edges; never persist either with the state.
+    state.pop("_cached_files", None)
+    detach_dependency_graph(state)
+    # The summary above already covers the bulk-indexed edges; the saved
+    # state only keeps those of explored files.
+    prune_dependency_edges(state)
 
     explored_files_in_order = state["explored_files"][initial_explored_len:]
 
@@ -452,7 +491,7 @@ def _tool_read_file(state: Dict, file_path: str) -> Tuple[str, Optional[str]]:
             None,
         )
 
-    state["explored_files"].append(file_path)
+    _mark_explored(state, file_path)
 
     fact_evidence = _record_inspected_fact(state, inspected)
     fact_evidence["explored_import_target"] = candidate_is_import_target
@@ -485,17 +524,9 @@ def _tool_follow_import(
     if not from_file or not import_path:
         return "Error: from_file and import_path are both required.", None
 
-    repo_path = Path(state["current_summary"]["local_path"]).resolve()
-    scanned_files = set(state.get("_cached_files", []))
-    package_roots = [Path(r) for r in state.get("package_roots", [])]
-
-    resolved = _resolve_internal_import(
-        repo_path=repo_path,
-        source_file=from_file,
-        import_specifier=import_path,
-        package_roots=package_roots,
-        scanned_files=scanned_files,
-    )
+    repo_path = Path(state["current_summary"]["local_path"])
+    index = get_resolution_index(repo_path, state.get("package_roots", []))
+    resolved = index.resolve(from_file, import_path)
     if resolved is None:
         return (
             f"Could not resolve '{import_path}' from '{from_file}' to an internal file. "
@@ -527,8 +558,7 @@ def _tool_search_for_pattern(
         if file_extensions and not any(file_path.endswith(e) for e in file_extensions):
             continue
         try:
-            content = (repo_path / file_path).read_text(encoding="utf-8", errors="ignore")
-            for lineno, line in enumerate(content.splitlines(), 1):
+            for lineno, line in enumerate(iter_lines(repo_path / file_path), 1):
                 if compiled.search(line):
                     matches.append(f"{file_path}:{lineno}: {line.strip()[:120]}")
                     if len(matches) >= MAX_SEARCH_RESULTS:
@@ -660,29 +690,18 @@ def _call_model_with_retry(messages: List, retries: int = 2):
 # Helpers
 # ---------------------------------------------------------------------------
 
-_NOISE_SUFFIXES = {".min.js", ".min.css", ".min.mjs", ".bundle.js", ".chunk.js"}
-_NOISE_PATH_SEGMENTS = {"node_modules", "vendor", "vendors", "dist", "build", ".git"}
-
-
 def _is_noise_file(file_path: str) -> bool:
     """Return True for minified, vendored, or build-artifact files that carry no architecture signal."""
-    p = Path(file_path)
-    # Check suffix combinations (e.g. foo.min.js has suffix .js but name ends with .min)
-    name = p.name.lower()
-    if any(name.endswith(suf) for suf in _NOISE_SUFFIXES):
-        return True
-    # Check if any path segment is a known vendor/build directory
-    parts = {part.lower() for part in p.parts}
-    return bool(parts & _NOISE_PATH_SEGMENTS)
+    # Same built-in rules the scanner prunes with; directory verdicts are memoized.
+    return NOISE_RULES.ignores_path(Path(file_path).as_posix())
 
 
 def _file_preview(path: Path) -> str:
     try:
-        lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-        preview = lines[:MAX_FILE_PREVIEW_LINES]
+        preview, line_count = read_preview(path, MAX_FILE_PREVIEW_LINES)
         tail = (
-            f"\n... ({len(lines) - MAX_FILE_PREVIEW_LINES} more lines)"
-            if len(lines) > MAX_FILE_PREVIEW_LINES
+            f"\n... ({line_count - MAX_FILE_PREVIEW_LINES} more lines)"
+            if line_count > MAX_FILE_PREVIEW_LINES
             else ""
         )
         return "\n".join(preview) + tail
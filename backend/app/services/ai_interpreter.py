@@ -56,6 +56,8 @@ def _build_interpretation_payload(analysis_state: Dict, graph_summary: Dict) ->
         "internal_edges": graph_summary.get("internal_edges", [])[:120],
         "clusters": graph_summary.get("clusters", [])[:20],
         "highest_dependency_files": graph_summary.get("highest_dependency_files", [])[:20],
+        "central_files": graph_summary.get("central_files", [])[:10],
+        "import_cycles": graph_summary.get("import_cycles", [])[:10],
         "inspected_facts": compact_facts,
     }
 
@@ -1,21 +1,37 @@
 import ast
-import posixpath
 import re
-from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import AbstractSet, Dict, List, Set, Tuple
 
 from app.services.repo_scanner import EXTENSION_LANGUAGE_MAP
 from app.services.repo_metadata import ENTRY_POINT_FILES, KNOWN_TOP_LEVEL_DIRS
+from app.services.repo_metadata import dominant_language as _dominant_language
 from app.services.repo_metadata import extract_repo_metadata
-from app.services.repo_scanner import scan_repository
+from app.services.dependency_graph import (
+    attach_dependency_graph,
+    attached_dependency_graph,
+    carry_dependency_graph,
+    dependency_graph,
+    detach_dependency_graph,
+)
+from app.services.file_index import get_file_index
+from app.services.file_io import read_source
+from app.services.import_cache import cached_imports
+from app.services.import_resolution import ResolutionIndex
+from app.services.scan_cache import get_scan_result
+
+# Bump whenever an _extract_*_imports function changes what it returns, so
+# persisted per-file import records are recomputed.
+IMPORT_EXTRACTOR_VERSION = 7
 
 
 def build_analysis_snapshot(repo_path: Path) -> Dict:
     """
     Build a deterministic understanding snapshot for a local repository.
     """
-    scan_result = scan_repository(repo_path)
+    scan_result = get_scan_result(repo_path)
+    # Forget index records for files that no longer exist in this clone.
+    get_file_index(repo_path).prune(scan_result["files"])
     metadata = extract_repo_metadata(repo_path, scan_result)
     package_roots = _detect_python_package_roots(repo_path, scan_result["files"])
 
@@ -26,6 +42,8 @@ def build_analysis_snapshot(repo_path: Path) -> Dict:
         "file_count": scan_result["file_count"],
         "languages": scan_result["languages"],
         "language_breakdown": metadata["language_breakdown"],
+        "language_breakdown_bytes": metadata["language_breakdown_bytes"],
+        "language_breakdown_lines": metadata["language_breakdown_lines"],
         "top_level_dirs": metadata["top_level_dirs"],
         "entry_points": metadata["entry_points"],
         "inspected_languages": [],
@@ -69,19 +87,7 @@ def advance_analysis_state(current_state: Dict) -> Dict:
     The function is local-first and stateless: it consumes current state and
     returns the next state without persistence.
     """
-    next_state = {
-        "repo_id": current_state["repo_id"],
-        "explored_files": list(current_state.get("explored_files", [])),
-        "candidate_files": [dict(c) for c in current_state.get("candidate_files", [])],
-        "inspected_facts": [dict(f) for f in current_state.get("inspected_facts", [])],
-        "dependency_edges": [dict(e) for e in current_state.get("dependency_edges", [])],
-        "unknowns": list(current_state.get("unknowns", [])),
-        "package_roots": list(current_state.get("package_roots", [])),
-        "current_summary": dict(current_state["current_summary"]),
-        "confidence": float(current_state.get("confidence", 0.0)),
-        "no_progress_steps": int(current_state.get("no_progress_steps", 0)),
-        "stop_reason": current_state.get("stop_reason"),
-    }
+    next_state = _copy_state(current_state)
 
     candidate_file = _select_next_candidate(next_state)
     if candidate_file is None:
@@ -99,7 +105,7 @@ def advance_analysis_state(current_state: Dict) -> Dict:
         ]
         return next_state
 
-    next_state["explored_files"].append(candidate_file)
+    _mark_explored(next_state, candidate_file)
     next_state["candidate_files"] = [
         c for c in next_state["candidate_files"] if c["file_path"] != candidate_file
     ]
@@ -145,6 +151,8 @@ def run_analysis_loop(initial_state: Dict, max_steps: int = 15) -> Dict:
     """
     steps_limit = max(1, min(max_steps, 25))
     current_state = _copy_state(initial_state)
+    # Each step folds its file into the graph instead of rebuilding it.
+    attach_dependency_graph(current_state)
     initial_explored_len = len(current_state.get("explored_files", []))
 
     step_trace: List[Dict] = []
@@ -176,6 +184,7 @@ def run_analysis_loop(initial_state: Dict, max_steps: int = 15) -> Dict:
 
     explored_files_in_order = current_state["explored_files"][initial_explored_len:]
     current_state["dependency_graph_summary"] = _compute_dependency_graph_summary(current_state)
+    detach_dependency_graph(current_state)
 
     return {
         "steps_executed": len(step_trace),
@@ -185,7 +194,7 @@ def run_analysis_loop(initial_state: Dict, max_steps: int = 15) -> Dict:
         "final_confidence": current_state["confidence"],
         "remaining_unknowns": current_state["unknowns"],
         "stop_reason": current_state.get("stop_reason"),
-        "dependency_graph_summary": _compute_dependency_graph_summary(current_state),
+        "dependency_graph_summary": current_state["dependency_graph_summary"],
         "final_state": current_state,
     }
 
@@ -194,7 +203,6 @@ def _build_next_candidates(scan_result: Dict, metadata: Dict, limit: int) -> Lis
     entry_points: List[str] = metadata["entry_points"]
     files: List[str] = scan_result["files"]
     file_languages: Dict[str, str] = scan_result["file_languages"]
-    language_breakdown: Dict[str, int] = metadata["language_breakdown"]
 
     if not files:
         return []
@@ -202,15 +210,13 @@ def _build_next_candidates(scan_result: Dict, metadata: Dict, limit: int) -> Lis
     candidates: List[Dict] = []
     seen: Set[str] = set()
 
-    dominant_language = sorted(
-        language_breakdown.items(),
-        key=lambda item: (-item[1], item[0]),
-    )[0][0]
+    # Weighted by code size, so a few large files outrank many tiny scripts.
+    dominant_language = _dominant_language(metadata)
 
     dominant_files = sorted(
         file_path
-        for file_path in files
-        if file_languages.get(file_path) == dominant_language
+        for file_path, language in file_languages.items()
+        if language == dominant_language
     )
 
     # Rule 1: likely entry points first.
@@ -390,8 +396,7 @@ def _ambiguity_reducing_candidates(
     dominant_language: str,
 ) -> List[Tuple[str, str]]:
     by_language: Dict[str, List[str]] = {}
-    for file_path in files:
-        language = file_languages.get(file_path, "unknown")
+    for file_path, language in file_languages.items():
         by_language.setdefault(language, []).append(file_path)
 
     for language_files in by_language.values():
@@ -439,7 +444,7 @@ def _select_next_candidate(state: Dict) -> str | None:
 
 
 def _copy_state(state: Dict) -> Dict:
-    return {
+    copied = {
         "repo_id": state["repo_id"],
         "explored_files": list(state.get("explored_files", [])),
         "candidate_files": [dict(c) for c in state.get("candidate_files", [])],
@@ -452,6 +457,15 @@ def _copy_state(state: Dict) -> Dict:
         "no_progress_steps": int(state.get("no_progress_steps", 0)),
         "stop_reason": state.get("stop_reason"),
     }
+    carry_dependency_graph(state, copied)
+    return copied
+
+
+def _mark_explored(state: Dict, file_path: str) -> None:
+    state["explored_files"].append(file_path)
+    graph = attached_dependency_graph(state)
+    if graph is not None:
+        graph.mark_explored(file_path)
 
 
 def _newly_explored_file(previous: List[str], current: List[str]) -> str | None:
@@ -472,14 +486,11 @@ def _inspect_file(state: Dict, file_path: str) -> Dict | None:
     suffix = target.suffix.lower()
     language = EXTENSION_LANGUAGE_MAP.get(suffix, "unknown")
     top_level_dir = Path(file_path).parts[0] if Path(file_path).parts else ""
-    content = target.read_text(encoding="utf-8", errors="ignore")
-    line_count = len(content.splitlines())
+    line_count, imported_modules = _indexed_line_count_and_imports(
+        repo_path, file_path, target, language
+    )
     role_hint = _infer_role_hint(file_path)
     line_count_bucket = _line_count_bucket(line_count)
-    imported_modules = _extract_imports_for_file(
-        content=content,
-        language=language,
-    )
 
     return {
         "file_path": file_path,
@@ -494,6 +505,38 @@ def _inspect_file(state: Dict, file_path: str) -> Dict | None:
     }
 
 
+def _indexed_line_count_and_imports(
+    repo_path: Path,
+    file_path: str,
+    target: Path,
+    language: str,
+) -> Tuple[int, List[str]]:
+    """
+    Line count and imports for target, served from the persistent file index
+    when the file's (size, mtime) fingerprint is unchanged.
+    """
+    stat = target.stat()
+    index = get_file_index(repo_path)
+    record = index.lookup(file_path, stat.st_size, stat.st_mtime_ns, IMPORT_EXTRACTOR_VERSION)
+    if record is not None:
+        return record["line_count"], record["imports"]
+
+    # One chunked pass; Go/Java files are only kept up to the end of their imports.
+    digest, line_count, content = read_source(target, header_language=language)
+    imported_modules = _cached_extract_imports(digest=digest, content=content, language=language)
+    index.store(
+        file_path,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        content_hash=digest,
+        language=language,
+        line_count=line_count,
+        imports=imported_modules,
+        extractor_version=IMPORT_EXTRACTOR_VERSION,
+    )
+    return line_count, imported_modules
+
+
 def _refine_summary(state: Dict, inspected: Dict) -> Dict[str, bool]:
     summary = state["current_summary"]
     file_path = inspected["file_path"]
@@ -590,16 +633,7 @@ def _record_inspected_fact(state: Dict, inspected: Dict) -> Dict[str, bool]:
         module for fact in facts for module in fact.get("imported_modules", [])
     }
 
-    new_fact = {
-        "file_path": inspected["file_path"],
-        "language": inspected["language"],
-        "line_count_bucket": inspected["line_count_bucket"],
-        "directory": inspected["directory"],
-        "role_hint": inspected["role_hint"],
-        "imports_found": len(inspected.get("imported_modules", [])),
-        "imported_modules": inspected.get("imported_modules", []),
-    }
-    facts.append(new_fact)
+    facts.append(_fact_from_inspected(inspected))
 
     imported_modules = inspected.get("imported_modules", [])
     materially_new_fact = (
@@ -612,11 +646,27 @@ def _record_inspected_fact(state: Dict, inspected: Dict) -> Dict[str, bool]:
     return {"materially_new_fact": materially_new_fact}
 
 
+def _fact_from_inspected(inspected: Dict) -> Dict:
+    return {
+        "file_path": inspected["file_path"],
+        "language": inspected["language"],
+        "line_count_bucket": inspected["line_count_bucket"],
+        "directory": inspected["directory"],
+        "role_hint": inspected["role_hint"],
+        "imports_found": len(inspected.get("imported_modules", [])),
+        "imported_modules": inspected.get("imported_modules", []),
+    }
+
+
 def _record_dependency_edge(state: Dict, inspected: Dict) -> None:
     source = inspected["file_path"]
     imports = inspected.get("imported_modules", [])
     dedup_imports = sorted(set(imports))
 
+    graph = attached_dependency_graph(state)
+    if graph is not None:
+        graph.set_imports(source, dedup_imports)
+
     edges = state["dependency_edges"]
     for edge in edges:
         if edge["source"] == source:
@@ -633,18 +683,20 @@ def _record_dependency_edge(state: Dict, inspected: Dict) -> None:
 
 def _refresh_candidates_for_signal(state: Dict, limit: int) -> None:
     repo_path = Path(state["current_summary"]["local_path"]).resolve()
-    scan_result = scan_repository(repo_path)
+    scan_result = get_scan_result(repo_path)
     files: List[str] = scan_result["files"]
     file_languages: Dict[str, str] = scan_result["file_languages"]
     explored = set(state["explored_files"])
 
     known_targets = _resolved_import_targets(state)
     scored: List[Tuple[Tuple[int, str], Dict]] = []
-    for file_path in files:
+    # file_languages is a column of the scan table: walk it positionally
+    # rather than looking each path up again.
+    for file_path, language in file_languages.items():
         if file_path in explored:
             continue
 
-        score, reasons = _candidate_signal_score(state, file_path, file_languages, known_targets)
+        score, reasons = _candidate_signal_score(state, file_path, language, known_targets)
         if score <= 0:
             continue
         scored.append(
@@ -674,28 +726,21 @@ def _refresh_candidates_for_signal(state: Dict, limit: int) -> None:
     state["candidate_files"] = candidates
 
 
-def _resolved_import_targets(state: Dict) -> Set[str]:
-    """Return the set of internal file paths that explored files import."""
-    targets: Set[str] = set()
-    for edge in state.get("dependency_edges", []):
-        source = edge["source"]
-        source_dir = posixpath.dirname(source)
-        for imp in edge.get("imports", []):
-            if imp.startswith(("./", "../")):
-                resolved = posixpath.normpath(posixpath.join(source_dir, imp))
-                targets.add(resolved)
-    return targets
+def _resolved_import_targets(state: Dict) -> AbstractSet[str]:
+    """Return the set of internal files that explored files import."""
+    # dependency_edges may cover the whole repo (see import_indexer); only
+    # what the analysis has actually read steers exploration.
+    return dependency_graph(state).import_targets()
 
 
 def _candidate_signal_score(
     state: Dict,
     file_path: str,
-    file_languages: Dict[str, str],
-    known_targets: Set[str] | None = None,
+    language: str,
+    known_targets: AbstractSet[str] | None = None,
 ) -> Tuple[int, List[str]]:
     name = Path(file_path).name
     top_level_dir = Path(file_path).parts[0] if Path(file_path).parts else ""
-    language = file_languages.get(file_path, "unknown")
     role_hint = _infer_role_hint(file_path)
 
     inspected_facts = state.get("inspected_facts", [])
@@ -772,6 +817,18 @@ def _summary_progress_signature(summary: Dict) -> Tuple[Tuple[str, ...], ...]:
     )
 
 
+def _cached_extract_imports(*, digest: str, content: str, language: str) -> List[str]:
+    """_extract_imports_for_file through the content-hash import cache."""
+    return list(
+        cached_imports(
+            digest,
+            language,
+            IMPORT_EXTRACTOR_VERSION,
+            lambda: _extract_imports_for_file(content=content, language=language),
+        )
+    )
+
+
 def _extract_imports_for_file(*, content: str, language: str) -> List[str]:
     if language == "python":
         return _extract_python_imports(content)
@@ -788,102 +845,224 @@ def _extract_imports_for_file(*, content: str, language: str) -> List[str]:
     return []
 
 
+# One pass over the source: string literals and comments are matched (and
+# skipped) so import-looking text inside them is ignored. String prefixes
+# (r, b, f, ...) are left out: they never change where a literal ends, and a
+# leading letter class would be tried at every position. An `import`/`from`
+# keyword at the start of a line or after `;` / a compound-statement `:` begins
+# an import statement.
+_PY_IMPORT_SCAN_RE = re.compile(
+    r"""
+    (?P<skip>
+        '''[^'\\]*(?:(?:\\[\s\S]|'(?!''))[^'\\]*)*'''
+      | \"\"\"[^"\\]*(?:(?:\\[\s\S]|"(?!""))[^"\\]*)*\"\"\"
+      | '[^'\\\n]*(?:\\.[^'\\\n]*)*'
+      | "[^"\\\n]*(?:\\.[^"\\\n]*)*"
+      | \#[^\n]*
+    )
+    | (?:^|(?<=[;:]))[ \t]*(?P<kw>import|from)\b
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+# Whitespace inside a statement, including backslash continuations.
+_PY_GAP = r"(?:[ \t]|\\\r?\n)"
+_PY_FROM_RE = re.compile(
+    rf"{_PY_GAP}*((?:\.{_PY_GAP}*)*)"
+    rf"([^\W\d]\w*(?:{_PY_GAP}*\.{_PY_GAP}*[^\W\d]\w*)*)?{_PY_GAP}*\bimport\b"
+)
+_PY_IMPORT_NAMES_RE = re.compile(r"(?:[^\n;#\\]|\\\r?\n)*")
+_PY_DOTTED_NAME_RE = re.compile(r"[^\W\d]\w*(?:\.[^\W\d]\w*)*")
+_PY_ALIAS_RE = re.compile(r"\s+as\s+")
+
+
 def _extract_python_imports(content: str) -> List[str]:
-    imports: List[str] = []
-    seen: Set[str] = set()
+    """
+    Imported modules in source order, without building a syntax tree.
+
+    Handles `from x import (a, b)`, backslash continuations, `;`-separated and
+    `if TYPE_CHECKING:`/`try:` nested imports, and tolerates files that do not
+    parse. Matches _extract_python_imports_ast on valid source.
+    """
+    if "import" not in content:
+        return []
 
-    try:
-        tree = ast.parse(content)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    name = alias.name.strip()
-                    if name and name not in seen:
-                        imports.append(name)
-                        seen.add(name)
-            elif isinstance(node, ast.ImportFrom):
-                level = node.level or 0
-                module = (node.module or "").strip()
-                if level > 0:
-                    imported = "." * level + module if module else "." * level
-                else:
-                    imported = module
-                if imported and imported not in seen:
-                    imports.append(imported)
-                    seen.add(imported)
-        return imports
-    except SyntaxError:
-        return _extract_python_imports_regex_fallback(content)
-
-
-def _extract_python_imports_regex_fallback(content: str) -> List[str]:
     imports: List[str] = []
     seen: Set[str] = set()
+    position = 0
+    while True:
+        match = _PY_IMPORT_SCAN_RE.search(content, position)
+        if match is None:
+            break
+        position = match.end()
+        keyword = match.group("kw")
+        if keyword is None:
+            continue
+        if keyword == "from":
+            statement = _PY_FROM_RE.match(content, position)
+            if statement is None:
+                continue
+            # Resume after the whole statement head, so a continuation line
+            # starting with `import` is not read as a statement of its own.
+            position = statement.end()
+            dots = statement.group(1).count(".")
+            module = re.sub(r"[\s\\]", "", statement.group(2) or "")
+            names = ["." * dots + module]
+        else:
+            clause = _PY_IMPORT_NAMES_RE.match(content, position)
+            position = clause.end()
+            names = []
+            for part in re.sub(r"\\\r?\n", " ", clause.group(0)).split(","):
+                name = _PY_ALIAS_RE.split(part.strip(), maxsplit=1)[0]
+                name = re.sub(r"\s", "", name)
+                if _PY_DOTTED_NAME_RE.fullmatch(name):
+                    names.append(name)
+
+        for name in names:
+            if name and name not in seen:
+                imports.append(name)
+                seen.add(name)
+    return imports
 
-    for match in re.finditer(r"^\s*import\s+([A-Za-z0-9_.,\s]+)", content, re.MULTILINE):
-        modules = [m.strip() for m in match.group(1).split(",")]
-        for module in modules:
-            if module and module not in seen:
-                imports.append(module)
-                seen.add(module)
 
-    for match in re.finditer(r"^\s*from\s+([.\w]+)\s+import\s+", content, re.MULTILINE):
-        module = match.group(1).strip()
-        if module and module not in seen:
-            imports.append(module)
-            seen.add(module)
+def _extract_python_imports_ast(content: str) -> List[str]:
+    """
+    Reference implementation on a full ast.parse, in source order. Kept for
+    conformance tests and benchmarks; raises SyntaxError on invalid source.
+    """
+    found: List[Tuple[int, int, int, str]] = []
+    for node in ast.walk(ast.parse(content)):
+        if isinstance(node, ast.Import):
+            for i, alias in enumerate(node.names):
+                found.append((node.lineno, node.col_offset, i, alias.name.strip()))
+        elif isinstance(node, ast.ImportFrom):
+            level = node.level or 0
+            module = (node.module or "").strip()
+            found.append((node.lineno, node.col_offset, 0, "." * level + module))
 
+    imports: List[str] = []
+    seen: Set[str] = set()
+    for _, _, _, name in sorted(found):
+        if name and name not in seen:
+            imports.append(name)
+            seen.add(name)
     return imports
 
 
+# A quoted module specifier; each use adds two groups (single / double quotes).
+_JS_SPECIFIER = r"""(?:'([^'\\\n]+)'|"([^"\\\n]+)")"""
+# Identifiers, braces, commas, `*`, `as`/`type` and whitespace: everything an
+# import/export clause may hold before `from`, across lines.
+_JS_CLAUSE = r"[\w$\s{},*]*?"
+# One pass over the source. Comments, string and template literals are matched
+# and skipped, so module-like text inside them is ignored; every other
+# alternative ends with the specifier, so match.lastindex names its group.
+# Each alternative starts with a literal (the keyword's lookbehind comes after
+# it), which lets the regex engine jump between candidate characters.
+_JS_IMPORT_SCAN_RE = re.compile(
+    rf"""
+      //[^\n]*
+    | /\*[^*]*\*+(?:[^/*][^*]*\*+)*/
+    | '[^'\\\n]*(?:\\.[^'\\\n]*)*'
+    | "[^"\\\n]*(?:\\.[^"\\\n]*)*"
+    | `[^`\\]*(?:\\[\s\S][^`\\]*)*`
+    | import(?<![\w$.]import)(?:
+          \s*\(\s*{_JS_SPECIFIER}
+        | \s*{_JS_SPECIFIER}
+        | (?=[\s{{*]){_JS_CLAUSE}\bfrom\s*{_JS_SPECIFIER}
+      )
+    | export(?<![\w$.]export)(?=[\s{{*]){_JS_CLAUSE}\bfrom\s*{_JS_SPECIFIER}
+    | require(?<![\w$.]require)\s*\(\s*{_JS_SPECIFIER}\s*\)
+    """,
+    re.VERBOSE,
+)
+
+
 def _extract_javascript_imports(content: str) -> List[str]:
+    """
+    Module specifiers in source order: `import ... from`, side-effect
+    `import 'x'`, `import type`, `export ... from`, dynamic `import('x')` and
+    `require('x')`, ignoring any that appear in comments or strings.
+    """
+    if "import" not in content and "require" not in content and "export" not in content:
+        return []
+
     imports: List[str] = []
     seen: Set[str] = set()
+    for match in _JS_IMPORT_SCAN_RE.finditer(content):
+        if match.lastindex is None:
+            continue
+        module = match.group(match.lastindex).strip()
+        if module and module not in seen:
+            imports.append(module)
+            seen.add(module)
+    return imports
 
-    patterns = [
-        r'import\s+[^;\n]*?\sfrom\s+["\']([^"\']+)["\']',
-        r'import\s+["\']([^"\']+)["\']',
-        r'require\(\s*["\']([^"\']+)["\']\s*\)',
-    ]
 
-    for pattern in patterns:
-        for match in re.finditer(pattern, content):
-            module = match.group(1).strip()
-            if module and module not in seen:
-                imports.append(module)
-                seen.add(module)
-
-    return imports
+# Optional visibility: pub, pub(crate), pub(super), pub(in path)
+_RUST_VIS = r"(?:pub(?:\s*\([^)]*\))?\s+)?"
 
 
 def _extract_rust_imports(content: str) -> List[str]:
     imports: List[str] = []
     seen: Set[str] = set()
 
-    # use crate::module, use super::module, use self::module, use external_crate::...
-    for match in re.finditer(r"^\s*use\s+([\w:]+)", content, re.MULTILINE):
-        module = match.group(1).strip().rstrip(":")
+    def add(module: str) -> None:
         if module and module not in seen:
             imports.append(module)
             seen.add(module)
 
+    # use crate::module, use super::module, use self::module, use external_crate::...
+    # Brace groups are expanded: `use crate::{a::B, c}` -> crate::a::B, crate::c
+    for match in re.finditer(rf"^\s*{_RUST_VIS}use\s+([^;]+);", content, re.MULTILINE):
+        tree = re.sub(r"//[^\n]*|/\*.*?\*/", "", match.group(1), flags=re.DOTALL)
+        tree = re.sub(r"\s*([{},]|::)\s*", r"\1", " ".join(tree.split()))
+        for module in _expand_rust_use_tree(tree):
+            add(module)
+
     # mod submodule; (declares a local module file)
-    for match in re.finditer(r"^\s*mod\s+(\w+)\s*;", content, re.MULTILINE):
-        module = match.group(1).strip()
-        if module and module not in seen:
-            imports.append(module)
-            seen.add(module)
+    for match in re.finditer(rf"^\s*{_RUST_VIS}mod\s+(\w+)\s*;", content, re.MULTILINE):
+        add(match.group(1).strip())
 
     # extern crate name;
-    for match in re.finditer(r"^\s*extern\s+crate\s+(\w+)\s*;", content, re.MULTILINE):
-        module = match.group(1).strip()
-        if module and module not in seen:
-            imports.append(module)
-            seen.add(module)
+    for match in re.finditer(r"^\s*extern\s+crate\s+(\w+)", content, re.MULTILINE):
+        add(match.group(1).strip())
 
     return imports
 
 
+def _expand_rust_use_tree(tree: str, prefix: str = "") -> List[str]:
+    """Flatten a normalised use tree into paths (aliases and globs dropped)."""
+    paths: List[str] = []
+    depth = start = 0
+    parts: List[str] = []
+    for i, ch in enumerate(tree):
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(tree[start:i])
+            start = i + 1
+    parts.append(tree[start:])
+
+    for part in parts:
+        if not part:
+            continue  # trailing comma
+        brace = part.find("{")
+        if brace >= 0 and part.endswith("}"):
+            head = part[:brace].strip(":")
+            nested_prefix = f"{prefix}::{head}" if prefix and head else prefix or head
+            paths.extend(_expand_rust_use_tree(part[brace + 1:-1], nested_prefix))
+            continue
+        path = part.split(" as ", 1)[0].rstrip("*").strip(":")
+        if path == "self":
+            path = ""
+        full = f"{prefix}::{path}" if prefix and path else prefix or path
+        if full and re.fullmatch(r"\w+(?:::\w+)*", full):
+            paths.append(full)
+    return paths
+
+
 def _extract_cpp_imports(content: str) -> List[str]:
     imports: List[str] = []
     seen: Set[str] = set()
@@ -900,7 +1079,8 @@ def _extract_cpp_imports(content: str) -> List[str]:
 def _extract_java_imports(content: str) -> List[str]:
     imports: List[str] = []
     seen: Set[str] = set()
-    for match in re.finditer(r"^\s*import\s+(?:static\s+)?([\w.]+)\s*;", content, re.MULTILINE):
+    # `import a.b.C;`, `import a.b.*;`, `import static a.b.C.member;`, `import static a.b.C.*;`
+    for match in re.finditer(r"^\s*import\s+(?:static\s+)?([\w.]+(?:\.\*)?)\s*;", content, re.MULTILINE):
         module = match.group(1).strip()
         if module and module not in seen:
             imports.append(module)
@@ -908,113 +1088,52 @@ def _extract_java_imports(content: str) -> List[str]:
     return imports
 
 
+_GO_STRING = r'"(?:[^"\\\n]|\\.)*"|`[^`]*`'
+_GO_COMMENT = r"//[^\n]*|/\*[\s\S]*?\*/"
+# Comments are matched (and skipped) so a cgo preamble or commented-out import
+# is ignored; scanning stops at the first top-level declaration, after which
+# the language allows no more imports.
+_GO_HEADER_RE = re.compile(
+    rf"""
+      {_GO_COMMENT}
+    | ^(?P<decl>func|type|var|const)\b
+    | \bimport\s*(?:
+          \((?P<block>(?:{_GO_COMMENT}|{_GO_STRING}|[^)"`/]|/)*)\)
+        | (?P<single>(?:[\w.]+\s+)?(?:{_GO_STRING}))
+      )
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+# One import spec: optional name (alias, `.` or `_`) and the quoted path.
+_GO_IMPORT_SPEC_RE = re.compile(rf"{_GO_COMMENT}|(?:[\w.]+\s+)?({_GO_STRING})")
+
+
 def _extract_go_imports(content: str) -> List[str]:
+    """
+    Import paths from every `import "x"` / `import ( ... )` declaration before
+    the first top-level declaration, in source order.
+    """
     imports: List[str] = []
     seen: Set[str] = set()
-
-    # Single import: import "path/to/pkg"
-    for match in re.finditer(r'^\s*import\s+"([^"]+)"', content, re.MULTILINE):
-        module = match.group(1).strip()
-        if module and module not in seen:
-            imports.append(module)
-            seen.add(module)
-
-    # Grouped import block: import ( "pkg1" alias "pkg2" )
-    block_match = re.search(r"import\s*\(([^)]+)\)", content, re.DOTALL)
-    if block_match:
-        for line in block_match.group(1).splitlines():
-            m = re.search(r'"([^"]+)"', line)
-            if m:
-                module = m.group(1).strip()
-                if module and module not in seen:
-                    imports.append(module)
-                    seen.add(module)
-
+    for match in _GO_HEADER_RE.finditer(content):
+        if match.group("decl"):
+            break
+        specs = match.group("block") or match.group("single")
+        if specs is None:
+            continue
+        for spec in _GO_IMPORT_SPEC_RE.finditer(specs):
+            quoted = spec.group(1)
+            if not quoted:
+                continue
+            module = quoted[1:-1].strip()
+            if module and module not in seen:
+                imports.append(module)
+                seen.add(module)
     return imports
 
 
 def _compute_dependency_graph_summary(state: Dict) -> Dict:
-    edges = state.get("dependency_edges", [])
-    repo_path = Path(state["current_summary"]["local_path"]).resolve()
-    scanned_files = set(scan_repository(repo_path)["files"])
-    package_roots = [Path(root) for root in state.get("package_roots", [])]
-
-    imported_counter: Counter[str] = Counter()
-    file_import_counts: List[Dict] = []
-    cluster_map: Dict[str, Set[str]] = defaultdict(set)
-    internal_edge_set: Set[Tuple[str, str]] = set()
-
-    for edge in edges:
-        source = edge["source"]
-        imports = sorted(set(edge.get("imports", [])))
-
-        for module in imports:
-            imported_counter[module] += 1
-            cluster_key = _cluster_key(module)
-            if cluster_key:
-                cluster_map[cluster_key].add(source)
-
-            resolved_internal = _resolve_internal_import(
-                repo_path=repo_path,
-                source_file=source,
-                import_specifier=module,
-                package_roots=package_roots,
-                scanned_files=scanned_files,
-            )
-            if resolved_internal is not None:
-                internal_edge_set.add((source, resolved_internal))
-
-        file_import_counts.append(
-            {
-                "source": source,
-                "imports_count": len(imports),
-            }
-        )
-
-    most_imported_modules = [
-        {"module": module, "count": count}
-        for module, count in sorted(imported_counter.items(), key=lambda item: (-item[1], item[0]))[:10]
-    ]
-
-    highest_dependency_files = sorted(
-        file_import_counts,
-        key=lambda item: (-item["imports_count"], item["source"]),
-    )[:10]
-
-    clusters = []
-    for cluster_key, files in sorted(cluster_map.items(), key=lambda item: (-len(item[1]), item[0])):
-        if len(files) < 2:
-            continue
-        clusters.append(
-            {
-                "cluster": cluster_key,
-                "files": sorted(files),
-            }
-        )
-
-    internal_edges = [
-        {"from": source, "to": target}
-        for source, target in sorted(internal_edge_set)
-    ][:500]  # cap to avoid large payloads on complex repos
-
-    return {
-        "most_imported_modules": most_imported_modules,
-        "highest_dependency_files": highest_dependency_files,
-        "clusters": clusters,
-        "internal_edges": internal_edges,
-    }
-
-
-def _cluster_key(module: str) -> str:
-    if not module:
-        return ""
-    if module.startswith("."):
-        return "relative"
-    if "/" in module:
-        return module.split("/", 1)[0]
-    if "." in module:
-        return module.split(".", 1)[0]
-    return module
+    return dependency_graph(state).summary()
 
 
 def _resolve_internal_import(
@@ -1025,53 +1144,12 @@ def _resolve_internal_import(
     package_roots: List[Path],
     scanned_files: Set[str],
 ) -> str | None:
-    source_abs = (repo_path / source_file).resolve()
-    source_dir = source_abs.parent
-
-    if _is_js_relative_import(import_specifier):
-        resolved = _resolve_js_relative_import(repo_path, source_dir, import_specifier)
-        return str(resolved.relative_to(repo_path)) if resolved else None
-
-    if _is_python_relative_import(import_specifier):
-        resolved = _resolve_python_relative_import(repo_path, source_dir, import_specifier)
-        return str(resolved.relative_to(repo_path)) if resolved else None
-
-    if _should_attempt_absolute_python_resolution(import_specifier, package_roots, scanned_files):
-        resolved = _resolve_absolute_import(import_specifier, package_roots, scanned_files)
-        if resolved is not None:
-            return resolved
-
-    return None
-
-
-def _is_js_relative_import(import_specifier: str) -> bool:
-    return import_specifier.startswith("./") or import_specifier.startswith("../")
-
-
-def _is_python_relative_import(import_specifier: str) -> bool:
-    return import_specifier.startswith(".")
-
-
-def _resolve_js_relative_import(repo_path: Path, source_dir: Path, import_specifier: str) -> Path | None:
-    candidate_base = (source_dir / import_specifier).resolve()
-    return _resolve_candidate_path(repo_path, candidate_base, [".js", ".jsx", ".ts", ".tsx"])
-
-
-def _resolve_python_relative_import(repo_path: Path, source_dir: Path, import_specifier: str) -> Path | None:
-    level = 0
-    for ch in import_specifier:
-        if ch == ".":
-            level += 1
-        else:
-            break
-
-    module = import_specifier[level:]
-    target_dir = source_dir
-    for _ in range(max(0, level - 1)):
-        target_dir = target_dir.parent
-
-    candidate_base = target_dir / module.replace(".", "/") if module else target_dir
-    return _resolve_candidate_path(repo_path, candidate_base, [".py"])
+    """
+    Repo-relative file that import_specifier (imported by source_file)
+    refers to, or None for external or unresolvable imports. Builds a
+    throwaway ResolutionIndex; build one yourself to resolve many imports.
+    """
+    return ResolutionIndex(repo_path, scanned_files, package_roots).resolve(source_file, import_specifier)
 
 
 def _detect_python_package_roots(repo_path: Path, scanned_files: List[str]) -> List[str]:
@@ -1108,91 +1186,6 @@ def _detect_python_package_roots(repo_path: Path, scanned_files: List[str]) -> L
     return unique_roots
 
 
-def _should_attempt_absolute_python_resolution(
-    import_specifier: str,
-    package_roots: List[Path],
-    scanned_files: Set[str],
-) -> bool:
-    if not import_specifier or not package_roots:
-        return False
-
-    first_segment = import_specifier.split(".", 1)[0]
-    if not first_segment:
-        return False
-
-    known_top_level_names = _known_top_level_package_names(package_roots, scanned_files)
-    return first_segment in known_top_level_names
-
-
-def _resolve_absolute_import(
-    module_string: str,
-    package_roots: List[Path],
-    scanned_files: Set[str],
-) -> str | None:
-    module_path = module_string.replace(".", "/")
-
-    for package_root in package_roots:
-        root_prefix = package_root.as_posix().strip(".")
-        if root_prefix:
-            file_candidate = f"{root_prefix}/{module_path}.py"
-            init_candidate = f"{root_prefix}/{module_path}/__init__.py"
-        else:
-            file_candidate = f"{module_path}.py"
-            init_candidate = f"{module_path}/__init__.py"
-
-        if file_candidate in scanned_files:
-            return file_candidate
-        if init_candidate in scanned_files:
-            return init_candidate
-
-    return None
-
-
-def _known_top_level_package_names(package_roots: List[Path], scanned_files: Set[str]) -> Set[str]:
-    names: Set[str] = set()
-    for package_root in package_roots:
-        root_prefix = package_root.as_posix().strip(".")
-        for file_path in scanned_files:
-            parts = Path(file_path).parts
-            if not parts:
-                continue
-            if root_prefix:
-                root_parts = tuple(Path(root_prefix).parts)
-                if parts[: len(root_parts)] != root_parts:
-                    continue
-                if len(parts) > len(root_parts):
-                    names.add(parts[len(root_parts)])
-            else:
-                names.add(parts[0])
-    return names
-
-
-def _resolve_candidate_path(repo_path: Path, candidate_base: Path, extensions: List[str]) -> Path | None:
-    candidates: List[Path] = []
-
-    candidates.append(candidate_base)
-    for ext in extensions:
-        candidates.append(candidate_base.with_suffix(ext))
-    for ext in extensions:
-        candidates.append(candidate_base / f"index{ext}")
-    candidates.append(candidate_base / "__init__.py")
-
-    seen: Set[str] = set()
-    for candidate in candidates:
-        key = str(candidate)
-        if key in seen:
-            continue
-        seen.add(key)
-
-        if not candidate.exists() or not candidate.is_file():
-            continue
-        if not candidate.resolve().is_relative_to(repo_path):
-            continue
-        return candidate.resolve()
-
-    return None
-
-
 def _line_count_bucket(line_count: int) -> str:
     if line_count < 80:
         return "small"
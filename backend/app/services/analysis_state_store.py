@@ -28,14 +28,8 @@ def load_state(repo_id: str, local_path: str, cache_dir: Path) -> Optional[Dict]
     Load cached final_state if it exists and matches the current git HEAD.
     Returns None if not found or stale.
     """
-    cache_file = _cache_path(cache_dir, repo_id)
-    if not cache_file.exists():
-        return None
-
-    try:
-        payload = json.loads(cache_file.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as exc:
-        LOGGER.warning("Failed to read cache for %s: %s", repo_id, exc)
+    payload = load_state_payload(repo_id, cache_dir)
+    if payload is None:
         return None
 
     current_hash = _get_git_commit_hash(local_path)
@@ -51,6 +45,22 @@ def load_state(repo_id: str, local_path: str, cache_dir: Path) -> Optional[Dict]
     return payload.get("final_state")
 
 
+def load_state_payload(repo_id: str, cache_dir: Path) -> Optional[Dict]:
+    """
+    Load the raw cache payload ({repo_id, commit_hash, saved_at, final_state})
+    without checking it against the current git HEAD.
+    """
+    cache_file = _cache_path(cache_dir, repo_id)
+    if not cache_file.exists():
+        return None
+
+    try:
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as exc:
+        LOGGER.warning("Failed to read cache for %s: %s", repo_id, exc)
+        return None
+
+
 def _cache_path(cache_dir: Path, repo_id: str) -> Path:
     safe_name = repo_id.replace("/", "__").replace("\\", "__")
     return cache_dir / f"{safe_name}.json"
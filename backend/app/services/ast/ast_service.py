@@ -1,14 +1,26 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional
 
-from app.core.language_registry import LANGUAGE_REGISTRY
-from app.services.ast.ast_types import ASTResult
+from app.core.config import settings
+from app.core.language_registry import LANGUAGE_REGISTRY, ParserBackend
+from app.services.ast import tree_sitter_backend
+from app.services.ast.ast_types import ASTFile, ASTResult
+from app.services.scan_cache import get_scan_result
+
+LOGGER = logging.getLogger(__name__)
 
 
 def extract_ast(
     *,
     repo_path: Path,
     language: str,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
 ) -> Optional[ASTResult]:
     """
     Extract ASTs for all files of a given language in a repository.
@@ -18,7 +30,10 @@ def extract_ast(
     - MUST return None if AST extraction is unsupported
     - MUST be deterministic
 
-    Parsing logic is intentionally NOT implemented here yet.
+    Files are parsed on a process pool (workers defaults to
+    settings.AST_WORKERS, 0 = one per CPU, 1 = in-process) in batches of
+    chunk_size (settings.AST_CHUNK_SIZE); results are sorted by file path.
+    None is also returned when the registry's parser backend is not installed.
     """
 
     capabilities = LANGUAGE_REGISTRY.get(
@@ -28,7 +43,59 @@ def extract_ast(
     if not capabilities["has_ast"]:
         return None
 
-    # Parsing logic will be implemented in a later phase
-    raise NotImplementedError(
-        f"AST extraction not yet implemented for language: {language}"
-    )
+    if capabilities["parser_backend"] != ParserBackend.TREE_SITTER:
+        return None
+    if not tree_sitter_backend.available(language):
+        LOGGER.warning("AST extraction for %s needs tree-sitter and its grammar installed", language)
+        return None
+
+    repo_path = repo_path.resolve()
+    scan_result = get_scan_result(repo_path)
+    targets = [path for path, lang in scan_result["file_languages"].items() if lang == language]
+
+    workers = workers if workers is not None else settings.AST_WORKERS
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    chunk_size = max(1, chunk_size or settings.AST_CHUNK_SIZE)
+    chunks = [targets[i:i + chunk_size] for i in range(0, len(targets), chunk_size)]
+
+    files: List[ASTFile] = []
+    for parsed in _parse_chunks(str(repo_path), language, chunks, workers):
+        files.extend(parsed)
+    files.sort(key=lambda ast_file: ast_file["file_path"])
+
+    return {
+        "repo": scan_result["repo"],
+        "language": language,
+        "files": files,
+    }
+
+
+def _parse_chunks(
+    root: str,
+    language: str,
+    chunks: List[List[str]],
+    workers: int,
+) -> Iterator[List[ASTFile]]:
+    parse = partial(_parse_chunk, root, language)
+    if workers <= 1 or len(chunks) <= 1:
+        yield from map(parse, chunks)
+        return
+    # Not fork: callers may run on a thread while another thread holds a lock.
+    context = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=context) as pool:
+        yield from pool.map(parse, chunks)
+
+
+def _parse_chunk(root: str, language: str, chunk: List[str]) -> List[ASTFile]:
+    """Worker entry point: parse one batch with this process's cached parsers."""
+    parsed: List[ASTFile] = []
+    for file_path in chunk:
+        try:
+            with open(os.path.join(root, file_path), "rb") as handle:
+                source = handle.read()
+        except OSError:
+            continue
+        ast_file = tree_sitter_backend.parse_file(file_path, language, source)
+        if ast_file is not None:
+            parsed.append(ast_file)
+    return parsed
@@ -0,0 +1,159 @@
+"""
+Tree-sitter parsing backend for extract_ast.
+
+Only the structure the summaries need is kept: classes and functions (with
+methods, nested functions and named arrow functions), nested the way they
+are in the source, under one "module" root per file. Structural nodes are
+found with a tree-sitter query, so the syntax tree is walked in C rather than
+node by node in Python.
+
+tree_sitter and the per-language grammar packages are optional; when they
+are missing available() is False and extract_ast returns None. Parsers and
+compiled queries are built once per process and reused for every file that
+process parses.
+"""
+import importlib
+import logging
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import tree_sitter
+except ImportError:  # optional dependency
+    tree_sitter = None
+
+from app.services.ast.ast_types import ASTFile, ASTNode
+
+LOGGER = logging.getLogger(__name__)
+
+# grammar name -> (grammar module, language function)
+_GRAMMAR_MODULES: Dict[str, Tuple[str, str]] = {
+    "python": ("tree_sitter_python", "language"),
+    "javascript": ("tree_sitter_javascript", "language"),
+    "typescript": ("tree_sitter_typescript", "language_typescript"),
+    "tsx": ("tree_sitter_typescript", "language_tsx"),
+    "java": ("tree_sitter_java", "language"),
+}
+
+_JS_FUNCTIONS = """
+[(function_declaration) (generator_function_declaration) (method_definition)
+ (function_expression) (generator_function)] @function
+(variable_declarator value: (arrow_function) @function)
+(assignment_expression right: (arrow_function) @function)
+(pair value: (arrow_function) @function)
+"""
+
+# Capture names are the ASTNode node_type the match becomes.
+_QUERIES: Dict[str, str] = {
+    "python": "(class_definition) @class (function_definition) @function",
+    "javascript": _JS_FUNCTIONS + """
+[(class_declaration) (class)] @class
+(field_definition value: (arrow_function) @function)
+""",
+    "typescript": _JS_FUNCTIONS + """
+[(class_declaration) (abstract_class_declaration) (class)] @class
+(public_field_definition value: (arrow_function) @function)
+""",
+    "java": """
+[(class_declaration) (interface_declaration) (enum_declaration) (record_declaration)] @class
+[(method_declaration) (constructor_declaration)] @function
+""",
+}
+_QUERIES["tsx"] = _QUERIES["typescript"]
+
+# Where an anonymous function's name lives on its parent node.
+_PARENT_NAME_FIELDS = {
+    "variable_declarator": "name",
+    "assignment_expression": "left",
+    "pair": "key",
+    "field_definition": "property",
+    "public_field_definition": "name",
+}
+
+# Per-process state: grammar -> (parser, query cursor) or None if unavailable.
+_PARSERS: Dict[str, Optional[Tuple["tree_sitter.Parser", "tree_sitter.QueryCursor"]]] = {}
+
+
+def grammar_for(language: str, file_path: str) -> str:
+    """Grammar to parse file_path with (TSX needs its own TypeScript grammar)."""
+    if language == "typescript" and file_path.endswith(".tsx"):
+        return "tsx"
+    return language
+
+
+def available(language: str) -> bool:
+    """True when tree_sitter and the grammar for language are installed."""
+    return _parser(language) is not None
+
+
+def parse_file(file_path: str, language: str, source: bytes) -> Optional[ASTFile]:
+    """Parse one file into an ASTFile, or None if its grammar is unavailable."""
+    loaded = _parser(grammar_for(language, file_path))
+    if loaded is None:
+        return None
+    parser, cursor = loaded
+    tree = parser.parse(source)
+    root = tree.root_node
+
+    structural: Dict[Tuple[int, int], Tuple[str, "tree_sitter.Node"]] = {}
+    for node_type, nodes in cursor.captures(root).items():
+        for node in nodes:
+            structural[(node.start_byte, -node.end_byte)] = (node_type, node)
+
+    module: ASTNode = {
+        "node_type": "module",
+        "name": None,
+        "start_line": 1,
+        "end_line": root.end_point[0] + 1,
+        "children": [],
+    }
+    # Captures sorted by (start, -end) put every node right after its
+    # enclosing node, so a stack of open nodes rebuilds the nesting.
+    stack: List[Tuple[int, ASTNode]] = [(root.end_byte, module)]
+    for (start_byte, _), (node_type, node) in sorted(structural.items()):
+        while start_byte >= stack[-1][0] and len(stack) > 1:
+            stack.pop()
+        ast_node: ASTNode = {
+            "node_type": _node_type(node_type, node),
+            "name": _node_name(node),
+            "start_line": node.start_point[0] + 1,
+            "end_line": node.end_point[0] + 1,
+            "children": [],
+        }
+        stack[-1][1]["children"].append(ast_node)
+        stack.append((node.end_byte, ast_node))
+
+    return {"file_path": file_path, "language": language, "root": module}
+
+
+def _parser(grammar: str):
+    if grammar in _PARSERS:
+        return _PARSERS[grammar]
+    loaded = None
+    spec = _GRAMMAR_MODULES.get(grammar)
+    if tree_sitter is not None and spec is not None:
+        try:
+            module = importlib.import_module(spec[0])
+            language = tree_sitter.Language(getattr(module, spec[1])())
+            query = tree_sitter.Query(language, _QUERIES[grammar])
+            loaded = (tree_sitter.Parser(language), tree_sitter.QueryCursor(query))
+        except ImportError:
+            LOGGER.info("tree-sitter grammar %s is not installed", spec[0])
+    _PARSERS[grammar] = loaded
+    return loaded
+
+
+def _node_type(captured: str, node) -> str:
+    if captured == "function" and any(child.type == "async" for child in node.children[:3]):
+        return "async_function"
+    return captured
+
+
+def _node_name(node) -> Optional[str]:
+    name = node.child_by_field_name("name")
+    if name is None and node.parent is not None:
+        field = _PARENT_NAME_FIELDS.get(node.parent.type)
+        if field is not None:
+            name = node.parent.child_by_field_name(field)
+    if name is None or name.text is None:
+        return None
+    return name.text.decode("utf-8", errors="replace")
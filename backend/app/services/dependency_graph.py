@@ -0,0 +1,231 @@
+"""
+Incremental dependency graph over an analysis state's dependency_edges.
+
+The dependency graph summary, the set of import targets that steers
+exploration and the per-module counters used to be rebuilt from every edge
+(re-resolving every import) each time one of them was read. A
+DependencyGraph folds each file's imports in once, in O(imports of that
+file), keeps those aggregates current, and caches the summary until the
+next change. With numpy installed the summary also carries the
+graph_analytics fields (PageRank, import cycles, layers, fan-in/fan-out).
+
+dependency_edges stays the serializable record. The analysis loops attach a
+graph to the state they own (attach_dependency_graph), update it through the
+same calls that update the record, and detach it before the state is
+returned or persisted. Readers of a state without an attached graph get one
+built from its edges. A graph built against an older scan of the repo is
+rebuilt, so resolved targets never outlive the scan they came from.
+"""
+import heapq
+from collections import Counter
+from pathlib import Path
+from typing import AbstractSet, Dict, Iterable, Optional, Set, Tuple
+
+from app.services import graph_analytics
+from app.services.import_resolution import ResolutionIndex
+from app.services.resolution_cache import get_resolution_index
+from app.services.scan_cache import scan_generation
+
+_STATE_KEY = "_dependency_graph"
+
+_TOP_MODULES = 10
+_TOP_FILES = 10
+_MAX_INTERNAL_EDGES = 500  # cap to avoid large payloads on complex repos
+
+
+class DependencyGraph:
+    """
+    One state's import edges plus what the analysis reads from them: import
+    counts per module and per file, module clusters, resolved internal edges,
+    and the internal files that explored files import.
+    """
+
+    def __init__(self, repo_path: Path, package_roots: Iterable[str] = ()) -> None:
+        self.repo_path = repo_path.resolve()
+        self.package_roots = tuple(str(root) for root in package_roots)
+        self.generation = scan_generation(self.repo_path)
+        self._imports: Dict[str, Tuple[str, ...]] = {}
+        self._targets: Dict[str, Tuple[str, ...]] = {}
+        self._explored: Set[str] = set()
+        self._module_counts: Counter[str] = Counter()
+        # cluster key -> importing file -> number of its modules in the cluster
+        self._clusters: Dict[str, Counter[str]] = {}
+        self._internal_edges: Set[Tuple[str, str]] = set()
+        # internal file -> number of explored files that import it
+        self._target_refs: Counter[str] = Counter()
+        self._summary: Optional[Dict] = None
+
+    @classmethod
+    def for_state(cls, state: Dict) -> "DependencyGraph":
+        """Build the graph of state's dependency_edges and explored_files."""
+        graph = cls(Path(state["current_summary"]["local_path"]), state.get("package_roots", []))
+        graph._explored.update(state.get("explored_files", []))
+        index = graph._index()
+        for edge in state.get("dependency_edges", []):
+            graph._set(edge["source"], edge.get("imports", []), index)
+        return graph
+
+    def copy(self) -> "DependencyGraph":
+        other = DependencyGraph.__new__(DependencyGraph)
+        other.repo_path = self.repo_path
+        other.package_roots = self.package_roots
+        other.generation = self.generation
+        other._imports = dict(self._imports)
+        other._targets = dict(self._targets)
+        other._explored = set(self._explored)
+        other._module_counts = Counter(self._module_counts)
+        other._clusters = {key: Counter(files) for key, files in self._clusters.items()}
+        other._internal_edges = set(self._internal_edges)
+        other._target_refs = Counter(self._target_refs)
+        other._summary = self._summary
+        return other
+
+    def set_imports(self, source: str, imports: Iterable[str]) -> None:
+        """Record (or replace) the imports of source."""
+        self._set(source, imports, self._index())
+
+    def remove(self, source: str) -> None:
+        """Forget source's imports and its explored mark."""
+        self._drop(source)
+        self._explored.discard(source)
+
+    def mark_explored(self, source: str) -> None:
+        """Count source's internal imports as known import targets."""
+        if source in self._explored:
+            return
+        self._explored.add(source)
+        self._target_refs.update(self._targets.get(source, ()))
+
+    def import_targets(self) -> AbstractSet[str]:
+        """Live view of the internal files that explored files import."""
+        return self._target_refs.keys()
+
+    def summary(self) -> Dict:
+        """The dependency graph summary; cached until the graph next changes. Treat as read-only."""
+        if self._summary is None:
+            self._summary = self._build_summary()
+        return self._summary
+
+    def _index(self) -> ResolutionIndex:
+        return get_resolution_index(self.repo_path, self.package_roots)
+
+    def _set(self, source: str, imports: Iterable[str], index: ResolutionIndex) -> None:
+        self._drop(source)
+        self._summary = None
+        modules = tuple(sorted(set(imports)))
+        targets = tuple(sorted({
+            target for target in (index.resolve(source, module) for module in modules) if target is not None
+        }))
+        self._imports[source] = modules
+        self._targets[source] = targets
+        self._module_counts.update(modules)
+        for module in modules:
+            cluster_key = _cluster_key(module)
+            if cluster_key:
+                self._clusters.setdefault(cluster_key, Counter())[source] += 1
+        self._internal_edges.update((source, target) for target in targets)
+        if source in self._explored:
+            self._target_refs.update(targets)
+
+    def _drop(self, source: str) -> None:
+        modules = self._imports.pop(source, None)
+        if modules is None:
+            return
+        targets = self._targets.pop(source)
+        self._module_counts.subtract(modules)
+        for module in modules:
+            if not self._module_counts[module]:
+                del self._module_counts[module]
+            cluster_key = _cluster_key(module)
+            if cluster_key:
+                files = self._clusters[cluster_key]
+                files[source] -= 1
+                if not files[source]:
+                    del files[source]
+                    if not files:
+                        del self._clusters[cluster_key]
+        self._internal_edges.difference_update((source, target) for target in targets)
+        if source in self._explored:
+            self._target_refs.subtract(targets)
+            for target in targets:
+                if not self._target_refs[target]:
+                    del self._target_refs[target]
+
+    def _build_summary(self) -> Dict:
+        most_imported_modules = [
+            {"module": module, "count": count}
+            for module, count in heapq.nsmallest(
+                _TOP_MODULES, self._module_counts.items(), key=lambda item: (-item[1], item[0])
+            )
+        ]
+        highest_dependency_files = [
+            {"source": source, "imports_count": len(modules)}
+            for source, modules in heapq.nsmallest(
+                _TOP_FILES, self._imports.items(), key=lambda item: (-len(item[1]), item[0])
+            )
+        ]
+        clusters = [
+            {"cluster": cluster_key, "files": sorted(files)}
+            for cluster_key, files in sorted(self._clusters.items(), key=lambda item: (-len(item[1]), item[0]))
+            if len(files) >= 2
+        ]
+        internal_edges = [
+            {"from": source, "to": target}
+            for source, target in heapq.nsmallest(_MAX_INTERNAL_EDGES, self._internal_edges)
+        ]
+        summary = {
+            "most_imported_modules": most_imported_modules,
+            "highest_dependency_files": highest_dependency_files,
+            "clusters": clusters,
+            "internal_edges": internal_edges,
+        }
+        if graph_analytics.available():
+            # Centrality, cycles and layers over every internal edge, not just the capped list.
+            summary.update(graph_analytics.analyze(graph_analytics.CSRGraph.from_edges(self._internal_edges)))
+        return summary
+
+
+def dependency_graph(state: Dict) -> DependencyGraph:
+    """state's attached graph, or a throwaway one built from its edges."""
+    graph = attached_dependency_graph(state)
+    return graph if graph is not None else DependencyGraph.for_state(state)
+
+
+def attach_dependency_graph(state: Dict) -> DependencyGraph:
+    """Build (if needed) and attach a graph that follows state's later edge updates."""
+    graph = attached_dependency_graph(state)
+    if graph is None:
+        graph = state[_STATE_KEY] = DependencyGraph.for_state(state)
+    return graph
+
+
+def attached_dependency_graph(state: Dict) -> Optional[DependencyGraph]:
+    """The graph attached to state, rebuilt first if the repo has been rescanned since."""
+    graph = state.get(_STATE_KEY)
+    if graph is not None and graph.generation != scan_generation(graph.repo_path):
+        graph = state[_STATE_KEY] = DependencyGraph.for_state(state)
+    return graph
+
+
+def carry_dependency_graph(state: Dict, next_state: Dict) -> None:
+    """Attach a copy of state's graph, if it has one, to next_state (a copy of state)."""
+    graph = attached_dependency_graph(state)
+    if graph is not None:
+        next_state[_STATE_KEY] = graph.copy()
+
+
+def detach_dependency_graph(state: Dict) -> None:
+    """Drop the attached graph so the state is plain, serializable data again."""
+    state.pop(_STATE_KEY, None)
+
+
+def _cluster_key(module: str) -> str:
+    if not module:
+        return ""
+    if module.startswith("."):
+        return "relative"
+    if "/" in module:
+        return module.split("/", 1)[0]
+    if "." in module:
+        return module.split(".", 1)[0]
+    return module
@@ -0,0 +1,191 @@
+"""
+Persistent per-repo file fingerprint index.
+
+Maps each repo-relative path to its size, mtime, content hash, language,
+line count and extracted imports in a small SQLite database under
+settings.FILE_INDEX_DIR. A record is only trusted while the file's
+(size, mtime_ns) fingerprint and the import extractor version still match,
+so repeated snapshots of an unchanged clone never re-read file contents.
+The index survives restarts and is deleted when a clone is force-cleaned.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.core.config import settings
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    language TEXT NOT NULL,
+    line_count INTEGER NOT NULL,
+    imports TEXT NOT NULL,
+    extractor_version INTEGER NOT NULL
+)
+"""
+
+# extractor_version of rows written by the scanner: a line count, no imports yet
+LINE_COUNT_ONLY = 0
+
+_OPEN_LOCK = threading.Lock()
+_OPEN_INDEXES: Dict[str, "FileIndex"] = {}
+
+
+class FileIndex:
+    """One SQLite-backed index per repository; safe to share between threads."""
+
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def lookup(self, path: str, size: int, mtime_ns: int, extractor_version: int) -> Optional[Dict]:
+        """Return the stored record for path if its fingerprint is still current."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, language, line_count, imports FROM files "
+                "WHERE path = ? AND size = ? AND mtime_ns = ? AND extractor_version = ?",
+                (path, size, mtime_ns, extractor_version),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "path": path,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "content_hash": row[0],
+            "language": row[1],
+            "line_count": row[2],
+            "imports": json.loads(row[3]),
+        }
+
+    def store(
+        self,
+        path: str,
+        *,
+        size: int,
+        mtime_ns: int,
+        content_hash: str,
+        language: str,
+        line_count: int,
+        imports: list,
+        extractor_version: int,
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (path, size, mtime_ns, content_hash, language, line_count,
+                 json.dumps(imports), extractor_version),
+            )
+            self._conn.commit()
+
+    def store_many(self, records: Iterable[Dict], extractor_version: int) -> None:
+        """Store several records (dicts shaped like lookup() results) in one transaction."""
+        rows = [
+            (r["path"], r["size"], r["mtime_ns"], r["content_hash"], r["language"],
+             r["line_count"], json.dumps(r["imports"]), extractor_version)
+            for r in records
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def line_counts(self, fingerprints: Iterable[Tuple[str, int, int]]) -> Dict[str, int]:
+        """
+        Stored line counts for the (path, size, mtime_ns) fingerprints that are
+        still current. Line counts do not depend on the import extractor, so
+        rows of any extractor version qualify.
+        """
+        wanted = {path: (size, mtime_ns) for path, size, mtime_ns in fingerprints}
+        with self._lock:
+            rows = self._conn.execute("SELECT path, size, mtime_ns, line_count FROM files").fetchall()
+        return {
+            path: line_count
+            for path, size, mtime_ns, line_count in rows
+            if wanted.get(path) == (size, mtime_ns)
+        }
+
+    def store_line_counts(self, rows: Iterable[Tuple[str, int, int, str, int]]) -> None:
+        """
+        Store (path, size, mtime_ns, language, line_count) rows counted by the
+        scanner. They are marked LINE_COUNT_ONLY, so lookup() still misses
+        until the file's imports are extracted and stored.
+        """
+        rows = [
+            (path, size, mtime_ns, "", language, line_count, "[]", LINE_COUNT_ONLY)
+            for path, size, mtime_ns, language, line_count in rows
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def prune(self, keep_paths: Iterable[str]) -> int:
+        """Delete records for paths no longer in the repo. Returns rows removed."""
+        keep = set(keep_paths)
+        with self._lock:
+            stored = [row[0] for row in self._conn.execute("SELECT path FROM files")]
+            stale = [(path,) for path in stored if path not in keep]
+            if stale:
+                self._conn.executemany("DELETE FROM files WHERE path = ?", stale)
+                self._conn.commit()
+        return len(stale)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def get_file_index(repo_path: Path) -> FileIndex:
+    """Open (or reuse) the index for repo_path."""
+    db_path = _index_path(repo_path)
+    key = str(db_path)
+    with _OPEN_LOCK:
+        index = _OPEN_INDEXES.get(key)
+        if index is None:
+            index = FileIndex(db_path)
+            _OPEN_INDEXES[key] = index
+        return index
+
+
+def remove_file_index(repo_path: Path) -> None:
+    """Close and delete the index for repo_path (used when a clone is force-cleaned)."""
+    db_path = _index_path(repo_path)
+    with _OPEN_LOCK:
+        index = _OPEN_INDEXES.pop(str(db_path), None)
+    if index is not None:
+        index.close()
+    for suffix in ("", "-wal", "-shm"):
+        candidate = db_path.with_name(db_path.name + suffix)
+        try:
+            candidate.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            LOGGER.warning("Could not remove file index %s: %s", candidate, exc)
+
+
+def _index_path(repo_path: Path) -> Path:
+    resolved = str(repo_path.resolve())
+    digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:12]
+    return settings.FILE_INDEX_DIR / f"{repo_path.name}-{digest}.sqlite"
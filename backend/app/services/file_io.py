@@ -0,0 +1,162 @@
+"""
+Bounded-memory file reads for inspection.
+
+Inspecting a multi-megabyte generated file used to mean several whole-file
+reads and a list of every line, just to count lines or show 40 of them. The
+helpers here read in fixed-size chunks into one reusable buffer instead:
+
+  - count_lines / read_source count newlines (and hash) chunk by chunk
+  - read_source keeps only the header for languages whose imports must come
+    before any other declaration (Go, Java), so extraction never sees the
+    body of the file; read_header stops reading there too
+  - read_preview reads at most PREVIEW_MAX_BYTES for a preview
+  - iter_lines streams decoded lines for searches
+
+Line counts follow the scanner's rule: newlines, plus one for a final line
+without a trailing newline.
+"""
+import hashlib
+import re
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+CHUNK_SIZE = 1 << 20
+# A preview is a few dozen lines; one huge minified line must not make it huge too.
+PREVIEW_MAX_BYTES = 64 * 1024
+
+# First top-level declaration after the import section. Imports cannot follow
+# it in these languages, so nothing past it is needed for import extraction.
+# Comments (and Go strings) are matched whole so a `const` line inside a cgo
+# preamble or a license block is not taken for a declaration; an unterminated
+# one runs to the end of the data read so far.
+_COMMENT = rb"//[^\n]*|/\*.*?(?:\*/|\Z)"
+_HEADER_END_RES = {
+    "go": re.compile(
+        _COMMENT + rb'|"(?:[^"\\\n]|\\.)*(?:"|\Z)|`[^`]*(?:`|\Z)'
+        rb"|(?P<decl>^(?:func|type|var|const)\b)",
+        re.MULTILINE | re.DOTALL,
+    ),
+    "java": re.compile(
+        _COMMENT + rb"|(?P<decl>^(?:@(?!interface\b)\w"
+        rb"|(?:(?:public|protected|private|abstract|final|sealed|non-sealed|static|strictfp)\s+)*"
+        rb"(?:class|interface|enum|record|@interface)\s))",
+        re.MULTILINE | re.DOTALL,
+    ),
+}
+# Longest text a declaration match can need; kept for rescanning when a chunk ends.
+_HEADER_SLACK = 256
+
+
+def count_lines(path: Path) -> int:
+    """Line count of path, 0 if it cannot be read."""
+    lines = 0
+    last = b"\n"
+    try:
+        for chunk in _chunks(path):
+            lines += chunk.obj.count(b"\n", 0, len(chunk))
+            last = bytes(chunk[-1:])
+    except OSError:
+        return 0
+    # A final line without a trailing newline still counts.
+    return lines + (last != b"\n")
+
+
+def read_source(path: Path, header_language: Optional[str] = None) -> Tuple[str, int, str]:
+    """
+    One chunked pass over path returning (content hash, line count, text).
+
+    The hash matches file_index.content_hash of the whole file. text is the
+    decoded file (utf-8, undecodable bytes dropped); pass header_language
+    to get only the header of a Go or Java file instead. Raises OSError.
+    """
+    header_end = _HEADER_END_RES.get(header_language or "")
+    digest = hashlib.sha1()
+    kept = bytearray()
+    keeping = True
+    resume = 0
+    lines = 0
+    last = b"\n"
+    for chunk in _chunks(path):
+        digest.update(chunk)
+        lines += chunk.obj.count(b"\n", 0, len(chunk))
+        last = bytes(chunk[-1:])
+        if keeping:
+            kept += chunk
+            if header_end is not None:
+                end, resume = _header_end(header_end, kept, resume, final=False)
+                if end is not None:
+                    del kept[end:]
+                    keeping = False
+    if keeping and header_end is not None:
+        end, _ = _header_end(header_end, kept, resume, final=True)
+        if end is not None:
+            del kept[end:]
+    text = kept.decode("utf-8", errors="ignore")
+    return digest.hexdigest(), lines + (last != b"\n"), text
+
+
+def read_header(path: Path, language: str) -> str:
+    """
+    The header of a Go or Java file (see read_source), reading only the
+    chunks up to the first declaration. Raises OSError.
+    """
+    header_end = _HEADER_END_RES[language]
+    kept = bytearray()
+    resume = 0
+    for chunk in _chunks(path):
+        kept += chunk
+        end, resume = _header_end(header_end, kept, resume, final=False)
+        if end is not None:
+            del kept[end:]
+            return kept.decode("utf-8", errors="ignore")
+    end, _ = _header_end(header_end, kept, resume, final=True)
+    if end is not None:
+        del kept[end:]
+    return kept.decode("utf-8", errors="ignore")
+
+
+def read_preview(path: Path, max_lines: int) -> Tuple[List[str], int]:
+    """
+    The first max_lines lines of path (from at most PREVIEW_MAX_BYTES) and
+    the file's total line count. Raises OSError.
+    """
+    with open(path, "rb") as handle:
+        head = handle.read(PREVIEW_MAX_BYTES)
+    lines = head.decode("utf-8", errors="ignore").splitlines()[:max_lines]
+    return lines, count_lines(path)
+
+
+def iter_lines(path: Path) -> Iterator[str]:
+    """Decoded lines of path without line endings, read incrementally. Raises OSError."""
+    with open(path, encoding="utf-8", errors="ignore") as handle:
+        for line in handle:
+            yield line.rstrip("\r\n")
+
+
+def _header_end(
+    header_end: "re.Pattern[bytes]", data: bytearray, pos: int, final: bool
+) -> Tuple[Optional[int], int]:
+    """
+    Offset of the first declaration in data[pos:], or None, and the position
+    to resume from once more data is appended. Unless final, a match that
+    reaches the end of data may be cut short, so it is retried from its start.
+    """
+    for match in header_end.finditer(data, pos):
+        if not final and match.end() == len(data):
+            return None, match.start()
+        if match.group("decl") is not None:
+            return match.start(), match.start()
+        pos = match.end()
+    return None, max(pos, len(data) - _HEADER_SLACK)
+
+
+def _chunks(path: Path) -> Iterator[memoryview]:
+    """Chunks of path as views of one reused buffer, each valid until the next."""
+    buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as handle:
+        while True:
+            size = handle.readinto(buffer)
+            if not size:
+                return
+            yield view[:size]
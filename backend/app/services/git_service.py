@@ -9,6 +9,9 @@ import shutil
 from git import Repo, GitCommandError
 
 from app.core.config import settings
+from app.services.file_index import remove_file_index
+from app.services.incremental_analysis import rescan_after_pull
+from app.services.scan_cache import invalidate_scan_cache
 
 
 class GitCloneError(Exception):
@@ -83,6 +86,7 @@ def clone_or_update_repo(repo_url: str, force_clean: bool = False) -> Path:
 
     if force_clean and local_path.exists():
         shutil.rmtree(local_path)
+        remove_file_index(local_path)
 
     if not local_path.exists():
         _check_github_repo_size(repo_url)
@@ -90,14 +94,20 @@ def clone_or_update_repo(repo_url: str, force_clean: bool = False) -> Path:
             Repo.clone_from(repo_url, local_path)
         except GitCommandError as e:
             raise GitCloneError(f"Failed to clone repo: {e}") from e
+        invalidate_scan_cache(local_path)
     else:
         # Try to pull latest
         try:
             repo = Repo(local_path)
+            old_commit = repo.head.commit.hexsha
             origin = repo.remotes.origin
             origin.pull()
+            new_commit = repo.head.commit.hexsha
         except GitCommandError as e:
             # Not fatal for MVP – we can ignore or re-clone
+            invalidate_scan_cache(local_path)
             raise GitCloneError(f"Failed to update repo: {e}") from e
+        # Never serve a scan from before the pull — patch it from the diff or drop it.
+        rescan_after_pull(local_path, old_commit, new_commit)
 
     return local_path
@@ -0,0 +1,291 @@
+"""
+Graph analytics over the resolved internal import graph.
+
+The graph is kept in compressed sparse row (CSR) form: every file gets an
+integer id 0..n-1 and the ids file i imports are indices[indptr[i]:indptr[i + 1]].
+All analytics work on those arrays:
+
+  - PageRank centrality by power iteration, one weighted bincount per
+    iteration; rank flows from importer to imported file, so heavily
+    depended-upon files score highest
+  - strongly connected components (import cycles): files that cannot lie on
+    a cycle are peeled off with vectorized in/out-degree trimming (Kahn
+    rounds), and an iterative Tarjan runs only on what is left
+  - topological layers of the component DAG: layer 0 imports nothing
+    internal, layer k imports only layers below k (longest-path layering,
+    again by Kahn rounds)
+  - fan-in / fan-out (in/out degree)
+
+numpy is an optional dependency; when it is missing available() is False
+and graph summaries carry no analytics.
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+_TOP_FILES = 10
+_MAX_CYCLES = 20
+_MAX_LAYER_FILES = 20
+_PAGERANK_DAMPING = 0.85
+_PAGERANK_TOLERANCE = 1e-6
+_PAGERANK_MAX_ITERATIONS = 100
+
+
+def available() -> bool:
+    return np is not None
+
+
+class CSRGraph:
+    """Directed graph over integer node ids in compressed sparse row form."""
+
+    def __init__(self, indptr: "np.ndarray", indices: "np.ndarray", nodes: Optional[Sequence[str]] = None) -> None:
+        self.indptr = indptr
+        self.indices = indices
+        # Node labels by id (file paths), when the graph was built from them.
+        self.nodes = nodes
+
+    @classmethod
+    def from_arrays(
+        cls,
+        node_count: int,
+        sources: "np.ndarray",
+        targets: "np.ndarray",
+        nodes: Optional[Sequence[str]] = None,
+    ) -> "CSRGraph":
+        """Build from parallel arrays of edge source and target ids."""
+        sources = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources, kind="stable")
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=node_count), out=indptr[1:])
+        return cls(indptr, np.asarray(targets, dtype=np.int64)[order], nodes)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str]]) -> "CSRGraph":
+        """Build from (importer, imported) file pairs; ids follow sorted path order."""
+        edges = list(edges)
+        nodes = sorted({node for edge in edges for node in edge})
+        ids = {node: node_id for node_id, node in enumerate(nodes)}
+        sources = np.fromiter((ids[source] for source, _ in edges), dtype=np.int64, count=len(edges))
+        targets = np.fromiter((ids[target] for _, target in edges), dtype=np.int64, count=len(edges))
+        # Fixed adjacency order, so results never depend on the order of edges.
+        order = np.lexsort((targets, sources))
+        return cls.from_arrays(len(nodes), sources[order], targets[order], nodes)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.indptr) - 1
+
+    def out_degree(self) -> "np.ndarray":
+        return np.diff(self.indptr)
+
+    def in_degree(self) -> "np.ndarray":
+        return np.bincount(self.indices, minlength=self.node_count)
+
+    def edge_sources(self) -> "np.ndarray":
+        """Source id of every entry of indices."""
+        return np.repeat(np.arange(self.node_count, dtype=np.int64), self.out_degree())
+
+    def transpose(self) -> "CSRGraph":
+        return CSRGraph.from_arrays(self.node_count, self.indices, self.edge_sources(), self.nodes)
+
+    def subgraph(self, node_ids: "np.ndarray") -> "CSRGraph":
+        """Induced subgraph on node_ids; node i of the result is node_ids[i]."""
+        mapping = np.full(self.node_count, -1, dtype=np.int64)
+        mapping[node_ids] = np.arange(len(node_ids), dtype=np.int64)
+        sources = mapping[self.edge_sources()]
+        targets = mapping[self.indices]
+        keep = (sources >= 0) & (targets >= 0)
+        return CSRGraph.from_arrays(len(node_ids), sources[keep], targets[keep])
+
+    def neighbours(self, node_ids: "np.ndarray") -> "np.ndarray":
+        """Concatenated adjacency slices of node_ids, without a Python loop."""
+        starts = self.indptr[node_ids]
+        lengths = self.indptr[node_ids + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64)
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return self.indices[offsets + np.arange(total, dtype=np.int64)]
+
+
+def pagerank(
+    graph: CSRGraph,
+    damping: float = _PAGERANK_DAMPING,
+    tolerance: float = _PAGERANK_TOLERANCE,
+    max_iterations: int = _PAGERANK_MAX_ITERATIONS,
+) -> "np.ndarray":
+    """PageRank of every node; rank of nodes without out-edges is spread evenly."""
+    n = graph.node_count
+    if not n:
+        return np.zeros(0)
+    out_degree = graph.out_degree()
+    dangling = out_degree == 0
+    divisor = np.where(dangling, 1, out_degree).astype(np.float64)
+    sources = graph.edge_sources()
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iterations):
+        flow = np.bincount(graph.indices, weights=(rank / divisor)[sources], minlength=n)
+        updated = damping * (flow + rank[dangling].sum() / n) + (1.0 - damping) / n
+        converged = np.abs(updated - rank).sum() < tolerance
+        rank = updated
+        if converged:
+            break
+    return rank
+
+
+def strongly_connected_components(graph: CSRGraph) -> "np.ndarray":
+    """Component label (0..k-1) of every node; nodes on a common cycle share one."""
+    n = graph.node_count
+    # A node with no remaining in-edges (or out-edges) cannot be on a cycle.
+    core = np.ones(n, dtype=bool)
+    for frontier in _peel(graph, graph.in_degree()):
+        core[frontier] = False
+    for frontier in _peel(graph.transpose(), graph.out_degree().copy()):
+        core[frontier] = False
+
+    labels = np.arange(n, dtype=np.int64)
+    core_ids = np.flatnonzero(core)
+    if core_ids.size:
+        labels[core_ids] = n + _tarjan(graph.subgraph(core_ids))
+    return np.unique(labels, return_inverse=True)[1].reshape(n)
+
+
+def topological_layers(graph: CSRGraph, components: "np.ndarray") -> "np.ndarray":
+    """
+    Layer of every node in the DAG of components: 0 when it imports nothing
+    outside its own component, otherwise one more than the highest layer it
+    imports.
+    """
+    component_count = int(components.max()) + 1 if components.size else 0
+    sources = components[graph.edge_sources()]
+    targets = components[graph.indices]
+    between = sources != targets
+    condensed = CSRGraph.from_arrays(component_count, sources[between], targets[between])
+
+    layers = np.zeros(component_count, dtype=np.int64)
+    for depth, frontier in enumerate(_peel(condensed.transpose(), condensed.out_degree().copy())):
+        layers[frontier] = depth
+    return layers[components]
+
+
+def analyze(graph: CSRGraph, top: int = _TOP_FILES) -> Dict:
+    """Analytics fields of the dependency graph summary for a graph built with from_edges."""
+    nodes = graph.nodes or []
+    if not nodes:
+        return {"central_files": [], "highest_fan_in": [], "highest_fan_out": [], "import_cycles": [], "layers": []}
+
+    rank = pagerank(graph)
+    fan_in = graph.in_degree()
+    fan_out = graph.out_degree()
+    components = strongly_connected_components(graph)
+    layers = topological_layers(graph, components)
+
+    # node ids follow path order, so every group below is sorted by path
+    cycles = [[nodes[node_id] for node_id in members] for members in _groups(components) if len(members) >= 2]
+    cycles.sort(key=lambda files: (-len(files), files))
+
+    return {
+        "central_files": [
+            {"file": nodes[node_id], "pagerank": round(float(rank[node_id]), 6)}
+            for node_id in _top_ids(rank, top)
+        ],
+        "highest_fan_in": [
+            {"file": nodes[node_id], "fan_in": int(fan_in[node_id])}
+            for node_id in _top_ids(fan_in, top)
+        ],
+        "highest_fan_out": [
+            {"file": nodes[node_id], "fan_out": int(fan_out[node_id])}
+            for node_id in _top_ids(fan_out, top)
+        ],
+        "import_cycles": [{"size": len(files), "files": files} for files in cycles[:_MAX_CYCLES]],
+        "layers": [
+            {
+                "layer": layer,
+                "file_count": len(members),
+                "files": [nodes[node_id] for node_id in members[:_MAX_LAYER_FILES]],
+            }
+            for layer, members in enumerate(_groups(layers))
+        ],
+    }
+
+
+def _top_ids(scores: "np.ndarray", top: int) -> List[int]:
+    """Ids of the top highest-scoring nodes with a positive score, ties by id."""
+    order = np.lexsort((np.arange(len(scores)), -scores))[:top]
+    return [int(node_id) for node_id in order if scores[node_id] > 0]
+
+
+def _groups(labels: "np.ndarray") -> List["np.ndarray"]:
+    """Node ids (ascending) of each label 0..max, in one sort rather than a scan per label."""
+    members = np.argsort(labels, kind="stable")
+    return np.split(members, np.cumsum(np.bincount(labels))[:-1])
+
+
+def _peel(graph: CSRGraph, remaining: "np.ndarray") -> Iterator["np.ndarray"]:
+    """
+    Kahn rounds: yield the nodes whose remaining count is zero, then take one
+    off the count of each of their neighbours in graph, until no node is
+    released. remaining is consumed.
+    """
+    frontier = np.flatnonzero(remaining == 0)
+    while frontier.size:
+        yield frontier
+        released, counts = np.unique(graph.neighbours(frontier), return_counts=True)
+        remaining[released] -= counts
+        frontier = released[remaining[released] == 0]
+
+
+def _tarjan(graph: CSRGraph) -> "np.ndarray":
+    """Iterative Tarjan SCC; returns a component label per node."""
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    n = graph.node_count
+    order = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    labels = [-1] * n
+    stack: List[int] = []
+    counter = 0
+    component = 0
+    for root in range(n):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, indptr[root])]
+        while work:
+            node, position = work[-1]
+            end = indptr[node + 1]
+            while position < end:
+                child = indices[position]
+                position += 1
+                if order[child] == -1:
+                    work[-1] = (node, position)
+                    order[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, indptr[child]))
+                    break
+                if on_stack[child] and order[child] < low[node]:
+                    low[node] = order[child]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == order[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        labels[member] = component
+                        if member == node:
+                            break
+                    component += 1
+    return np.asarray(labels, dtype=np.int64)
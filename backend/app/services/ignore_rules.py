@@ -0,0 +1,260 @@
+"""
+Compiled ignore rules for the repository scanner.
+
+Merges four sources into one decision per path:
+  - built-in noise: IGNORE_DIRS plus vendored trees, and minified/bundled file suffixes
+  - .gitignore files (root and nested), in gitignore pattern syntax
+  - a per-repo override file (settings.SCANNER_IGNORE_FILE), same syntax
+  - a max file size and a quick binary/minified content sniff for large files
+
+Patterns are compiled into a single regex per rule set, and a rule set only
+changes when the walk enters a directory with its own .gitignore, so the
+cost is one regex match per entry rather than a loop over path components.
+As in git, the last matching pattern decides, so a later `!pattern`
+re-includes and a later plain pattern excludes again.
+"""
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Directories we never want to scan
+IGNORE_DIRS = {
+    ".git",
+    "node_modules",
+    "venv",
+    "__pycache__",
+    "dist",
+    "build",
+    ".idea",
+    ".vscode",
+}
+
+# Vendored / generated trees that carry no architecture signal (matched case-insensitively)
+NOISE_DIR_NAMES = {name.lower() for name in IGNORE_DIRS} | {"vendor", "vendors"}
+
+# Minified or bundled build artifacts
+NOISE_FILE_SUFFIXES = (".min.js", ".min.css", ".min.mjs", ".bundle.js", ".chunk.js")
+
+# Languages where a huge single-line file is almost certainly minified output
+_MINIFIABLE_SUFFIXES = {".js", ".jsx", ".ts", ".mjs", ".cjs", ".css"}
+_SNIFF_BYTES = 4096
+_MINIFIED_LINE_LENGTH = 1000
+
+# (compiled regex source, negated)
+_Pattern = Tuple[str, bool]
+
+
+class IgnoreRules:
+    """
+    Immutable rule set for one directory context of a walk.
+
+    Use IgnoreRules.for_repository() at the root and child() when entering a
+    directory that contains a .gitignore; every other directory shares its
+    parent's instance. overrides (the per-repo override file) always come
+    after every .gitignore pattern, so they have the last word.
+    """
+
+    def __init__(
+        self,
+        patterns: Tuple[_Pattern, ...] = (),
+        *,
+        overrides: Tuple[_Pattern, ...] = (),
+        max_file_size: int = 0,
+        sniff_min_size: int = 0,
+    ):
+        self.patterns = patterns
+        self.overrides = overrides
+        self.max_file_size = max_file_size
+        self.sniff_min_size = sniff_min_size
+        # Alternatives are tried in order, so listing the patterns last-first
+        # makes the matched group the last matching pattern.
+        ordered = tuple(reversed(patterns + overrides))
+        self._pattern_re = _combine(source for source, _ in ordered)
+        self._negated = tuple(negated for _, negated in ordered)
+        self._dir_memo: Dict[str, bool] = {}
+
+    @classmethod
+    def for_repository(cls, repo_root: str, *, use_gitignore: bool = True) -> "IgnoreRules":
+        """
+        Root rule set: override file, plus the root .gitignore when use_gitignore
+        (the git backend already applies .gitignore itself).
+        """
+        patterns: List[_Pattern] = []
+        if use_gitignore:
+            patterns.extend(_load_pattern_file(os.path.join(repo_root, ".gitignore"), base=""))
+        overrides: List[_Pattern] = []
+        if settings.SCANNER_IGNORE_FILE:
+            overrides.extend(
+                _load_pattern_file(os.path.join(repo_root, settings.SCANNER_IGNORE_FILE), base="")
+            )
+        return cls(
+            tuple(patterns),
+            overrides=tuple(overrides),
+            max_file_size=max(0, settings.SCANNER_MAX_FILE_SIZE_KB) * 1024,
+            sniff_min_size=max(0, settings.SCANNER_SNIFF_MIN_KB) * 1024,
+        )
+
+    def child(self, gitignore_path: str, rel_dir: str) -> "IgnoreRules":
+        """Rule set for rel_dir ("a/b/"), adding the patterns of its .gitignore."""
+        extra = _load_pattern_file(gitignore_path, base=rel_dir)
+        if not extra:
+            return self
+        return IgnoreRules(
+            self.patterns + tuple(extra),
+            overrides=self.overrides,
+            max_file_size=self.max_file_size,
+            sniff_min_size=self.sniff_min_size,
+        )
+
+    def ignores_dir(self, name: str, rel_dir: str) -> bool:
+        """rel_dir is the directory's repo-relative path with a trailing slash."""
+        return name.lower() in NOISE_DIR_NAMES or self._matches(rel_dir)
+
+    def ignores_file(self, name: str, rel_path: str, size: int = 0, abs_path: Optional[str] = None) -> bool:
+        lowered = name.lower()
+        if lowered.endswith(NOISE_FILE_SUFFIXES):
+            return True
+        if self._matches(rel_path):
+            return True
+        if self.max_file_size and size > self.max_file_size:
+            return True
+        if abs_path is not None and self.sniff_min_size and size >= self.sniff_min_size:
+            return _looks_binary_or_minified(abs_path, os.path.splitext(lowered)[1])
+        return False
+
+    def ignores_path(self, rel_path: str, size: int = 0, abs_path: Optional[str] = None) -> bool:
+        """
+        Check a repo-relative file path from a flat listing (git index, diffs).
+        Each directory's verdict is computed once and memoized; size/abs_path
+        enable the size limit and content sniff as in ignores_file.
+        """
+        directory, _, name = rel_path.rpartition("/")
+        if directory and self._directory_ignored(directory):
+            return True
+        return self.ignores_file(name, rel_path, size, abs_path)
+
+    def _directory_ignored(self, directory: str) -> bool:
+        cached = self._dir_memo.get(directory)
+        if cached is not None:
+            return cached
+        parent, _, name = directory.rpartition("/")
+        ignored = (bool(parent) and self._directory_ignored(parent)) or self.ignores_dir(
+            name, f"{directory}/"
+        )
+        if len(self._dir_memo) > 65536:
+            self._dir_memo.clear()
+        self._dir_memo[directory] = ignored
+        return ignored
+
+    def _matches(self, rel_path: str) -> bool:
+        if self._pattern_re is None:
+            return False
+        match = self._pattern_re.match(rel_path)
+        return match is not None and not self._negated[match.lastindex - 1]
+
+
+def _combine(sources: Iterable[str]) -> Optional["re.Pattern[str]"]:
+    sources = list(sources)
+    if not sources:
+        return None
+    # One capturing group per source (sources only use non-capturing groups).
+    return re.compile("|".join(f"({source})" for source in sources))
+
+
+def _load_pattern_file(path: str, base: str) -> List[_Pattern]:
+    try:
+        with open(path, encoding="utf-8", errors="ignore") as handle:
+            lines = handle.read().splitlines()
+    except OSError:
+        return []
+    patterns: List[_Pattern] = []
+    for line in lines:
+        compiled = _compile_gitignore_line(line, base)
+        if compiled is not None:
+            patterns.append(compiled)
+    return patterns
+
+
+def _compile_gitignore_line(line: str, base: str) -> Optional[_Pattern]:
+    """
+    Translate one gitignore line into a regex over repo-relative paths.
+    Directory paths are matched with a trailing slash, files without.
+    """
+    line = line.rstrip()
+    if not line or line.startswith("#"):
+        return None
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    # A slash at the start or in the middle anchors the pattern to base.
+    anchored = "/" in line
+    line = line.lstrip("/")
+    if not line:
+        return None
+
+    body = _glob_to_regex(line)
+    prefix = re.escape(base)
+    if not anchored:
+        prefix += "(?:.*/)?"
+    suffix = "/$" if dir_only else "/?$"
+    return f"{prefix}{body}{suffix}", negated
+
+
+def _glob_to_regex(glob: str) -> str:
+    out: List[str] = []
+    i = 0
+    while i < len(glob):
+        ch = glob[i]
+        if glob.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if glob.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if ch == "*":
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "[":
+            end = glob.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(ch))
+            else:
+                klass = glob[i + 1:end]
+                if klass.startswith("!"):
+                    klass = "^" + klass[1:]
+                out.append(f"[{klass}]")
+                i = end
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return "".join(out)
+
+
+def _looks_binary_or_minified(abs_path: str, suffix: str) -> bool:
+    """Read the first few KB: NUL bytes mean binary; no line breaks in a JS/CSS head means minified."""
+    try:
+        with open(abs_path, "rb") as handle:
+            head = handle.read(_SNIFF_BYTES)
+    except OSError:
+        return False
+    if b"\0" in head:
+        return True
+    if suffix in _MINIFIABLE_SUFFIXES and len(head) >= _MINIFIED_LINE_LENGTH:
+        longest_line = max(len(line) for line in head.split(b"\n"))
+        return longest_line >= _MINIFIED_LINE_LENGTH
+    return False
+
+
+# Path-only rules shared by callers that have no repo context (e.g. _is_noise_file).
+NOISE_RULES = IgnoreRules()
@@ -0,0 +1,191 @@
+"""
+Content-addressed cache of extracted imports.
+
+Import extraction is a pure function of (file contents, language, extractor
+version), so its result is cached under (content hash, language, version):
+
+  - an in-process LRU tier (settings.IMPORT_CACHE_MEMORY_ENTRIES)
+  - a SQLite tier at settings.IMPORT_CACHE_PATH, shared by every repo and
+    every process (API workers, import-indexer pool processes)
+
+A file re-inspected after a re-ingest, or identical in two forks of the same
+repo, is then parsed once. Bulk callers wrap a batch in batched_writes() so
+its misses reach the SQLite tier in one transaction instead of one commit
+each. Bumping the extractor version makes old entries
+unreachable; they are never served.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS imports (
+    content_hash TEXT NOT NULL,
+    language TEXT NOT NULL,
+    extractor_version INTEGER NOT NULL,
+    imports TEXT NOT NULL,
+    PRIMARY KEY (content_hash, language, extractor_version)
+)
+"""
+
+_Key = Tuple[str, str, int]
+
+_LOCK = threading.Lock()
+_MEMORY: "OrderedDict[_Key, List[str]]" = OrderedDict()
+_STATS = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+# (pid, db path, connection or None if it failed to open) — reopened after
+# fork or when the path setting changes.
+_DISK: Optional[Tuple[int, str, Optional[sqlite3.Connection]]] = None
+# .rows: disk-tier writes deferred by this thread's batched_writes() block
+_PENDING = threading.local()
+
+
+def cached_imports(
+    digest: str,
+    language: str,
+    extractor_version: int,
+    extract: Callable[[], List[str]],
+) -> List[str]:
+    """
+    Return the imports for content with the given hash, calling extract()
+    only on a miss in both tiers. The returned list must not be mutated.
+    """
+    key = (digest, language, extractor_version)
+    with _LOCK:
+        cached = _MEMORY.get(key)
+        if cached is not None:
+            _MEMORY.move_to_end(key)
+            _STATS["memory_hits"] += 1
+            return cached
+
+    stored = _disk_lookup(key)
+    if stored is not None:
+        with _LOCK:
+            _STATS["disk_hits"] += 1
+            _remember_locked(key, stored)
+        return stored
+
+    imports = extract()
+    _disk_store(key, imports)
+    with _LOCK:
+        _STATS["misses"] += 1
+        _remember_locked(key, imports)
+    return imports
+
+
+@contextmanager
+def batched_writes() -> Iterator[None]:
+    """
+    Defer this thread's disk-tier writes until the block exits, then store
+    them in one transaction. Nested blocks join the outermost one.
+    """
+    if getattr(_PENDING, "rows", None) is not None:
+        yield
+        return
+    _PENDING.rows = []
+    try:
+        yield
+    finally:
+        rows, _PENDING.rows = _PENDING.rows, None
+        _disk_store_many(rows)
+
+
+def import_cache_stats() -> Dict[str, float]:
+    """Counters for this process plus the combined hit rate."""
+    with _LOCK:
+        stats: Dict[str, float] = dict(_STATS)
+        stats["memory_entries"] = len(_MEMORY)
+    lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+    stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+    return stats
+
+
+def clear_import_cache(disk: bool = False) -> None:
+    """Reset the memory tier and counters; with disk=True also empty the SQLite tier."""
+    with _LOCK:
+        _MEMORY.clear()
+        for name in _STATS:
+            _STATS[name] = 0
+        if disk:
+            conn = _connection_locked()
+            if conn is not None:
+                conn.execute("DELETE FROM imports")
+                conn.commit()
+
+
+def _remember_locked(key: _Key, imports: List[str]) -> None:
+    _MEMORY[key] = imports
+    _MEMORY.move_to_end(key)
+    while len(_MEMORY) > max(0, settings.IMPORT_CACHE_MEMORY_ENTRIES):
+        _MEMORY.popitem(last=False)
+
+
+def _disk_lookup(key: _Key) -> Optional[List[str]]:
+    with _LOCK:
+        conn = _connection_locked()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT imports FROM imports "
+                "WHERE content_hash = ? AND language = ? AND extractor_version = ?",
+                key,
+            ).fetchone()
+        except sqlite3.Error as exc:
+            LOGGER.warning("Import cache lookup failed: %s", exc)
+            return None
+    return json.loads(row[0]) if row is not None else None
+
+
+def _disk_store(key: _Key, imports: List[str]) -> None:
+    row = (*key, json.dumps(imports))
+    pending = getattr(_PENDING, "rows", None)
+    if pending is not None:
+        pending.append(row)
+    else:
+        _disk_store_many([row])
+
+
+def _disk_store_many(rows: List[Tuple[str, str, int, str]]) -> None:
+    if not rows:
+        return
+    with _LOCK:
+        conn = _connection_locked()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO imports VALUES (?, ?, ?, ?)", rows)
+        except sqlite3.Error as exc:
+            # Another process holding the write lock is not worth failing an analysis over.
+            LOGGER.warning("Import cache store failed: %s", exc)
+
+
+def _connection_locked() -> Optional[sqlite3.Connection]:
+    """Open (or reuse) this process's connection; None disables the disk tier."""
+    global _DISK
+    path = str(settings.IMPORT_CACHE_PATH)
+    if _DISK is not None and _DISK[0] == os.getpid() and _DISK[1] == path:
+        return _DISK[2]
+    try:
+        settings.IMPORT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Entries are recomputable, so a lost tail after a crash is harmless.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        conn.commit()
+    except (OSError, sqlite3.Error) as exc:
+        LOGGER.warning("Import cache disk tier unavailable at %s: %s", path, exc)
+        conn = None
+    _DISK = (os.getpid(), path, conn)
+    return conn
@@ -0,0 +1,182 @@
+"""
+Bulk import extraction for whole-repo dependency graphs.
+
+The agent loop only inspects a handful of files, so on its own the dependency
+graph covers a tiny slice of a large repo. index_repository_imports runs the
+_extract_*_imports functions over every scanned file up front:
+
+  - files whose (size, mtime) fingerprint is still in the persistent file
+    index are served from it without being read
+  - the rest are split into fixed-size chunks and extracted on a
+    ProcessPoolExecutor (ast/regex extraction is CPU-bound, so threads would
+    serialise on the GIL) once there are enough of them to pay for the pool;
+    new records are written back in one transaction
+  - results are merged by path and returned sorted, so the edge list is
+    identical for any worker count or chunk size
+"""
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.analysis_snapshot_service import (
+    IMPORT_EXTRACTOR_VERSION,
+    _cached_extract_imports,
+)
+from app.services.dependency_graph import attached_dependency_graph
+from app.services.file_index import get_file_index
+from app.services.import_cache import batched_writes
+from app.services.file_io import read_source
+from app.services.scan_cache import get_scan_result
+
+LOGGER = logging.getLogger(__name__)
+
+
+def index_repository_imports(
+    repo_path: Path,
+    paths: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Return dependency edges ({"source", "imports"}) for every scanned file,
+    or only for paths when given, sorted by source.
+
+    workers defaults to settings.IMPORT_INDEX_WORKERS (0 = one per CPU);
+    1 extracts in-process, as does the default whenever fewer than
+    settings.IMPORT_INDEX_PARALLEL_MIN_FILES files need extracting.
+    chunk_size defaults to settings.IMPORT_INDEX_CHUNK_SIZE.
+    """
+    repo_path = repo_path.resolve()
+    file_languages = get_scan_result(repo_path)["file_languages"]
+    if paths is None:
+        targets = list(file_languages.items())
+    else:
+        # One index lookup per path: a scan table lookup is not as cheap as a dict's.
+        targets = []
+        for file_path in sorted(set(paths)):
+            language = file_languages.get(file_path)
+            if language is not None:
+                targets.append((file_path, language))
+
+    explicit_workers = workers is not None
+    workers = workers if explicit_workers else settings.IMPORT_INDEX_WORKERS
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    chunk_size = max(1, chunk_size or settings.IMPORT_INDEX_CHUNK_SIZE)
+
+    index = get_file_index(repo_path)
+    imports_by_path: Dict[str, List[str]] = {}
+    pending: List[Tuple[str, str]] = []
+    cached = 0
+    for file_path, language in targets:
+        try:
+            stat = os.stat(repo_path / file_path)
+        except OSError:
+            continue
+        record = index.lookup(file_path, stat.st_size, stat.st_mtime_ns, IMPORT_EXTRACTOR_VERSION)
+        if record is not None:
+            imports_by_path[file_path] = record["imports"]
+            cached += 1
+        else:
+            pending.append((file_path, language))
+
+    if not explicit_workers and len(pending) < settings.IMPORT_INDEX_PARALLEL_MIN_FILES:
+        workers = 1
+    chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    for records in _extract_chunks(str(repo_path), chunks, workers):
+        index.store_many(records, IMPORT_EXTRACTOR_VERSION)
+        for record in records:
+            imports_by_path[record["path"]] = record["imports"]
+
+    LOGGER.info(
+        "Indexed imports for %d file(s) in %s (%d extracted, %d from file index)",
+        len(imports_by_path), repo_path, len(imports_by_path) - cached, cached,
+    )
+    return [
+        {"source": file_path, "imports": sorted(set(imports_by_path[file_path]))}
+        for file_path in sorted(imports_by_path)
+    ]
+
+
+def merge_dependency_edges(state: Dict, edges: Iterable[Dict]) -> None:
+    """
+    Fold bulk-indexed edges into state["dependency_edges"] (one edge per
+    source, sorted by source). Fresh edges replace older ones for the same file.
+    """
+    by_source = {edge["source"]: edge for edge in state.get("dependency_edges", [])}
+    graph = attached_dependency_graph(state)
+    for edge in edges:
+        by_source[edge["source"]] = {"source": edge["source"], "imports": list(edge["imports"])}
+        if graph is not None:
+            graph.set_imports(edge["source"], edge["imports"])
+    state["dependency_edges"] = [by_source[source] for source in sorted(by_source)]
+
+
+def prune_dependency_edges(state: Dict) -> None:
+    """
+    Drop the edges of files the analysis never explored. Bulk-indexed edges
+    cover the whole repo; they feed the graph summary while the analysis
+    runs but are rebuilt from the file index on demand, so they are not
+    kept in the persisted state.
+    """
+    explored = set(state.get("explored_files", []))
+    state["dependency_edges"] = [
+        edge for edge in state.get("dependency_edges", []) if edge["source"] in explored
+    ]
+
+
+def _extract_chunks(
+    root: str,
+    chunks: List[List[Tuple[str, str]]],
+    workers: int,
+) -> Iterator[List[Dict]]:
+    """Yield the records of each chunk, in chunk order."""
+    extract = partial(_extract_chunk, root)
+    if workers <= 1 or len(chunks) <= 1:
+        yield from map(extract, chunks)
+        return
+    # Callers run this from asyncio.to_thread workers: forking there could
+    # copy a lock (import cache, sqlite) held by another thread into the child.
+    context = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(settings.IMPORT_CACHE_PATH,),
+    ) as pool:
+        yield from pool.map(extract, chunks)
+
+
+def _init_worker(import_cache_path: Path) -> None:
+    """Pool initializer: forkserver children load settings afresh, so share the parent's cache file."""
+    settings.IMPORT_CACHE_PATH = import_cache_path
+
+
+def _extract_chunk(root: str, chunk: List[Tuple[str, str]]) -> List[Dict]:
+    """Worker entry point: read and extract one batch of files."""
+    records: List[Dict] = []
+    # Cache misses of the whole batch go to the disk tier in one transaction.
+    with batched_writes():
+        for file_path, language in chunk:
+            full_path = os.path.join(root, file_path)
+            try:
+                stat = os.stat(full_path)
+                digest, line_count, content = read_source(Path(full_path), header_language=language)
+            except OSError:
+                continue
+            records.append(
+                {
+                    "path": file_path,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "content_hash": digest,
+                    "language": language,
+                    "line_count": line_count,
+                    "imports": _cached_extract_imports(digest=digest, content=content, language=language),
+                }
+            )
+    return records
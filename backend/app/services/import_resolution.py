@@ -0,0 +1,952 @@
+"""
+Resolution of import specifiers to repository files.
+
+ResolutionIndex is built once per dependency-graph pass from the scan
+result and answers every edge with dictionary lookups: relative JS/TS and
+Python specifiers and absolute Python modules through tables precomputed
+from the scanned paths, everything else through the language resolvers
+below, each created on first use. Only those resolvers touch the
+filesystem, to read repo-level build metadata once. Answers are memoized
+per (scope, specifier) - see ResolutionIndex.scope - so `../utils` imported
+from ten files of one directory is resolved once; resolution_cache keeps
+one index per scan generation so the memo outlives a single pass.
+
+JS/TS and Python: "./util" / ".util" become a repo path base that maps to a
+file the way the old candidate probing did - the exact file, then
+<base>.js/.jsx/.ts/.tsx (or .py), then <base>/index.* and <base>/__init__.py -
+except that only scanned files are targets. Absolute Python modules map
+from dotted names under each package root (<name>.py before
+<name>/__init__.py, earlier roots first).
+
+JS/TS aliases: JsAliasResolver reads every tsconfig.json / jsconfig.json
+(following relative and workspace-package `extends`) and every named
+package.json once. Each config's `paths` patterns and the workspace
+package names are compiled into prefix tries, so a bare specifier like
+"@/components/Button" or "@org/ui/button" walks one trie to the longest
+matching prefix and yields repo path bases, which are then looked up in the
+same table as relative specifiers. The nearest config to the importing file
+applies (its `include` / `files` lists are not consulted).
+
+Go: a Go import names a package, i.e. a directory. GoResolver reads every
+go.mod once, maps "<module path>/<sub/dir>" to <module root>/<sub/dir>, and
+answers with one representative file of that package (see
+_representative_go_file) so edges stay file-to-file.
+
+Rust: RustResolver maps every module directory to its file once (foo.rs and
+foo/mod.rs both define module dir foo), then resolves crate::, self::,
+super::, bare (2018 uniform) and other-crate paths by walking that table.
+Crate names come from each Cargo.toml, including path dependencies renamed
+in [dependencies] or inherited from [workspace.dependencies].
+
+Java: imports name types, not paths, and source roots (src/main/java, ...)
+vary per build. JavaResolver reads the package declaration of every .java
+file once and maps each fully qualified type name and each package to a
+file; an import is then resolved by dictionary lookups.
+
+C/C++: IncludeResolver collects include directories once (every include/
+directory, CMake include_directories / target_include_directories and -I
+flags in compile_commands.json) and indexes every C-family file under each
+of its path suffixes, so `#include "a/b.h"` is one dictionary lookup
+followed by ranking the few files that end in a/b.h.
+"""
+import json
+import logging
+import os
+import posixpath
+import re
+import shlex
+import tomllib
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple, Union
+
+from app.services import file_io
+from app.services.repo_scanner import EXTENSION_LANGUAGE_MAP
+
+LOGGER = logging.getLogger(__name__)
+
+_JS_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx")
+
+
+class ResolutionIndex:
+    """Import specifier -> repo file, for one scan of one repository."""
+
+    def __init__(self, repo_path: Path, scanned_files: Iterable[str], package_roots: Iterable[Union[str, Path]] = ()):
+        self.repo_path = repo_path
+        self.scanned_files: List[str] = sorted(scanned_files)
+        roots = [_package_root_prefix(root, repo_path) for root in package_roots]
+        # Candidates carry a rank; the lowest wins, mirroring probe order.
+        js_modules: Dict[str, Tuple[int, str]] = {}
+        py_paths: Dict[str, Tuple[int, str]] = {}
+        py_modules: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        for file_path in self.scanned_files:
+            directory, name = posixpath.split(file_path)
+            stem, extension = posixpath.splitext(file_path)
+            _offer(js_modules, file_path, 0, file_path)
+            _offer(py_paths, file_path, 0, file_path)
+            if extension in _JS_EXTENSIONS:
+                rank = _JS_EXTENSIONS.index(extension)
+                _offer(js_modules, stem, 1 + rank, file_path)
+                if name == f"index{extension}":
+                    _offer(js_modules, directory, 1 + len(_JS_EXTENSIONS) + rank, file_path)
+            if extension != ".py":
+                continue
+            _offer(py_paths, stem, 1, file_path)
+            if name == "__init__.py":
+                _offer(js_modules, directory, 1 + 2 * len(_JS_EXTENSIONS), file_path)
+                _offer(py_paths, directory, 2, file_path)
+            for root_rank, root in enumerate(roots):
+                if root is None or (root and not file_path.startswith(root + "/")):
+                    continue
+                module = stem[len(root) + 1:] if root else stem
+                is_package = name == "__init__.py"
+                if is_package:
+                    module = posixpath.dirname(module)
+                if module and "." not in module:
+                    _offer(py_modules, module.replace("/", "."), (root_rank, int(is_package)), file_path)
+        self._js_modules = {key: path for key, (_, path) in js_modules.items()}
+        self._py_paths = {key: path for key, (_, path) in py_paths.items()}
+        self._py_modules = {key: path for key, (_, path) in py_modules.items()}
+        self._go: Optional[GoResolver] = None
+        self._rust: Optional[RustResolver] = None
+        self._java: Optional[JavaResolver] = None
+        self._includes: Optional[IncludeResolver] = None
+        self._aliases: Optional[JsAliasResolver] = None
+        self._memo: Dict[Tuple[Tuple[str, str], str], Optional[str]] = {}
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def resolve(self, source_file: str, import_specifier: str) -> Optional[str]:
+        """The repo file import_specifier (imported by source_file) refers to, or None."""
+        key = (self.scope(source_file), import_specifier)
+        try:
+            resolved = self._memo[key]
+        except KeyError:
+            resolved = self._memo[key] = self._resolve(source_file, import_specifier)
+            self.memo_misses += 1
+        else:
+            self.memo_hits += 1
+        return resolved
+
+    @staticmethod
+    def scope(source_file: str) -> Tuple[str, str]:
+        """
+        Everything besides the specifier that a resolution from source_file
+        depends on: nothing for Go and Java, the file itself for Rust and
+        C/C++ (module layout, self-includes), its directory otherwise - kept
+        apart for JS/TS, whose bare specifiers also go through tsconfig
+        aliases, and everything else (Python).
+        """
+        if source_file.endswith((".go", ".java")):
+            return posixpath.splitext(source_file)[1], ""
+        if source_file.endswith(".rs") or is_c_family(source_file):
+            return "file", source_file
+        if source_file.endswith(_JS_EXTENSIONS):
+            return "js", posixpath.dirname(source_file)
+        return "dir", posixpath.dirname(source_file)
+
+    def _resolve(self, source_file: str, import_specifier: str) -> Optional[str]:
+        if source_file.endswith(".go"):
+            if self._go is None:
+                self._go = GoResolver.for_repository(self.repo_path, self.scanned_files)
+            return self._go.resolve(import_specifier)
+        if source_file.endswith(".rs"):
+            if self._rust is None:
+                self._rust = RustResolver.for_repository(self.repo_path, self.scanned_files)
+            return self._rust.resolve(source_file, import_specifier)
+        if source_file.endswith(".java"):
+            if self._java is None:
+                self._java = JavaResolver.for_repository(self.repo_path, self.scanned_files)
+            return self._java.resolve(import_specifier)
+        if is_c_family(source_file):
+            if self._includes is None:
+                self._includes = IncludeResolver.for_repository(self.repo_path, self.scanned_files)
+            return self._includes.resolve(source_file, import_specifier)
+
+        source_dir = posixpath.dirname(source_file)
+        if import_specifier.startswith("./") or import_specifier.startswith("../"):
+            base = _repo_directory(posixpath.join(source_dir, import_specifier))
+            return self._js_modules.get(base) if base is not None else None
+        if import_specifier.startswith("."):
+            module = import_specifier.lstrip(".")
+            target_dir = source_dir
+            for _ in range(len(import_specifier) - len(module) - 1):
+                if not target_dir:
+                    return None  # above the repository root
+                target_dir = posixpath.dirname(target_dir)
+            return self._py_paths.get(_join(target_dir, module.replace(".", "/")))
+        if source_file.endswith(_JS_EXTENSIONS) and import_specifier:
+            if self._aliases is None:
+                self._aliases = JsAliasResolver.for_repository(self.repo_path, self.scanned_files)
+            for base in self._aliases.candidates(source_file, import_specifier):
+                resolved = self._js_modules.get(base)
+                if resolved is not None:
+                    return resolved
+        return self._py_modules.get(import_specifier)
+
+
+def _offer(table: Dict[str, Tuple], key: str, rank: Union[int, Tuple[int, int]], file_path: str) -> None:
+    current = table.get(key)
+    if current is None or rank < current[0]:
+        table[key] = (rank, file_path)
+
+
+def _package_root_prefix(root: Union[str, Path], repo_path: Path) -> Optional[str]:
+    """A package root as a repo-relative prefix ("" = repo root), None if outside the repo."""
+    path = Path(root)
+    if path.is_absolute():
+        try:
+            path = path.relative_to(repo_path)
+        except ValueError:
+            return None
+    return _repo_directory(path.as_posix())
+
+
+_JSONC_RE = re.compile(r'("(?:[^"\\]|\\.)*")|//[^\n]*|/\*.*?\*/|,(?=\s*[}\]])', re.DOTALL)
+_JS_CONFIG_NAMES = ("tsconfig.json", "jsconfig.json")
+# package.json fields naming the entry file, in the order tried; source files first
+_PACKAGE_ENTRY_FIELDS = ("source", "module", "main", "types", "typings")
+
+
+class _PrefixTrie:
+    """Character trie returning the values of every key that prefixes a text."""
+
+    def __init__(self) -> None:
+        self._root: Dict = {}
+
+    def insert(self, key: str, value: object) -> None:
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(value)
+
+    def prefixes_of(self, text: str) -> List:
+        """Values whose key prefixes text, longest key first."""
+        found = []
+        node = self._root
+        if None in node:
+            found.append(node[None])
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            if None in node:
+                found.append(node[None])
+        return [value for values in reversed(found) for value in values]
+
+
+class _PathPattern(NamedTuple):
+    prefix: str
+    suffix: str
+    targets: Tuple[str, ...]  # repo-relative, "*" kept for substitution
+
+
+class _JsConfig(NamedTuple):
+    exact: Dict[str, Tuple[str, ...]]  # `paths` keys without a wildcard
+    patterns: _PrefixTrie  # wildcard `paths` keys by the text before "*"
+    base_url: Optional[str]  # repo-relative baseUrl directory
+
+
+class JsPackage(NamedTuple):
+    name: str
+    root: str  # repo-relative directory of its package.json
+    entries: Tuple[str, ...]  # repo-relative entry files from package.json
+
+
+class JsAliasResolver:
+    """Bare JS/TS specifier -> candidate repo path bases, for one scan of one repository."""
+
+    def __init__(self, configs: Mapping[str, _JsConfig], packages: Iterable[JsPackage]):
+        self._configs = dict(configs)
+        self._packages = _PrefixTrie()
+        self.packages: Dict[str, JsPackage] = {}
+        for package in sorted(packages, key=lambda p: p.root):
+            if package.name not in self.packages:
+                self.packages[package.name] = package
+                self._packages.insert(package.name, package)
+        self._nearest: Dict[str, Optional[_JsConfig]] = {}
+
+    @classmethod
+    def for_repository(cls, repo_path: Path, scanned_files: Iterable[str]) -> "JsAliasResolver":
+        """Read tsconfig.json / jsconfig.json and package.json of every directory enclosing JS/TS files."""
+        directories = sorted(_enclosing_directories(f for f in scanned_files if f.endswith(_JS_EXTENSIONS)))
+        packages: List[JsPackage] = []
+        for directory in directories:
+            manifest = _read_jsonc(repo_path, _join(directory, "package.json"))
+            if manifest is not None and isinstance(manifest.get("name"), str) and manifest["name"]:
+                entries = tuple(
+                    _join(directory, manifest[field])
+                    for field in _PACKAGE_ENTRY_FIELDS
+                    if isinstance(manifest.get(field), str)
+                )
+                packages.append(JsPackage(manifest["name"], directory, entries))
+        package_roots = {package.name: package.root for package in packages}
+
+        configs: Dict[str, _JsConfig] = {}
+        for directory in directories:
+            for name in _JS_CONFIG_NAMES:
+                options = _compiler_options(repo_path, _join(directory, name), package_roots, set())
+                if options is not None:
+                    configs[directory] = _compile_js_config(options)
+                    break
+        return cls(configs, packages)
+
+    def candidates(self, source_file: str, specifier: str) -> Iterable[str]:
+        """Repo path bases specifier may refer to, most specific first."""
+        config = self._nearest_config(posixpath.dirname(source_file))
+        if config is not None:
+            targets = config.exact.get(specifier)
+            if targets is not None:
+                yield from _normalized_bases(targets)
+            for pattern in config.patterns.prefixes_of(specifier):
+                star_end = len(specifier) - len(pattern.suffix)
+                if star_end >= len(pattern.prefix) and specifier.endswith(pattern.suffix):
+                    star = specifier[len(pattern.prefix):star_end]
+                    yield from _normalized_bases(target.replace("*", star) for target in pattern.targets)
+                    break  # TypeScript only tries the longest matching pattern
+            if config.base_url is not None:
+                yield from _normalized_bases([_join(config.base_url, specifier)])
+
+        for package in self._packages.prefixes_of(specifier):
+            rest = specifier[len(package.name):]
+            if rest and not rest.startswith("/"):
+                continue
+            if rest:
+                yield from _normalized_bases([_join(package.root, rest[1:]), _join(package.root, "src" + rest)])
+            else:
+                yield from _normalized_bases([*package.entries, _join(package.root, "src/index"), package.root])
+            break
+
+    def _nearest_config(self, directory: str) -> Optional[_JsConfig]:
+        if directory not in self._nearest:
+            config = self._configs.get(directory)
+            if config is None and directory:
+                config = self._nearest_config(posixpath.dirname(directory))
+            self._nearest[directory] = config
+        return self._nearest[directory]
+
+
+def _normalized_bases(paths: Iterable[str]) -> Iterable[str]:
+    for path in paths:
+        normalized = _repo_directory(path)
+        if normalized is not None:
+            yield normalized
+
+
+def _read_jsonc(repo_path: Path, file_path: str) -> Optional[Dict]:
+    """A JSON-with-comments file (tsconfig, package.json) as a dict, None if missing or invalid."""
+    try:
+        text = (repo_path / file_path).read_text(encoding="utf-8-sig", errors="ignore")
+    except OSError:
+        return None
+    try:
+        data = json.loads(_JSONC_RE.sub(lambda m: m.group(1) or "", text))
+    except ValueError as exc:
+        LOGGER.debug("Skipping unreadable %s: %s", file_path, exc)
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _compiler_options(
+    repo_path: Path,
+    config_path: str,
+    package_roots: Dict[str, str],
+    seen: Set[str],
+) -> Optional[Dict[str, object]]:
+    """
+    compilerOptions of config_path merged over its `extends` chain, with
+    baseUrl and the directory `paths` is relative to made repo-relative
+    ("baseUrl" / "pathsBase" keys). None if the file is missing.
+    """
+    if config_path in seen:
+        return {}
+    seen.add(config_path)
+    config = _read_jsonc(repo_path, config_path)
+    if config is None:
+        return None
+    directory = posixpath.dirname(config_path)
+
+    merged: Dict[str, object] = {}
+    extends = config.get("extends")
+    for parent in [extends] if isinstance(extends, str) else extends if isinstance(extends, list) else []:
+        parent_path = _extended_config_path(directory, str(parent), package_roots)
+        if parent_path is not None:
+            merged.update(_compiler_options(repo_path, parent_path, package_roots, seen) or {})
+
+    options = config.get("compilerOptions")
+    if isinstance(options, dict):
+        if isinstance(options.get("baseUrl"), str):
+            merged["baseUrl"] = _repo_directory(_join(directory, options["baseUrl"]))
+        if isinstance(options.get("paths"), dict):
+            merged["paths"] = options["paths"]
+            merged["pathsBase"] = directory
+    return merged
+
+
+def _extended_config_path(directory: str, parent: str, package_roots: Dict[str, str]) -> Optional[str]:
+    if parent.startswith("./") or parent.startswith("../"):
+        path = _repo_directory(_join(directory, parent))
+    else:
+        # "@org/tsconfig/base.json" or "@org/tsconfig" from a workspace package
+        name = next((n for n in sorted(package_roots, key=len, reverse=True)
+                     if parent == n or parent.startswith(n + "/")), None)
+        if name is None:
+            return None  # an npm package (e.g. @tsconfig/node18) outside the repo
+        rest = parent[len(name) + 1:] or "tsconfig.json"
+        path = _join(package_roots[name], rest)
+    if path is None:
+        return None
+    return path if path.endswith(".json") else path + ".json"
+
+
+def _compile_js_config(options: Dict[str, object]) -> _JsConfig:
+    base_url = options.get("baseUrl")
+    paths_base = base_url if base_url is not None else options.get("pathsBase", "")
+    exact: Dict[str, Tuple[str, ...]] = {}
+    patterns = _PrefixTrie()
+    for key, targets in (options.get("paths") or {}).items():
+        if not isinstance(targets, list):
+            continue
+        targets = tuple(_join(str(paths_base), str(target)) for target in targets if isinstance(target, str))
+        if "*" in key:
+            prefix, _, suffix = key.partition("*")
+            patterns.insert(prefix, _PathPattern(prefix, suffix, targets))
+        else:
+            exact[key] = targets
+    return _JsConfig(exact, patterns, base_url if isinstance(base_url, str) else None)
+
+
+_GO_MODULE_RE = re.compile(r"^module\s+\"?([^\s\"]+)\"?", re.MULTILINE)
+# `replace example.com/x => ./x` (single line or inside a replace ( ... ) block);
+# only replacements pointing at a local directory matter here.
+_GO_REPLACE_RE = re.compile(
+    r"^\s*(?:replace\s+)?([^\s()]+)(?:\s+v[^\s]+)?\s+=>\s+(\.{1,2}/[^\s]*|\.{1,2})\s*$",
+    re.MULTILINE,
+)
+
+
+class GoModule(NamedTuple):
+    path: str  # module path from go.mod, e.g. "github.com/org/repo"
+    root: str  # repo-relative directory of the module ("" for the repo root)
+
+
+class GoResolver:
+    """Go import path -> repo file, for one scan of one repository."""
+
+    def __init__(self, modules: Iterable[GoModule], scanned_files: Iterable[str]):
+        # Longest module path first, so nested modules win over their parents.
+        self.modules: List[GoModule] = sorted(set(modules), key=lambda m: (-len(m.path), m.path))
+        files_by_dir: Dict[str, List[str]] = {}
+        for file_path in scanned_files:
+            if file_path.endswith(".go"):
+                files_by_dir.setdefault(posixpath.dirname(file_path), []).append(file_path)
+        self._packages = {
+            directory: _representative_go_file(directory, files)
+            for directory, files in files_by_dir.items()
+        }
+
+    @classmethod
+    def for_repository(cls, repo_path: Path, scanned_files: Iterable[str]) -> "GoResolver":
+        """Read the go.mod of every directory that holds or encloses Go files."""
+        scanned_files = list(scanned_files)
+        modules: List[GoModule] = []
+        for directory in sorted(_enclosing_directories(f for f in scanned_files if f.endswith(".go"))):
+            go_mod = repo_path / directory / "go.mod"
+            try:
+                text = go_mod.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            modules.extend(_parse_go_mod(text, directory))
+        return cls(modules, scanned_files)
+
+    def resolve(self, import_path: str) -> Optional[str]:
+        """The representative file of the imported package, or None if it is external."""
+        for module in self.modules:
+            if import_path == module.path:
+                rest = ""
+            elif import_path.startswith(module.path + "/"):
+                rest = import_path[len(module.path) + 1:]
+            else:
+                continue
+            directory = posixpath.normpath(posixpath.join(module.root, rest)) if rest or module.root else ""
+            directory = "" if directory == "." else directory
+            resolved = self._packages.get(directory)
+            if resolved is not None:
+                return resolved
+        return None
+
+
+def _parse_go_mod(text: str, directory: str) -> List[GoModule]:
+    match = _GO_MODULE_RE.search(text)
+    if match is None:
+        LOGGER.debug("go.mod in %r has no module directive", directory)
+        return []
+    modules = [GoModule(match.group(1), directory)]
+    for replaced, target in _GO_REPLACE_RE.findall(text):
+        root = posixpath.normpath(posixpath.join(directory, target))
+        if root != ".." and not root.startswith("../"):
+            modules.append(GoModule(replaced, "" if root == "." else root))
+    return modules
+
+
+def _representative_go_file(directory: str, files: List[str]) -> str:
+    """
+    The file edges into a package point at: <dir>/<dir name>.go, else doc.go,
+    else the first non-test file, else the first file (all sorted).
+    """
+    files = sorted(files)
+    name = posixpath.basename(directory)
+    for preferred in (f"{name}.go", "doc.go"):
+        candidate = posixpath.join(directory, preferred)
+        if candidate in files:
+            return candidate
+    non_test = [f for f in files if not f.endswith("_test.go")]
+    return (non_test or files)[0]
+
+
+_RUST_ROOT_DIRS = {"tests", "examples", "benches"}
+_RUST_STD_CRATES = {"std", "core", "alloc", "proc_macro", "test"}
+_CARGO_DEPENDENCY_TABLES = ("dependencies", "dev-dependencies", "build-dependencies")
+
+
+class RustCrate(NamedTuple):
+    name: str  # crate name as written in paths (hyphens become underscores)
+    root: str  # repo-relative package directory ("" for the repo root)
+    lib: Optional[str]  # library root file, if the package has one
+    # path-dependency name -> package directory of the crate it names
+    dependencies: Dict[str, str]
+
+
+class _RustFile(NamedTuple):
+    crate: Optional[RustCrate]
+    is_root: bool  # a crate root: lib.rs, main.rs, a bin, test, example or bench target
+    module_dir: str  # where this module's child modules live
+    root_dir: str  # module_dir of the crate root this file belongs to
+
+
+class RustResolver:
+    """Rust use/mod path -> repo file, for one scan of one repository."""
+
+    def __init__(self, crates: Iterable[RustCrate], scanned_files: Iterable[str]):
+        # Deepest package first, so a file belongs to its innermost crate.
+        self.crates: List[RustCrate] = sorted(crates, key=lambda c: (-len(c.root), c.root))
+        self._crates_by_root = {crate.root: crate for crate in self.crates}
+        self._crates_by_name = {crate.name: crate for crate in reversed(self.crates)}
+        self._files: Dict[str, _RustFile] = {}
+        # module directory -> defining file; a crate's src dir maps to lib.rs, else main.rs
+        self._modules: Dict[str, str] = {}
+        for file_path in sorted(f for f in scanned_files if f.endswith(".rs")):
+            info = self._files[file_path] = self._describe(file_path)
+            if not info.is_root or posixpath.basename(file_path) in ("lib.rs", "main.rs"):
+                self._modules.setdefault(info.module_dir, file_path)
+
+    @classmethod
+    def for_repository(cls, repo_path: Path, scanned_files: Iterable[str]) -> "RustResolver":
+        """Read the Cargo.toml of every directory that holds or encloses Rust files."""
+        scanned_files = list(scanned_files)
+        manifests: Dict[str, Dict] = {}
+        for directory in sorted(_enclosing_directories(f for f in scanned_files if f.endswith(".rs"))):
+            try:
+                with open(repo_path / directory / "Cargo.toml", "rb") as handle:
+                    manifests[directory] = tomllib.load(handle)
+            except OSError:
+                continue
+            except tomllib.TOMLDecodeError as exc:
+                LOGGER.debug("Skipping unreadable Cargo.toml in %r: %s", directory, exc)
+
+        scanned = set(scanned_files)
+        crates = [
+            _rust_crate(directory, manifest, manifests, scanned)
+            for directory, manifest in manifests.items()
+            if isinstance(manifest.get("package"), dict)
+        ]
+        return cls(crates, scanned_files)
+
+    def resolve(self, source_file: str, path: str) -> Optional[str]:
+        """The file defining the module path refers to, or None if it is external."""
+        segments = [segment for segment in path.split("::") if segment]
+        info = self._files.get(source_file)
+        if not segments or info is None:
+            return None
+        head, rest = segments[0], segments[1:]
+
+        if head in ("crate", "self", "super"):
+            base = info.root_dir if head == "crate" else info.module_dir
+            if head == "super":
+                base = posixpath.dirname(base)
+                while rest and rest[0] == "super":
+                    base, rest = posixpath.dirname(base), rest[1:]
+                if not _within(base, info.root_dir):
+                    return None
+            resolved = self._lookup(base, rest) or self._modules.get(base)
+            if resolved is None and head == "crate" and info.is_root:
+                resolved = source_file
+        else:
+            # 2018 uniform paths: a child module (e.g. from `mod foo;`) shadows crates.
+            resolved = self._lookup(info.module_dir, segments)
+            if resolved is None:
+                target = self._dependency_crate(info.crate, head)
+                if target is None or target.lib is None:
+                    return None
+                resolved = self._lookup(posixpath.dirname(target.lib), rest) or target.lib
+        return resolved if resolved != source_file else None
+
+    def _lookup(self, base: str, segments: List[str]) -> Optional[str]:
+        # Longest module prefix: crate::models::User -> module crate::models.
+        for end in range(len(segments), 0, -1):
+            resolved = self._modules.get(_join(base, "/".join(segments[:end])))
+            if resolved is not None:
+                return resolved
+        return None
+
+    def _dependency_crate(self, crate: Optional[RustCrate], name: str) -> Optional[RustCrate]:
+        if name in _RUST_STD_CRATES:
+            return None
+        if crate is not None and name in crate.dependencies:
+            return self._crates_by_root.get(crate.dependencies[name])
+        return self._crates_by_name.get(name)
+
+    def _describe(self, file_path: str) -> _RustFile:
+        crate = next((c for c in self.crates if _within(file_path, c.root)), None)
+        root = crate.root if crate is not None else ""
+        relative = file_path[len(root) + 1:] if root else file_path
+        parts = relative.split("/")
+        directory, name = posixpath.split(file_path)
+
+        is_root = (
+            relative in ("src/lib.rs", "src/main.rs", "build.rs")
+            or (parts[:2] == ["src", "bin"] and (len(parts) == 3 or (len(parts) == 4 and name == "main.rs")))
+            or (len(parts) == 2 and parts[0] in _RUST_ROOT_DIRS)
+        )
+        if is_root or name in ("mod.rs", "lib.rs", "main.rs"):
+            module_dir = directory
+        else:
+            module_dir = _join(directory, name[:-3])
+
+        if parts[:2] == ["src", "bin"] and len(parts) > 3:
+            root_dir = _join(root, "/".join(parts[:3]))
+        elif parts[0] == "src" and len(parts) > 1:
+            root_dir = _join(root, "src/bin" if parts[1] == "bin" else "src")
+        elif parts[0] in _RUST_ROOT_DIRS and len(parts) > 1:
+            root_dir = _join(root, parts[0])
+        else:
+            root_dir = directory
+        return _RustFile(crate, is_root, module_dir, root_dir)
+
+
+def _rust_crate(directory: str, manifest: Dict, manifests: Dict[str, Dict], scanned: Set[str]) -> RustCrate:
+    package = manifest["package"]
+    lib_section = manifest.get("lib") if isinstance(manifest.get("lib"), dict) else {}
+    name = str(lib_section.get("name") or package.get("name") or posixpath.basename(directory))
+    lib = posixpath.normpath(_join(directory, str(lib_section.get("path", "src/lib.rs"))))
+
+    workspace_deps: Dict = {}
+    workspace_dir = _nearest_workspace(directory, manifests)
+    if workspace_dir is not None:
+        workspace_deps = manifests[workspace_dir]["workspace"].get("dependencies", {})
+
+    dependencies: Dict[str, str] = {}
+    for table in _CARGO_DEPENDENCY_TABLES:
+        for dep_name, spec in (manifest.get(table) or {}).items():
+            if not isinstance(spec, dict):
+                continue
+            base = directory
+            if spec.get("workspace") is True and workspace_dir is not None:
+                spec, base = workspace_deps.get(dep_name, {}), workspace_dir
+            if isinstance(spec, dict) and "path" in spec:
+                target = posixpath.normpath(_join(base, str(spec["path"])))
+                dependencies[dep_name.replace("-", "_")] = "" if target == "." else target
+
+    return RustCrate(name.replace("-", "_"), directory, lib if lib in scanned else None, dependencies)
+
+
+def _nearest_workspace(directory: str, manifests: Dict[str, Dict]) -> Optional[str]:
+    while True:
+        manifest = manifests.get(directory)
+        if manifest is not None and isinstance(manifest.get("workspace"), dict):
+            return directory
+        if not directory:
+            return None
+        directory = posixpath.dirname(directory)
+
+
+_JAVA_COMMENT_RE = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_JAVA_PACKAGE_RE = re.compile(r"^\s*package\s+([\w.]+)\s*;", re.MULTILINE)
+
+
+class JavaResolver:
+    """Java import name -> repo file, for one scan of one repository."""
+
+    def __init__(self, file_packages: Mapping[str, str]):
+        # file_packages: .java file -> its declared package ("" = default package)
+        self._types: Dict[str, str] = {}
+        # package -> first file of the package, the target of `import pkg.*`
+        self._packages: Dict[str, str] = {}
+        for file_path in sorted(file_packages):
+            name = posixpath.basename(file_path)[:-len(".java")]
+            if name in ("package-info", "module-info"):
+                continue  # declare no types
+            package = file_packages[file_path]
+            self._types.setdefault(f"{package}.{name}" if package else name, file_path)
+            self._packages.setdefault(package, file_path)
+
+    @classmethod
+    def for_repository(cls, repo_path: Path, scanned_files: Iterable[str]) -> "JavaResolver":
+        """Read the package declaration (only the header) of every .java file."""
+        file_packages: Dict[str, str] = {}
+        for file_path in scanned_files:
+            if not file_path.endswith(".java"):
+                continue
+            try:
+                header = file_io.read_header(repo_path / file_path, "java")
+            except OSError:
+                continue
+            match = _JAVA_PACKAGE_RE.search(_JAVA_COMMENT_RE.sub("", header))
+            file_packages[file_path] = match.group(1) if match else ""
+        return cls(file_packages)
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        The file declaring the imported type, or for `pkg.*` one file of the
+        package; None if it is not in the repository. Nested types and
+        static members (a.b.C.Inner, a.b.C.member, a.b.C.*) resolve to C.
+        """
+        if name.endswith(".*"):
+            name = name[:-2]
+            resolved = self._packages.get(name)
+            if resolved is not None:
+                return resolved
+        while name:
+            resolved = self._types.get(name)
+            if resolved is not None:
+                return resolved
+            name = name.rpartition(".")[0]
+        return None
+
+
+_C_FAMILY_LANGUAGES = {"c", "cpp"}
+_CMAKE_COMMENT_RE = re.compile(r"#[^\n]*")
+_CMAKE_INCLUDE_DIRS_RE = re.compile(r"\b(target_)?include_directories\s*\(([^)]*)\)", re.IGNORECASE)
+_CMAKE_ARGUMENT_RE = re.compile(r'"([^"]*)"|([^\s"]+)')
+_CMAKE_KEYWORDS = {"SYSTEM", "BEFORE", "AFTER", "PUBLIC", "PRIVATE", "INTERFACE"}
+_CMAKE_VARIABLE_RE = re.compile(r"\$\{(\w+)\}")
+_INCLUDE_FLAGS = ("-I", "-isystem", "-iquote", "-idirafter", "/I")
+
+
+class IncludeResolver:
+    """C/C++ #include target -> repo file, for one scan of one repository."""
+
+    def __init__(self, include_dirs: Iterable[str], scanned_files: Iterable[str]):
+        # Explicit build-system directories first (their order is the search order).
+        self.include_dirs: List[str] = list(dict.fromkeys(include_dirs))
+        self._dir_rank = {directory: rank for rank, directory in enumerate(self.include_dirs)}
+        self._files: Set[str] = set()
+        # every path suffix ("b.h", "a/b.h", "src/a/b.h") -> files ending in it
+        self._by_suffix: Dict[str, List[str]] = {}
+        for file_path in sorted(scanned_files):
+            if not is_c_family(file_path):
+                continue
+            self._files.add(file_path)
+            parts = file_path.split("/")
+            for start in range(len(parts)):
+                self._by_suffix.setdefault("/".join(parts[start:]), []).append(file_path)
+
+    @classmethod
+    def for_repository(cls, repo_path: Path, scanned_files: Iterable[str]) -> "IncludeResolver":
+        """Collect include directories from CMakeLists.txt, compile_commands.json and include/ dirs."""
+        scanned_files = [f for f in scanned_files if is_c_family(f)]
+        include_dirs = _cmake_include_dirs(repo_path, scanned_files)
+        include_dirs += _compile_commands_include_dirs(repo_path, scanned_files)
+        for file_path in scanned_files:
+            parts = file_path.split("/")[:-1]
+            include_dirs.extend("/".join(parts[:i + 1]) for i, part in enumerate(parts) if part == "include")
+        return cls(include_dirs, scanned_files)
+
+    def resolve(self, source_file: str, include: str) -> Optional[str]:
+        """
+        The included file, or None if it is not in the repository. Quoted and
+        angle includes are treated alike: the including file's directory
+        first, then include directories in order, then - when no build
+        metadata covers it - the matching file nearest to source_file.
+        """
+        include = posixpath.normpath(include.strip())
+        if include.startswith("/"):
+            # An absolute path (#include "/usr/include/x.h") is outside the repository.
+            return None
+        source_dir = posixpath.dirname(source_file)
+        if include.startswith("../") or include in (".", ".."):
+            resolved = posixpath.normpath(_join(source_dir, include))
+            return resolved if resolved in self._files and resolved != source_file else None
+
+        best: Optional[Tuple] = None
+        for candidate in self._by_suffix.get(include, ()):
+            if candidate == source_file:
+                continue
+            base = candidate[:-len(include)].rstrip("/")
+            if base == source_dir:
+                key: Tuple = (0, 0, 0, candidate)
+            elif base in self._dir_rank:
+                key = (1, self._dir_rank[base], 0, candidate)
+            else:
+                key = (2, 0, -len(_common_directory(candidate, source_file)), candidate)
+            if best is None or key < best:
+                best = key
+        return best[-1] if best is not None else None
+
+
+def is_c_family(file_path: str) -> bool:
+    return EXTENSION_LANGUAGE_MAP.get(posixpath.splitext(file_path)[1].lower()) in _C_FAMILY_LANGUAGES
+
+
+def _cmake_include_dirs(repo_path: Path, scanned_files: List[str]) -> List[str]:
+    cmake_dirs: Dict[str, str] = {}
+    for directory in sorted(_enclosing_directories(scanned_files)):
+        try:
+            cmake_dirs[directory] = (repo_path / directory / "CMakeLists.txt").read_text(
+                encoding="utf-8", errors="ignore"
+            )
+        except OSError:
+            continue
+
+    include_dirs: List[str] = []
+    for directory, text in cmake_dirs.items():
+        top = directory
+        parent = directory
+        while parent:
+            parent = posixpath.dirname(parent)
+            if parent in cmake_dirs:
+                top = parent
+        variables = {
+            "CMAKE_CURRENT_SOURCE_DIR": directory,
+            "CMAKE_CURRENT_LIST_DIR": directory,
+            "PROJECT_SOURCE_DIR": top,
+            "CMAKE_SOURCE_DIR": top,
+        }
+        for target, arguments in _CMAKE_INCLUDE_DIRS_RE.findall(_CMAKE_COMMENT_RE.sub("", text)):
+            values = [quoted or bare for quoted, bare in _CMAKE_ARGUMENT_RE.findall(arguments)]
+            for value in values[1:] if target else values:
+                resolved = _cmake_directory(value, directory, variables)
+                if resolved is not None:
+                    include_dirs.append(resolved)
+    return include_dirs
+
+
+def _cmake_directory(value: str, directory: str, variables: Dict[str, str]) -> Optional[str]:
+    if value in _CMAKE_KEYWORDS:
+        return None
+    if value.startswith("$<"):
+        # Only the build-tree half of $<BUILD_INTERFACE:...> names a source directory.
+        if not value.startswith("$<BUILD_INTERFACE:") or not value.endswith(">"):
+            return None
+        value = value[len("$<BUILD_INTERFACE:"):-1]
+    unknown = False
+
+    def substitute(match: "re.Match[str]") -> str:
+        nonlocal unknown
+        name = match.group(1)
+        if name in variables:
+            return "/" + variables[name] if variables[name] else "/"
+        if name.endswith("_SOURCE_DIR"):
+            return "/" + variables["PROJECT_SOURCE_DIR"] if variables["PROJECT_SOURCE_DIR"] else "/"
+        unknown = True
+        return ""
+
+    value = _CMAKE_VARIABLE_RE.sub(substitute, value)
+    if unknown or not value or "$" in value:
+        return None
+    # Variables expand to repo-rooted paths ("/<dir>"); anything else is relative to this CMakeLists.txt.
+    joined = value.lstrip("/") if value.startswith("/") else _join(directory, value)
+    return _repo_directory(joined)
+
+
+def _compile_commands_include_dirs(repo_path: Path, scanned_files: List[str]) -> List[str]:
+    scanned = set(scanned_files)
+    include_dirs: List[str] = []
+    seen_commands: Set[str] = set()
+    for database in [repo_path / "compile_commands.json", *sorted(repo_path.glob("*/compile_commands.json"))]:
+        try:
+            entries = json.loads(database.read_text(encoding="utf-8", errors="ignore"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(entries, list):
+            continue
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            arguments = entry.get("arguments")
+            if not isinstance(arguments, list):
+                try:
+                    arguments = shlex.split(str(entry.get("command", "")))
+                except ValueError:
+                    continue
+            # Databases repeat the same flags for every translation unit.
+            key = "\0".join([str(entry.get("directory", "")), *map(str, arguments)])
+            if key in seen_commands:
+                continue
+            seen_commands.add(key)
+            roots = _compile_roots(repo_path, entry, scanned)
+            for value in _include_flag_values(arguments):
+                absolute = os.path.normpath(os.path.join(str(entry.get("directory", "")), value))
+                for root in roots:
+                    if absolute == root or absolute.startswith(root + "/"):
+                        include_dirs.append(absolute[len(root) + 1:])
+                        break
+    return include_dirs
+
+
+def _compile_roots(repo_path: Path, entry: Dict, scanned: Set[str]) -> List[str]:
+    """Where the repository was on the machine that wrote the database."""
+    roots = [str(repo_path)]
+    source = os.path.normpath(os.path.join(str(entry.get("directory", "")), str(entry.get("file", ""))))
+    parts = source.split("/")
+    for start in range(1, len(parts)):
+        if "/".join(parts[start:]) in scanned:
+            if start > 1:
+                roots.append("/".join(parts[:start]))
+            break
+    return roots
+
+
+def _include_flag_values(arguments: List[str]) -> List[str]:
+    values: List[str] = []
+    arguments = iter(str(argument) for argument in arguments)
+    for argument in arguments:
+        for flag in _INCLUDE_FLAGS:
+            if argument == flag:
+                values.append(next(arguments, ""))
+            elif argument.startswith(flag):
+                values.append(argument[len(flag):])
+            else:
+                continue
+            break
+    return [value for value in values if value]
+
+
+def _repo_directory(path: str) -> Optional[str]:
+    normalized = posixpath.normpath(path) if path else "."
+    if normalized == ".." or normalized.startswith("../"):
+        return None
+    return "" if normalized == "." else normalized
+
+
+def _common_directory(a: str, b: str) -> str:
+    return posixpath.commonpath([posixpath.dirname(a), posixpath.dirname(b)])
+
+
+def _enclosing_directories(file_paths: Iterable[str]) -> Set[str]:
+    directories = {""}
+    for file_path in file_paths:
+        directory = posixpath.dirname(file_path)
+        while directory and directory not in directories:
+            directories.add(directory)
+            directory = posixpath.dirname(directory)
+    return directories
+
+
+def _join(base: str, rest: str) -> str:
+    if not base:
+        return rest
+    return f"{base}/{rest}" if rest else base
+
+
+def _within(path: str, root: str) -> bool:
+    return not root or path == root or path.startswith(root + "/")
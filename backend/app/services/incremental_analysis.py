@@ -0,0 +1,206 @@
+"""
+Incremental re-analysis after new commits land in an existing clone.
+
+analysis_state_store records the commit every final_state was saved at. When
+HEAD moves, `git diff --name-status` between the two commits tells us exactly
+which paths changed, so the scan result, inspected facts and dependency edges
+can be patched in place instead of re-running the snapshot and agent loop.
+Anything we cannot diff (unknown commit after a force-push, non-git path)
+falls back to the normal full pipeline.
+"""
+import logging
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.services.analysis_snapshot_service import (
+    _compute_dependency_graph_summary,
+    _copy_state,
+    _detect_python_package_roots,
+    _fact_from_inspected,
+    _inspect_file,
+    _record_dependency_edge,
+    _refresh_candidates_for_signal,
+)
+from app.services.analysis_state_store import (
+    _get_git_commit_hash,
+    load_state_payload,
+    save_state,
+)
+from app.services.import_indexer import (
+    index_repository_imports,
+    merge_dependency_edges,
+    prune_dependency_edges,
+)
+from app.services.repo_metadata import extract_repo_metadata
+from app.services.repo_scanner import apply_file_changes
+from app.services.scan_cache import (
+    get_scan_result,
+    invalidate_scan_cache,
+    peek_scan_result,
+    seed_scan_result,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def changed_files_between(
+    repo_path: Path,
+    old_commit: str,
+    new_commit: str,
+) -> Optional[Tuple[List[str], List[str]]]:
+    """
+    Return (changed, deleted) repo-relative paths between two commits, or None
+    if git cannot diff them. Renames are reported as a delete plus an add.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "git", "-C", str(repo_path), "diff", "--name-status", "-z",
+                "--no-renames", old_commit, new_commit,
+            ],
+            capture_output=True,
+            timeout=30,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    if result.returncode != 0:
+        return None
+
+    changed: List[str] = []
+    deleted: List[str] = []
+    fields = result.stdout.split(b"\0")
+    for status, raw_path in zip(fields[0::2], fields[1::2]):
+        if not status:
+            continue
+        path = raw_path.decode("utf-8", errors="surrogateescape")
+        if status.startswith(b"D"):
+            deleted.append(path)
+        else:
+            changed.append(path)
+    return changed, deleted
+
+
+def rescan_after_pull(repo_path: Path, old_commit: Optional[str], new_commit: Optional[str]) -> None:
+    """
+    Bring the scan cache up to date after a pull: patch the previous scan with
+    the diff when possible, otherwise drop it so the next lookup rescans.
+    """
+    previous = peek_scan_result(repo_path)
+    diff = None
+    if previous is not None and old_commit and new_commit:
+        diff = changed_files_between(repo_path, old_commit, new_commit)
+
+    if diff is None:
+        invalidate_scan_cache(repo_path)
+        return
+
+    changed, deleted = diff
+    seed_scan_result(repo_path, apply_file_changes(previous, changed, deleted, repo_path))
+    LOGGER.info(
+        "Patched scan for %s: %d changed, %d deleted path(s)",
+        repo_path, len(changed), len(deleted),
+    )
+
+
+def refresh_cached_state(repo_id: str, local_path: str, cache_dir: Path) -> Optional[Dict]:
+    """
+    Load the saved final_state for repo_id and bring it forward to the current
+    HEAD by re-inspecting only the files that changed since it was saved.
+
+    Returns None when there is no saved state or the saved commit cannot be
+    diffed against HEAD — the caller should then run a full analysis.
+    """
+    payload = load_state_payload(repo_id, cache_dir)
+    if payload is None or not payload.get("final_state"):
+        return None
+
+    final_state = payload["final_state"]
+    saved_hash = payload.get("commit_hash")
+    current_hash = _get_git_commit_hash(local_path)
+    if not saved_hash or not current_hash or saved_hash == current_hash:
+        return final_state
+
+    diff = changed_files_between(Path(local_path), saved_hash, current_hash)
+    if diff is None:
+        LOGGER.info("Cannot diff %s..%s for %s; full re-analysis needed", saved_hash, current_hash, repo_id)
+        return None
+
+    changed, deleted = diff
+    updated = apply_changes_to_state(final_state, changed, deleted)
+    save_state(repo_id=repo_id, local_path=local_path, final_state=updated, cache_dir=cache_dir)
+    return updated
+
+
+def apply_changes_to_state(state: Dict, changed: Iterable[str], deleted: Iterable[str]) -> Dict:
+    """
+    Return a copy of state updated for the given changed/deleted paths.
+
+    Explored files that changed are re-inspected (fact + dependency edge
+    replaced); deleted files are dropped everywhere they appear. Summary
+    counters, repo type, top-level directories, package roots, candidates
+    and the graph summary are then recomputed from the (cached) scan.
+    """
+    next_state = _copy_state(state)
+    repo_path = Path(next_state["current_summary"]["local_path"]).resolve()
+    deleted_set: Set[str] = set(deleted)
+    changed_set: Set[str] = set(changed) - deleted_set
+
+    facts_by_path = {fact["file_path"]: fact for fact in next_state["inspected_facts"]}
+    for file_path in sorted(changed_set & facts_by_path.keys()):
+        inspected = _inspect_file(next_state, file_path)
+        if inspected is None:
+            deleted_set.add(file_path)
+            continue
+        facts_by_path[file_path].update(_fact_from_inspected(inspected))
+        _record_dependency_edge(next_state, inspected)
+
+    next_state["explored_files"] = [
+        f for f in next_state["explored_files"] if f not in deleted_set
+    ]
+    next_state["inspected_facts"] = [
+        fact for fact in next_state["inspected_facts"] if fact["file_path"] not in deleted_set
+    ]
+    next_state["dependency_edges"] = [
+        edge for edge in next_state["dependency_edges"] if edge["source"] not in deleted_set
+    ]
+
+    # Saved states only keep the edges of explored files (older ones may
+    # still carry bulk-indexed edges for the rest of the repo).
+    prune_dependency_edges(next_state)
+
+    scan_result = get_scan_result(repo_path)
+    metadata = extract_repo_metadata(repo_path, scan_result)
+    summary = next_state["current_summary"]
+    summary["file_count"] = scan_result["file_count"]
+    summary["languages"] = scan_result["languages"]
+    summary["repo_type"] = metadata["repo_type"]
+    # Same sources as the snapshot plus _refine_summary: known top-level
+    # directories on disk, and those of files the analysis still has facts for.
+    summary["top_level_dirs"] = sorted(
+        set(metadata["top_level_dirs"])
+        | {
+            fact["file_path"].split("/", 1)[0]
+            for fact in next_state["inspected_facts"]
+            if "/" in fact["file_path"]
+        }
+    )
+    summary["language_breakdown"] = metadata["language_breakdown"]
+    summary["language_breakdown_bytes"] = metadata["language_breakdown_bytes"]
+    summary["language_breakdown_lines"] = metadata["language_breakdown_lines"]
+    summary["entry_points"] = sorted(
+        {e for e in summary.get("entry_points", []) if e not in deleted_set}
+        | set(metadata["entry_points"])
+    )
+    next_state["package_roots"] = _detect_python_package_roots(repo_path, scan_result["files"])
+
+    _refresh_candidates_for_signal(next_state, limit=8)
+    # Like the agent loop, summarise the whole-repo graph when bulk indexing
+    # is on; unchanged files are served from the file index.
+    graph_state = next_state
+    if settings.IMPORT_INDEX_ENABLED:
+        graph_state = dict(next_state)
+        merge_dependency_edges(graph_state, index_repository_imports(repo_path))
+    next_state["dependency_graph_summary"] = _compute_dependency_graph_summary(graph_state)
+    return next_state
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 from collections import Counter
 
 # Heuristic entry-point filenames (language-agnostic)
@@ -36,7 +36,9 @@ def extract_repo_metadata(repo_path: Path, scan_result: Dict) -> Dict:
     Returns:
         {
             "top_level_dirs": [...],
-            "language_breakdown": {...},
+            "language_breakdown": {...},        # files per language
+            "language_breakdown_bytes": {...},  # bytes per language
+            "language_breakdown_lines": {...},  # lines per language ({} unless the scan counted lines)
             "entry_points": [...],
             "repo_type": str
         }
@@ -54,7 +56,10 @@ def extract_repo_metadata(repo_path: Path, scan_result: Dict) -> Dict:
             top_level_dirs.add(item.name)
 
     # ---- Language breakdown (generic, data-driven) ----
+    # All three weightings come from the scan itself; nothing is re-read here.
     language_breakdown = Counter(file_languages.values())
+    language_bytes = scan_result.get("language_bytes", {})
+    language_lines = scan_result.get("language_lines", {})
 
     # ---- Entry point detection ----
     entry_points: List[str] = []
@@ -73,11 +78,25 @@ def extract_repo_metadata(repo_path: Path, scan_result: Dict) -> Dict:
     return {
         "top_level_dirs": sorted(top_level_dirs),
         "language_breakdown": dict(language_breakdown),
+        "language_breakdown_bytes": dict(language_bytes),
+        "language_breakdown_lines": dict(language_lines),
         "entry_points": sorted(entry_points),
         "repo_type": repo_type,
     }
 
 
+def dominant_language(metadata: Dict) -> Optional[str]:
+    """
+    Language with the most code: by lines when the scan counted them, else by
+    bytes, else by file count. Ties break alphabetically.
+    """
+    for key in ("language_breakdown_lines", "language_breakdown_bytes", "language_breakdown"):
+        breakdown = metadata.get(key) or {}
+        if sum(breakdown.values()) > 0:
+            return sorted(breakdown.items(), key=lambda item: (-item[1], item[0]))[0][0]
+    return None
+
+
 def classify_repo_type(
     *,
     languages: List[str],
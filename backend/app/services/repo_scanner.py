@@ -1,17 +1,19 @@
+import itertools
+import logging
+import os
+import subprocess
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Set
-
-# Directories we never want to scan
-IGNORE_DIRS = {
-    ".git",
-    "node_modules",
-    "venv",
-    "__pycache__",
-    "dist",
-    "build",
-    ".idea",
-    ".vscode",
-}
+from typing import Dict, Generator, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.services import file_io
+from app.services.file_index import get_file_index
+from app.services.ignore_rules import NOISE_RULES, IgnoreRules
+from app.services.scan_table import ScanColumn, ScanFileList, ScanTable
+
+LOGGER = logging.getLogger(__name__)
 
 # File extensions → language mapping
 # This is the SINGLE source of truth for language detection
@@ -20,59 +22,435 @@ EXTENSION_LANGUAGE_MAP = {
     ".js": "javascript",
     ".jsx": "javascript",
     ".ts": "typescript",
+    ".tsx": "typescript",
     ".java": "java",
     ".cpp": "cpp",
+    ".cc": "cpp",
+    ".cxx": "cpp",
     ".hpp": "cpp",
+    ".hh": "cpp",
+    ".hxx": "cpp",
     ".c": "c",
     ".h": "c",
     ".rs": "rust",
     ".go": "go",
 }
 
+# Valid values for settings.SCANNER_BACKEND / the backend argument
+SCANNER_BACKENDS = {"auto", "git", "filesystem"}
+
+
+class RepoFile(NamedTuple):
+    relative_path: str
+    language: str
+    size: int
 
-def scan_repository(repo_path: Path) -> Dict:
+
+def scan_repository(
+    repo_path: Path,
+    backend: Optional[str] = None,
+    workers: int = 1,
+    count_lines: Optional[bool] = None,
+) -> Dict:
     """
     Walk a cloned repository and extract a structured view of its contents.
 
+    A thin consumer of iter_repository_files; see there for backend/workers.
+    Byte sizes come from the same listing. With count_lines (defaults to
+    settings.SCANNER_COUNT_LINES) line counts are taken from the repo's
+    persistent file index while a file's (size, mtime) fingerprint is
+    unchanged; only the other files are read, and their counts are stored
+    back. The directory walk itself is never repeated.
+
+    The per-file entries are read-only list/dict views over one compact
+    ScanTable (see app.services.scan_table); "files".table exposes it.
+
     Returns:
         {
             "repo": "<repo_name>",
             "languages": [...],
             "file_count": int,
             "files": [...],
-            "file_languages": { "<relative_path>": "<language>" }
+            "file_languages": { "<relative_path>": "<language>" },
+            "file_sizes": { "<relative_path>": bytes },
+            "language_bytes": { "<language>": bytes },
+            # only when count_lines:
+            "file_line_counts": { "<relative_path>": lines },
+            "language_lines": { "<language>": lines },
         }
     """
+    if count_lines is None:
+        count_lines = settings.SCANNER_COUNT_LINES
+
+    # Sorted so every backend/walker yields an identical result.
+    records = sorted(iter_repository_files(repo_path, backend, workers))
+    line_counts = _line_counts(repo_path, records) if count_lines else None
+    return _scan_result(repo_path.name, ScanTable(records, line_counts))
+
+
+def iter_repository_files(
+    repo_path: Path,
+    backend: Optional[str] = None,
+    workers: int = 1,
+) -> Iterator[RepoFile]:
+    """
+    Yield a RepoFile(relative_path, language, size) for every source file as
+    soon as it is found, in no particular order.
+
+    backend selects how files are listed (defaults to settings.SCANNER_BACKEND):
+        "git"        — tracked files from the git index (respects .gitignore)
+        "filesystem" — os.scandir walk of the working tree
+        "auto"       — git for checkouts, filesystem for everything else
+    The git backend falls back to the filesystem walk if git is unavailable.
+
+    Both backends apply the same IgnoreRules: built-in noise directories and
+    minified bundles, the repo's override file, the max file size and the
+    binary/minified sniff. The filesystem walk also honours .gitignore files.
 
+    workers > 1 lists directories of a filesystem walk on a thread pool. It
+    is opt-in: it only pays off when listings are latency-bound (network
+    filesystems); on a local disk the serial walk is faster.
+    """
     if not repo_path.exists() or not repo_path.is_dir():
         raise ValueError(f"Repository path does not exist: {repo_path}")
 
-    files: List[str] = []
-    languages: Set[str] = set()
-    file_languages: Dict[str, str] = {}
+    backend = backend or settings.SCANNER_BACKEND
+    if backend not in SCANNER_BACKENDS:
+        raise ValueError(f"Unknown scanner backend: {backend}")
 
-    for path in repo_path.rglob("*"):
-        if path.is_dir():
-            continue
+    return _iter_source_files(str(repo_path), backend, workers)
 
-        # Skip files inside ignored directories
-        if any(part in IGNORE_DIRS for part in path.parts):
+
+def apply_file_changes(
+    scan_result: Dict,
+    changed_files: Iterable[str],
+    deleted_files: Iterable[str],
+    repo_path: Optional[Path] = None,
+) -> Dict:
+    """
+    Return a new scan result with only the given paths updated.
+
+    changed_files are added/modified repo-relative paths, deleted_files are
+    removed ones (e.g. from `git diff --name-status`). Paths are filtered with
+    the same extension and ignore rules as a full scan: the root and every
+    nested .gitignore on the path's directory chain, the override file, the
+    size limit and the content sniff, so feeding in every changed path is
+    safe. A change to a .gitignore or the override file can re-include
+    files that are not in the previous result at all, so then the
+    repository is rescanned in full. Without repo_path only the built-in
+    name rules apply. Line counts are only refreshed when the input has
+    them and repo_path is given.
+    """
+    changed_files = list(changed_files)
+    deleted_files = list(deleted_files)
+    if repo_path is not None and any(
+        _is_ignore_file(path) for path in itertools.chain(changed_files, deleted_files)
+    ):
+        return scan_repository(repo_path, count_lines="file_line_counts" in scan_result)
+
+    file_languages: Dict[str, str] = dict(scan_result["file_languages"].items())
+    file_sizes: Dict[str, int] = dict(scan_result.get("file_sizes", {}).items())
+    line_counts: Optional[Dict[str, int]] = None
+    if "file_line_counts" in scan_result:
+        line_counts = dict(scan_result["file_line_counts"].items())
+    root = str(repo_path) if repo_path is not None else None
+    root_rules = IgnoreRules.for_repository(root) if root is not None else NOISE_RULES
+    # rel_dir ("" or "a/b/") -> rules with every .gitignore from the root down to it
+    dir_rules: Dict[str, IgnoreRules] = {"": root_rules}
+
+    def _rules_for(relative_path: str) -> IgnoreRules:
+        if root is None:
+            return root_rules
+        rel_dir = relative_path.rpartition("/")[0]
+        rel_dir = f"{rel_dir}/" if rel_dir else ""
+        missing = []
+        while rel_dir not in dir_rules:
+            missing.append(rel_dir)
+            parent = rel_dir[:-1].rpartition("/")[0]
+            rel_dir = f"{parent}/" if parent else ""
+        rules = dir_rules[rel_dir]
+        for rel_dir in reversed(missing):
+            gitignore = os.path.join(root, rel_dir, ".gitignore")
+            if os.path.isfile(gitignore):
+                rules = rules.child(gitignore, rel_dir)
+            dir_rules[rel_dir] = rules
+        return rules
+
+    def _forget(relative_path: str) -> None:
+        file_languages.pop(relative_path, None)
+        file_sizes.pop(relative_path, None)
+        if line_counts is not None:
+            line_counts.pop(relative_path, None)
+
+    for relative_path in deleted_files:
+        _forget(relative_path)
+
+    for relative_path in changed_files:
+        # A changed path that now fails the rules must drop out of the scan.
+        _forget(relative_path)
+        repo_file = _tracked_repo_file(root, relative_path, _rules_for(relative_path))
+        if repo_file is None:
             continue
+        file_languages[relative_path] = repo_file.language
+        file_sizes[relative_path] = repo_file.size
+        if line_counts is not None:
+            line_counts[relative_path] = (
+                file_io.count_lines(Path(root) / relative_path) if root is not None else 0
+            )
+
+    files = sorted(file_languages)
+    table = ScanTable(
+        ((path, file_languages[path], file_sizes.get(path, 0)) for path in files),
+        [line_counts.get(path, 0) for path in files] if line_counts is not None else None,
+    )
+    return _scan_result(scan_result["repo"], table)
+
 
-        suffix = path.suffix.lower()
+def _is_ignore_file(relative_path: str) -> bool:
+    return relative_path.rpartition("/")[2] == ".gitignore" or (
+        bool(settings.SCANNER_IGNORE_FILE) and relative_path == settings.SCANNER_IGNORE_FILE
+    )
 
-        if suffix in EXTENSION_LANGUAGE_MAP:
-            relative_path = str(path.relative_to(repo_path))
-            language = EXTENSION_LANGUAGE_MAP[suffix]
 
-            files.append(relative_path)
-            file_languages[relative_path] = language
-            languages.add(language)
+def _line_counts(repo_path: Path, records: List[RepoFile]) -> List[int]:
+    """Line count per record, read from disk only for files the file index does not know."""
+    fingerprints = []
+    for record in records:
+        try:
+            mtime_ns = os.stat(repo_path / record.relative_path).st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        fingerprints.append((record.relative_path, record.size, mtime_ns))
 
-    return {
-        "repo": repo_path.name,
-        "languages": sorted(languages),
-        "file_count": len(files),
-        "files": sorted(files),
-        "file_languages": file_languages,
+    index = get_file_index(repo_path)
+    known = index.line_counts(fingerprints)
+    counts: List[int] = []
+    counted = []
+    for record, (path, size, mtime_ns) in zip(records, fingerprints):
+        lines = known.get(path)
+        if lines is None:
+            lines = file_io.count_lines(repo_path / path)
+            if mtime_ns >= 0:
+                counted.append((path, size, mtime_ns, record.language, lines))
+        counts.append(lines)
+    index.store_line_counts(counted)
+    return counts
+
+
+def _scan_result(repo_name: str, table: ScanTable) -> Dict:
+    """Wrap a ScanTable in the scan result dict shape callers expect."""
+    language_bytes: Dict[str, int] = {}
+    language_lines: Dict[str, int] = {}
+    for i in range(len(table)):
+        language = table.language(i)
+        language_bytes[language] = language_bytes.get(language, 0) + table.size(i)
+        if table.has_line_counts:
+            language_lines[language] = language_lines.get(language, 0) + table.line_count(i)
+
+    result = {
+        "repo": repo_name,
+        "languages": sorted(table.languages),
+        "file_count": len(table),
+        "files": ScanFileList(table),
+        "file_languages": ScanColumn(table, table.language),
+        "file_sizes": ScanColumn(table, table.size),
+        "language_bytes": language_bytes,
     }
+    if table.has_line_counts:
+        result["file_line_counts"] = ScanColumn(table, table.line_count)
+        result["language_lines"] = language_lines
+    return result
+
+
+def _language_for_name(name: str) -> Optional[str]:
+    _, suffix = os.path.splitext(name)
+    return EXTENSION_LANGUAGE_MAP.get(suffix.lower())
+
+
+def _iter_source_files(root: str, backend: str, workers: int) -> Iterator[RepoFile]:
+    use_git = backend == "git" or (
+        backend == "auto" and os.path.exists(os.path.join(root, ".git"))
+    )
+    if use_git:
+        # git has already applied .gitignore (and never ignores tracked files)
+        listed = yield from _git_index_source_files(
+            root, IgnoreRules.for_repository(root, use_gitignore=False)
+        )
+        if listed:
+            return
+        LOGGER.info("git ls-files unavailable for %s, falling back to filesystem walk", root)
+
+    rules = IgnoreRules.for_repository(root)
+    if workers > 1:
+        yield from _walk_source_files_parallel(root, rules, workers)
+    else:
+        yield from _walk_source_files(root, rules)
+
+
+def _git_index_source_files(root: str, rules: IgnoreRules) -> Generator[RepoFile, None, bool]:
+    """
+    Stream tracked source files straight from the git index with
+    `git ls-files -z`. Each listed source file is stat'ed for its current
+    size; tracked files missing from the working tree are skipped. Returns
+    False (having yielded nothing) if root is not a git work tree or git is
+    not installed.
+    """
+    try:
+        process = subprocess.Popen(
+            ["git", "-C", root, "ls-files", "-z", "--cached"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+
+    yielded = False
+    try:
+        remainder = b""
+        while True:
+            chunk = process.stdout.read(65536)
+            if not chunk:
+                break
+            *records, remainder = (remainder + chunk).split(b"\0")
+            for raw in records:
+                if not raw:
+                    continue
+                relative_path = raw.decode("utf-8", errors="surrogateescape")
+                repo_file = _tracked_repo_file(root, relative_path, rules)
+                if repo_file is not None:
+                    yielded = True
+                    yield repo_file
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+
+    return yielded or returncode == 0
+
+
+def _tracked_repo_file(root: Optional[str], relative_path: str, rules: IgnoreRules) -> Optional[RepoFile]:
+    """
+    Build the RepoFile for a path listed by git (already .gitignore-filtered),
+    or None if it is not source, the ignore rules reject it or it is missing
+    from the working tree. With root None only the name-based rules are
+    applied.
+    """
+    language = _language_for_name(relative_path.rpartition("/")[2])
+    if language is None:
+        return None
+
+    size, abs_path = 0, None
+    if root is not None:
+        abs_path = os.path.join(root, relative_path)
+        try:
+            size = os.stat(abs_path).st_size
+        except OSError:
+            # Tracked but deleted from the working tree.
+            return None
+    if rules.ignores_path(relative_path, size, abs_path):
+        return None
+    return RepoFile(relative_path, language, size)
+
+
+def _walk_source_files(root: str, rules: IgnoreRules, prefix: str = "") -> Iterator[RepoFile]:
+    """
+    Iterative os.scandir walk yielding a RepoFile per source file.
+
+    Ignored directories are pruned before they are entered, so nothing below
+    node_modules/, .git/ or a .gitignored tree is ever listed. File/dir checks use the type
+    information cached on each DirEntry, which avoids a stat per path on
+    most filesystems; only matching source files are stat'ed for their size.
+    Symlinked directories are not followed (same as rglob). root may be a
+    subdirectory, with prefix its repo-relative path ("a/b/").
+    """
+    # Stack of (absolute_dir, relative_prefix, rules) — prefix is "" or "a/b/".
+    stack = [(root, prefix, rules)]
+    while stack:
+        directory, prefix, dir_rules = stack.pop()
+        files, subdirs = _list_directory(directory, prefix, dir_rules)
+        stack.extend(subdirs)
+        yield from files
+
+
+def _walk_source_files_parallel(root: str, rules: IgnoreRules, workers: int) -> Iterator[RepoFile]:
+    """
+    Same walk as _walk_source_files, but directory listings run on a thread
+    pool. Pays off when each listing is latency-bound (network filesystems,
+    very wide trees); yield order is arbitrary, so callers must sort.
+
+    At most workers * 4 listings are in flight at once and workers * 64
+    discovered directories wait in a local queue; a directory found while
+    the queue is full is walked inline, on the calling thread.
+    """
+    max_in_flight = workers * 4
+    max_pending = workers * 64
+    pending = deque([(root, "", rules)])
+    in_flight = set()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="repo-scan") as pool:
+        while pending or in_flight:
+            while pending and len(in_flight) < max_in_flight:
+                directory, prefix, dir_rules = pending.popleft()
+                in_flight.add(pool.submit(_list_directory, directory, prefix, dir_rules))
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                yield from files
+                for directory, prefix, dir_rules in subdirs:
+                    if len(pending) < max_pending:
+                        pending.append((directory, prefix, dir_rules))
+                    else:
+                        yield from _walk_source_files(directory, dir_rules, prefix)
+
+
+def _list_directory(
+    directory: str,
+    prefix: str,
+    rules: IgnoreRules,
+) -> Tuple[List[RepoFile], List[Tuple[str, str, IgnoreRules]]]:
+    """
+    List one directory: (source files, subdirectories still to walk).
+
+    A .gitignore in the directory extends the rules once, here; every entry
+    is then matched against that one compiled rule set.
+    """
+    files: List[RepoFile] = []
+    subdirs: List[Tuple[str, str, IgnoreRules]] = []
+    try:
+        with os.scandir(directory) as iterator:
+            entries = list(iterator)
+    except OSError:
+        # Unreadable directory — skip it rather than fail the whole scan.
+        return files, subdirs
+
+    # The root .gitignore is already part of the rules from for_repository().
+    for entry in entries:
+        if prefix and entry.name == ".gitignore":
+            rules = rules.child(entry.path, prefix)
+            break
+
+    for entry in entries:
+        name = entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+        if is_dir:
+            rel_dir = f"{prefix}{name}/"
+            if not entry.is_symlink() and not rules.ignores_dir(name, rel_dir):
+                subdirs.append((entry.path, rel_dir, rules))
+            continue
+
+        language = _language_for_name(name)
+        if language is None:
+            continue
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            # Broken symlink — still listed, as rglob did.
+            size = 0
+        relative_path = f"{prefix}{name}"
+        if rules.ignores_file(name, relative_path, size, entry.path):
+            continue
+        files.append(RepoFile(relative_path, language, size))
+    return files, subdirs
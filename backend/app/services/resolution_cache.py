@@ -0,0 +1,90 @@
+"""
+Process-wide cache of ResolutionIndex objects.
+
+Every dependency graph summary, follow_import call and candidate refresh
+of an analysis resolves mostly the same imports. One index (with its memo
+table) is kept per (repo, package roots), tagged with the scan cache
+generation it was built from; when scan_cache replaces, invalidates or
+evicts that scan the generation changes and the next lookup builds a fresh
+index, so no answer outlives the scan it came from. Repos whose scans are
+not cached get a fresh index on every call.
+
+resolution_cache_stats() reports index reuse and how many resolutions the
+memo tables answered ("resolutions_avoided") versus computed ("resolutions").
+"""
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from app.core.config import settings
+from app.services.import_resolution import ResolutionIndex
+from app.services.scan_cache import get_scan_result, scan_generation
+
+LOGGER = logging.getLogger(__name__)
+
+_Key = Tuple[str, Tuple[str, ...]]
+
+_LOCK = threading.Lock()
+_CACHE: "OrderedDict[_Key, Tuple[Optional[int], ResolutionIndex]]" = OrderedDict()
+_STATS = {"index_hits": 0, "index_builds": 0, "uncached": 0}
+# Memo counters of indexes that have been dropped from the cache.
+_RETIRED = {"resolutions": 0, "resolutions_avoided": 0}
+
+
+def get_resolution_index(repo_path: Path, package_roots: Iterable[Union[str, Path]] = ()) -> ResolutionIndex:
+    """The ResolutionIndex for repo_path's current scan, reused while that scan is cached."""
+    repo_path = repo_path.resolve()
+    key = (str(repo_path), tuple(str(root) for root in package_roots))
+    scan_result = get_scan_result(repo_path)
+    generation = scan_generation(repo_path)
+    with _LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None and generation is not None and cached[0] == generation:
+            _CACHE.move_to_end(key)
+            _STATS["index_hits"] += 1
+            return cached[1]
+
+    index = ResolutionIndex(repo_path, scan_result["files"], key[1])
+    with _LOCK:
+        _STATS["index_builds" if generation is not None else "uncached"] += 1
+        _store_locked(key, generation, index)
+    return index
+
+
+def resolution_cache_stats() -> Dict[str, int]:
+    """Index reuse and memo counters (including dropped indexes) plus the number of cached indexes."""
+    with _LOCK:
+        stats = {**_STATS, **_RETIRED, "entries": len(_CACHE)}
+        for _, index in _CACHE.values():
+            stats["resolutions"] += index.memo_misses
+            stats["resolutions_avoided"] += index.memo_hits
+    return stats
+
+
+def clear_resolution_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
+        for counters in (_STATS, _RETIRED):
+            for name in counters:
+                counters[name] = 0
+
+
+def _store_locked(key: _Key, generation: Optional[int], index: ResolutionIndex) -> None:
+    # Indexes for older scans of the repo can never be hit again.
+    stale = [
+        cached_key
+        for cached_key, (built_from, _) in _CACHE.items()
+        if cached_key == key or (cached_key[0] == key[0] and built_from != generation)
+    ]
+    for cached_key in stale:
+        _retire_locked(_CACHE.pop(cached_key)[1])
+    _CACHE[key] = (generation, index)
+    while len(_CACHE) > max(1, settings.SCAN_CACHE_MAX_ENTRIES):
+        _retire_locked(_CACHE.popitem(last=False)[1][1])
+
+
+def _retire_locked(index: ResolutionIndex) -> None:
+    _RETIRED["resolutions"] += index.memo_misses
+    _RETIRED["resolutions_avoided"] += index.memo_hits
@@ -0,0 +1,157 @@
+"""
+Process-wide cache of scan_repository results.
+
+A single analysis touches the scan many times (snapshot, every candidate
+refresh, every dependency graph summary, the interpreter and the report).
+Results are keyed by the resolved repo path plus a cheap git fingerprint
+(HEAD ref + index mtime), so a pull or checkout naturally produces a new key.
+Paths that are not git checkouts are never cached — there is no cheap way to
+tell whether their contents changed.
+
+Cached results are shared between callers and must be treated as read-only.
+Each stored result gets a new generation number (scan_generation), so
+caches derived from a scan can tell when it was replaced or dropped.
+"""
+import itertools
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.services.repo_scanner import scan_repository
+
+LOGGER = logging.getLogger(__name__)
+
+_LOCK = threading.Lock()
+_CACHE: "OrderedDict[Tuple[str, Tuple], Dict]" = OrderedDict()
+_STATS = {"hits": 0, "misses": 0, "uncached": 0, "invalidations": 0}
+# repo key -> generation of its cached scan; a new number on every store
+_GENERATIONS: Dict[str, int] = {}
+_NEXT_GENERATION = itertools.count(1)
+
+
+def get_scan_result(repo_path: Path) -> Dict:
+    """Return scan_repository(repo_path), reusing a cached result when the git state is unchanged."""
+    repo_key = str(repo_path.resolve())
+    fingerprint = _git_fingerprint(Path(repo_key))
+    if fingerprint is None:
+        with _LOCK:
+            _STATS["uncached"] += 1
+        return scan_repository(Path(repo_key))
+
+    key = (repo_key, fingerprint)
+    with _LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            _CACHE.move_to_end(key)
+            _STATS["hits"] += 1
+            return cached
+        _STATS["misses"] += 1
+
+    result = scan_repository(Path(repo_key))
+    with _LOCK:
+        _store_locked(repo_key, fingerprint, result)
+    return result
+
+
+def peek_scan_result(repo_path: Path) -> Optional[Dict]:
+    """Return the most recently cached scan for repo_path without checking it is current."""
+    repo_key = str(repo_path.resolve())
+    with _LOCK:
+        for (cached_repo, _), result in reversed(_CACHE.items()):
+            if cached_repo == repo_key:
+                return result
+    return None
+
+
+def seed_scan_result(repo_path: Path, result: Dict) -> None:
+    """
+    Store a scan result computed elsewhere (e.g. patched from a git diff)
+    under the repo's current fingerprint, replacing older entries.
+    """
+    repo_key = str(repo_path.resolve())
+    fingerprint = _git_fingerprint(Path(repo_key))
+    with _LOCK:
+        if fingerprint is None:
+            _drop_locked(repo_key)
+            return
+        _store_locked(repo_key, fingerprint, result)
+
+
+def scan_generation(repo_path: Path) -> Optional[int]:
+    """
+    Generation of the scan currently cached for repo_path, or None if none
+    is (non-git paths are never cached). It changes whenever that scan is
+    replaced, invalidated or evicted.
+    """
+    with _LOCK:
+        return _GENERATIONS.get(str(repo_path.resolve()))
+
+
+def invalidate_scan_cache(repo_path: Path) -> None:
+    """Drop every cached scan for repo_path (call after clone, pull or force-clean)."""
+    repo_key = str(repo_path.resolve())
+    with _LOCK:
+        _drop_locked(repo_key)
+        _STATS["invalidations"] += 1
+    LOGGER.debug("Invalidated scan cache for %s", repo_key)
+
+
+def clear_scan_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
+        _GENERATIONS.clear()
+        for name in _STATS:
+            _STATS[name] = 0
+
+
+def scan_cache_stats() -> Dict[str, int]:
+    """Hit/miss counters plus the current number of cached entries."""
+    with _LOCK:
+        return {**_STATS, "entries": len(_CACHE)}
+
+
+def _store_locked(repo_key: str, fingerprint: Tuple, result: Dict) -> None:
+    # Older fingerprints for the same repo can never be hit again.
+    _drop_locked(repo_key)
+    _CACHE[(repo_key, fingerprint)] = result
+    _GENERATIONS[repo_key] = next(_NEXT_GENERATION)
+    while len(_CACHE) > max(1, settings.SCAN_CACHE_MAX_ENTRIES):
+        (evicted, _), _ = _CACHE.popitem(last=False)
+        _GENERATIONS.pop(evicted, None)
+
+
+def _drop_locked(repo_key: str) -> None:
+    for key in [k for k in _CACHE if k[0] == repo_key]:
+        del _CACHE[key]
+    _GENERATIONS.pop(repo_key, None)
+
+
+def _git_fingerprint(repo_path: Path) -> Optional[Tuple]:
+    """
+    Cheap change detector for a git checkout: HEAD contents, the mtime of the
+    ref it points at, and the mtime/size of .git/index. Returns None for
+    non-git paths.
+    """
+    git_dir = repo_path / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        index_stat = (git_dir / "index").stat()
+    except OSError:
+        return None
+
+    ref_mtime = 0
+    if head.startswith("ref:"):
+        ref_path = git_dir / head[4:].strip()
+        try:
+            ref_mtime = ref_path.stat().st_mtime_ns
+        except OSError:
+            # Ref lives in packed-refs (e.g. fresh clone).
+            try:
+                ref_mtime = (git_dir / "packed-refs").stat().st_mtime_ns
+            except OSError:
+                pass
+
+    return (head, ref_mtime, index_stat.st_mtime_ns, index_stat.st_size)
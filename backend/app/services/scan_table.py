@@ -0,0 +1,229 @@
+"""
+Compact, array-backed storage for scan results.
+
+A scan of a 100k-file repo used to be a list of path strings plus dicts that
+repeated every path as a key (languages, sizes, line counts). ScanTable keeps:
+
+  - each distinct directory prefix once (interned)
+  - every file name in one string table, addressed by an array of offsets
+  - language codes in an array('B'), sizes and line counts in flat arrays
+
+Paths are stored in sorted order. Lookups by path go through an
+open-addressing hash index of row numbers (an array('i') with 2-4 slots per
+file), built on the first lookup: a binary search per lookup rebuilt ~17
+path strings and was ~75x slower than the dict it replaced, while a
+{path: row} dict would cost more memory than the whole table. A lookup
+still rebuilds one or two candidate paths and a full walk rebuilds every
+path, so both stay roughly 10x slower than on dicts (about 1 ms per 1000
+lookups, tens of ms per 100k-file walk); that is the price of not keeping
+the path strings. ScanFileList and ScanColumn expose the table as the list /
+dict shapes the scan result always had, so callers keep indexing, iterating
+and comparing them as before. All of it is read-only.
+"""
+import sys
+from array import array
+from collections.abc import ItemsView, Mapping, Sequence, ValuesView
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class ScanTable:
+    """Immutable table of scanned files, sorted by repo-relative path."""
+
+    __slots__ = (
+        "languages", "_dirs", "_dir_ids", "_names", "_offsets", "_lang_codes", "_sizes", "_lines", "_slots",
+    )
+
+    def __init__(
+        self,
+        records: Iterable[Tuple[str, str, int]],
+        line_counts: Optional[Iterable[int]] = None,
+    ):
+        """
+        records are (relative_path, language, size) tuples already sorted by
+        path; line_counts, when given, is parallel to records.
+        """
+        dir_ids: Dict[str, int] = {}
+        lang_ids: Dict[str, int] = {}
+        self._dirs: List[str] = []
+        self.languages: List[str] = []
+        self._dir_ids = array("I")
+        self._offsets = array("I", [0])
+        self._lang_codes = array("B")
+        self._sizes = array("Q")
+        names: List[str] = []
+        position = 0
+
+        for relative_path, language, size in records:
+            slash = relative_path.rfind("/") + 1
+            directory, name = relative_path[:slash], relative_path[slash:]
+            dir_id = dir_ids.get(directory)
+            if dir_id is None:
+                dir_id = dir_ids[directory] = len(self._dirs)
+                self._dirs.append(sys.intern(directory))
+            lang_id = lang_ids.get(language)
+            if lang_id is None:
+                lang_id = lang_ids[language] = len(self.languages)
+                self.languages.append(language)
+            self._dir_ids.append(dir_id)
+            names.append(name)
+            position += len(name)
+            self._offsets.append(position)
+            self._lang_codes.append(lang_id)
+            self._sizes.append(size)
+
+        self._names = "".join(names)
+        self._lines = array("I", line_counts) if line_counts is not None else None
+        # hash index of row numbers (-1 = empty), built on the first index() call
+        self._slots: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self._lang_codes)
+
+    @property
+    def has_line_counts(self) -> bool:
+        return self._lines is not None
+
+    def path(self, i: int) -> str:
+        return self._dirs[self._dir_ids[i]] + self._names[self._offsets[i]:self._offsets[i + 1]]
+
+    def language(self, i: int) -> str:
+        return self.languages[self._lang_codes[i]]
+
+    def size(self, i: int) -> int:
+        return self._sizes[i]
+
+    def line_count(self, i: int) -> int:
+        return self._lines[i] if self._lines is not None else 0
+
+    def index(self, path: str) -> int:
+        """Position of path in the table, or -1."""
+        slots = self._slots
+        if slots is None:
+            # Concurrent first lookups may both build it; either result is the same.
+            slots = self._slots = self._build_slots()
+        dirs, dir_ids, names, offsets = self._dirs, self._dir_ids, self._names, self._offsets
+        mask = len(slots) - 1
+        slot = hash(path) & mask
+        while True:
+            row = slots[slot]
+            if row < 0:
+                return -1
+            if dirs[dir_ids[row]] + names[offsets[row]:offsets[row + 1]] == path:
+                return row
+            slot = (slot + 1) & mask
+
+    def _build_slots(self) -> array:
+        # Linear probing at a load factor of at most 1/2.
+        mask = (1 << max(3, (2 * len(self)).bit_length())) - 1
+        slots = array("i", [-1]) * (mask + 1)
+        for row, path in enumerate(self.iter_paths()):
+            slot = hash(path) & mask
+            while slots[slot] >= 0:
+                slot = (slot + 1) & mask
+            slots[slot] = row
+        return slots
+
+    def iter_paths(self) -> Iterator[str]:
+        dirs, names = self._dirs, self._names
+        for dir_id, start, end in zip(self._dir_ids, self._offsets, self._offsets[1:]):
+            yield dirs[dir_id] + names[start:end]
+
+    def records(self) -> Iterator[Tuple[str, str, int]]:
+        languages = self.languages
+        for path, code, size in zip(self.iter_paths(), self._lang_codes, self._sizes):
+            yield path, languages[code], size
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the table (containers plus strings)."""
+        total = sys.getsizeof(self._names) + sys.getsizeof(self._dirs)
+        total += sum(sys.getsizeof(d) for d in self._dirs)
+        total += sys.getsizeof(self.languages)
+        for column in (self._dir_ids, self._offsets, self._lang_codes, self._sizes, self._lines, self._slots):
+            if column is not None:
+                total += sys.getsizeof(column)
+        return total
+
+
+class ScanFileList(Sequence):
+    """The scan result's "files": a read-only, sorted list of paths."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: ScanTable):
+        self._table = table
+
+    @property
+    def table(self) -> ScanTable:
+        return self._table
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._table.path(j) for j in range(*i.indices(len(self._table)))]
+        if i < 0:
+            i += len(self._table)
+        if not 0 <= i < len(self._table):
+            raise IndexError("scan file index out of range")
+        return self._table.path(i)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._table.iter_paths()
+
+    def __contains__(self, path) -> bool:
+        return isinstance(path, str) and self._table.index(path) >= 0
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, tuple, ScanFileList)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ScanFileList({list(self)!r})"
+
+
+class ScanColumn(Mapping):
+    """A per-file column of the table viewed as a read-only {path: value} dict."""
+
+    __slots__ = ("_table", "_value")
+
+    def __init__(self, table: ScanTable, value: Callable[[int], object]):
+        self._table = table
+        self._value = value
+
+    def __getitem__(self, path):
+        i = self._table.index(path) if isinstance(path, str) else -1
+        if i < 0:
+            raise KeyError(path)
+        return self._value(i)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._table.iter_paths()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def items(self) -> "_ColumnItems":
+        return _ColumnItems(self)
+
+    def values(self) -> "_ColumnValues":
+        return _ColumnValues(self)
+
+    def __repr__(self) -> str:
+        return f"ScanColumn({dict(self.items())!r})"
+
+
+class _ColumnItems(ItemsView):
+    # Walk the table by position instead of looking every key up again.
+    def __iter__(self):
+        column = self._mapping
+        return zip(column._table.iter_paths(), map(column._value, range(len(column._table))))
+
+
+class _ColumnValues(ValuesView):
+    def __iter__(self):
+        column = self._mapping
+        return map(column._value, range(len(column._table)))
@@ -0,0 +1,95 @@
+"""
+Benchmark: tree-sitter AST extraction throughput across worker counts.
+
+Builds a synthetic Python + TypeScript repo, commits it (only git repos get
+their scan cached, so this keeps the scan out of the timings) and runs
+extract_ast for each language and worker count, reporting files per second
+and the structure summarize_ast derives. Needs tree-sitter and its grammars installed. Run
+from backend/:
+
+    python -m benchmarks.bench_ast_extraction [--files 5000] [--workers 1 2 4]
+"""
+import argparse
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from app.core.config import settings
+from app.services.ast.ast_service import extract_ast
+from app.services.ast.ast_summary_service import summarize_ast
+from app.services.scan_cache import get_scan_result, scan_cache_stats
+
+PYTHON_BODY = "import os\n\n" + "".join(
+    f"class Service{i}:\n"
+    f"    def __init__(self, repo):\n        self.repo = repo\n\n"
+    f"    async def fetch(self, key):\n        return await self.repo.get(key)\n\n"
+    f"    def handle(self, request):\n"
+    f"        def check(value):\n            return value is not None\n"
+    f"        return [r for r in request if check(r)]\n\n\n"
+    for i in range(8)
+)
+TS_BODY = "import { Repo } from './repo';\n\n" + "".join(
+    f"export class Handler{i} {{\n"
+    f"  constructor(private repo: Repo) {{}}\n"
+    f"  async fetch(key: string): Promise<string> {{ return this.repo.get(key); }}\n"
+    f"  handle = (items: string[]) => items.filter((x) => x.length > {i});\n"
+    f"}}\n\n"
+    f"export function helper{i}(n: number): number {{ return n * {i}; }}\n\n"
+    for i in range(8)
+)
+
+
+def build_repo(root: Path, files: int) -> Path:
+    for i in range(files):
+        ext, body = (".py", PYTHON_BODY) if i % 2 == 0 else (".ts", TS_BODY)
+        directory = root / f"pkg{i % 50}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"file{i}{ext}").write_text(body)
+    git = ["git", "-C", str(root), "-c", "user.name=bench", "-c", "user.email=bench@example.com"]
+    subprocess.run([*git, "init", "-q"], check=True)
+    subprocess.run([*git, "add", "-A"], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "bench"], check=True)
+    return root
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    # Keep the file index and import cache out of the real data directory.
+    data = Path(tempfile.mkdtemp(prefix="bench-data-"))
+    settings.FILE_INDEX_DIR = data / "index"
+    settings.IMPORT_CACHE_PATH = data / "imports.sqlite"
+    tmp = Path(tempfile.mkdtemp(prefix="bench-ast-")).resolve()
+    try:
+        repo = build_repo(tmp / "repo", args.files)
+        start = time.perf_counter()
+        get_scan_result(repo)
+        print(f"scan (cached for the runs below): {time.perf_counter() - start:6.2f} s")
+        for language in ("python", "typescript"):
+            for workers in args.workers:
+                start = time.perf_counter()
+                result = extract_ast(repo_path=repo, language=language, workers=workers)
+                elapsed = time.perf_counter() - start
+                if result is None:
+                    print(f"{language}: tree-sitter grammar not installed")
+                    break
+                count = len(result["files"])
+                print(f"{language:10s} workers={workers:<2d} {count} files  {elapsed:6.2f} s"
+                      f"  {count / elapsed:8.0f} files/s")
+            else:
+                summary = summarize_ast(result)
+                print(f"{language:10s} classes={summary['total_classes']} functions={summary['total_functions']}"
+                      f" max_depth={summary['max_nesting_depth']}")
+        print(f"scan cache: {scan_cache_stats()}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(data, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: memory and latency of file inspection on large generated files.
+
+Writes a multi-megabyte generated Go file and JS bundle, then compares the
+old whole-file reads (read_bytes/read_text + splitlines) with the file_io
+helpers for each inspection step: hash + line count + import text, the
+40-line preview and a pattern search. Reports wall time and, from a
+second run, the tracemalloc peak of each. Run from backend/:
+
+    python -m benchmarks.bench_file_io [--mb 32]
+"""
+import argparse
+import hashlib
+import re
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from app.services import file_io
+
+GO_HEADER = 'package generated\n\nimport (\n\t"fmt"\n\t"strings"\n)\n\n'
+GO_FUNC = "func Generated{i}(s string) string {{ return fmt.Sprint(strings.ToUpper(s), {i}) }}\n"
+JS_MODULE = "/* module {i} */ exports.m{i} = function (x) {{ return require('./m{j}').run(x) + {i}; }};\n"
+PREVIEW_LINES = 40
+
+
+def _build(path: Path, header: str, template: str, megabytes: int) -> Path:
+    target = megabytes * 1024 * 1024
+    with open(path, "w") as handle:
+        handle.write(header)
+        written, i = len(header), 0
+        while written < target:
+            line = template.format(i=i, j=i % 500)
+            handle.write(line)
+            written += len(line)
+            i += 1
+    return path
+
+
+def _measure(label: str, run: Callable[[], object]) -> None:
+    # Timed and traced separately: tracemalloc slows allocation-heavy code.
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {label:28s} {elapsed * 1000:8.1f} ms  peak {peak / 2**20:8.2f} MiB")
+
+
+def _legacy_inspect(path: Path) -> None:
+    raw = path.read_bytes()
+    hashlib.sha1(raw).hexdigest()
+    content = raw.decode("utf-8", errors="ignore")
+    len(content.splitlines())
+
+
+def _legacy_preview(path: Path) -> None:
+    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+    lines[:PREVIEW_LINES], len(lines)
+
+
+def _legacy_search(path: Path, pattern: "re.Pattern") -> None:
+    content = path.read_text(encoding="utf-8", errors="ignore")
+    for line in content.splitlines():
+        pattern.search(line)
+
+
+def _search(path: Path, pattern: "re.Pattern") -> None:
+    for line in file_io.iter_lines(path):
+        pattern.search(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=int, default=32)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp(prefix="bench-file-io-"))
+    try:
+        files = [
+            ("go", _build(tmp / "generated.go", GO_HEADER, GO_FUNC, args.mb)),
+            ("javascript", _build(tmp / "bundle.js", "", JS_MODULE, args.mb)),
+        ]
+        pattern = re.compile("no-such-token", re.IGNORECASE)
+        for language, path in files:
+            print(f"{path.name}: {path.stat().st_size / 2**20:.0f} MiB")
+            _measure("inspect (old)", lambda: _legacy_inspect(path))
+            _measure("inspect (read_source)", lambda: file_io.read_source(path, header_language=language))
+            _measure("preview (old)", lambda: _legacy_preview(path))
+            _measure("preview (read_preview)", lambda: file_io.read_preview(path, PREVIEW_LINES))
+            _measure("search (old)", lambda: _legacy_search(path, pattern))
+            _measure("search (iter_lines)", lambda: _search(path, pattern))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Benchmark: JS/Python internal-import resolution, ResolutionIndex vs the old
+per-import filesystem probing.
+
+Writes a synthetic repository (a src/ Python package tree plus a JS/TS
+front end with index files), generates relative, absolute and external
+imports for every file, and resolves all of them with both resolvers. The
+old resolver is kept here verbatim for comparison; every answer is checked
+against it and mismatches are printed. Run from backend/:
+
+    python -m benchmarks.bench_import_resolution [--packages 30] [--modules 15]
+"""
+import argparse
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Set, Tuple
+
+from app.services.import_resolution import ResolutionIndex
+
+
+def legacy_resolve_internal_import(
+    *,
+    repo_path: Path,
+    source_file: str,
+    import_specifier: str,
+    package_roots: List[Path],
+    scanned_files: Set[str],
+) -> str | None:
+    source_abs = (repo_path / source_file).resolve()
+    source_dir = source_abs.parent
+
+    if _is_js_relative_import(import_specifier):
+        resolved = _resolve_js_relative_import(repo_path, source_dir, import_specifier)
+        return str(resolved.relative_to(repo_path)) if resolved else None
+
+    if _is_python_relative_import(import_specifier):
+        resolved = _resolve_python_relative_import(repo_path, source_dir, import_specifier)
+        return str(resolved.relative_to(repo_path)) if resolved else None
+
+    if _should_attempt_absolute_python_resolution(import_specifier, package_roots, scanned_files):
+        resolved = _resolve_absolute_import(import_specifier, package_roots, scanned_files)
+        if resolved is not None:
+            return resolved
+
+    return None
+
+
+def _is_js_relative_import(import_specifier: str) -> bool:
+    return import_specifier.startswith("./") or import_specifier.startswith("../")
+
+
+def _is_python_relative_import(import_specifier: str) -> bool:
+    return import_specifier.startswith(".")
+
+
+def _resolve_js_relative_import(repo_path: Path, source_dir: Path, import_specifier: str) -> Path | None:
+    candidate_base = (source_dir / import_specifier).resolve()
+    return _resolve_candidate_path(repo_path, candidate_base, [".js", ".jsx", ".ts", ".tsx"])
+
+
+def _resolve_python_relative_import(repo_path: Path, source_dir: Path, import_specifier: str) -> Path | None:
+    level = 0
+    for ch in import_specifier:
+        if ch == ".":
+            level += 1
+        else:
+            break
+
+    module = import_specifier[level:]
+    target_dir = source_dir
+    for _ in range(max(0, level - 1)):
+        target_dir = target_dir.parent
+
+    candidate_base = target_dir / module.replace(".", "/") if module else target_dir
+    return _resolve_candidate_path(repo_path, candidate_base, [".py"])
+
+
+def _should_attempt_absolute_python_resolution(
+    import_specifier: str,
+    package_roots: List[Path],
+    scanned_files: Set[str],
+) -> bool:
+    if not import_specifier or not package_roots:
+        return False
+
+    first_segment = import_specifier.split(".", 1)[0]
+    if not first_segment:
+        return False
+
+    known_top_level_names = _known_top_level_package_names(package_roots, scanned_files)
+    return first_segment in known_top_level_names
+
+
+def _resolve_absolute_import(
+    module_string: str,
+    package_roots: List[Path],
+    scanned_files: Set[str],
+) -> str | None:
+    module_path = module_string.replace(".", "/")
+
+    for package_root in package_roots:
+        root_prefix = package_root.as_posix().strip(".")
+        if root_prefix:
+            file_candidate = f"{root_prefix}/{module_path}.py"
+            init_candidate = f"{root_prefix}/{module_path}/__init__.py"
+        else:
+            file_candidate = f"{module_path}.py"
+            init_candidate = f"{module_path}/__init__.py"
+
+        if file_candidate in scanned_files:
+            return file_candidate
+        if init_candidate in scanned_files:
+            return init_candidate
+
+    return None
+
+
+def _known_top_level_package_names(package_roots: List[Path], scanned_files: Set[str]) -> Set[str]:
+    names: Set[str] = set()
+    for package_root in package_roots:
+        root_prefix = package_root.as_posix().strip(".")
+        for file_path in scanned_files:
+            parts = Path(file_path).parts
+            if not parts:
+                continue
+            if root_prefix:
+                root_parts = tuple(Path(root_prefix).parts)
+                if parts[: len(root_parts)] != root_parts:
+                    continue
+                if len(parts) > len(root_parts):
+                    names.add(parts[len(root_parts)])
+            else:
+                names.add(parts[0])
+    return names
+
+
+def _resolve_candidate_path(repo_path: Path, candidate_base: Path, extensions: List[str]) -> Path | None:
+    candidates: List[Path] = []
+
+    candidates.append(candidate_base)
+    for ext in extensions:
+        candidates.append(candidate_base.with_suffix(ext))
+    for ext in extensions:
+        candidates.append(candidate_base / f"index{ext}")
+    candidates.append(candidate_base / "__init__.py")
+
+    seen: Set[str] = set()
+    for candidate in candidates:
+        key = str(candidate)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        if not candidate.exists() or not candidate.is_file():
+            continue
+        if not candidate.resolve().is_relative_to(repo_path):
+            continue
+        return candidate.resolve()
+
+    return None
+
+
+def _build_repo(root: Path, packages: int, modules: int, rng: random.Random) -> Tuple[List[str], List[Tuple[str, str]]]:
+    files: List[str] = []
+    for p in range(packages):
+        files.append(f"src/app/pkg{p}/__init__.py")
+        files.extend(f"src/app/pkg{p}/mod{m}.py" for m in range(modules))
+        files.append(f"web/src/feature{p}/index.tsx")
+        files.extend(f"web/src/feature{p}/part{m}{('.ts', '.js', '.jsx')[m % 3]}" for m in range(modules))
+    files.append("src/app/__init__.py")
+    for file_path in files:
+        path = root / file_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+    imports: List[Tuple[str, str]] = []
+    for file_path in files:
+        p, m = rng.randrange(packages), rng.randrange(modules + 2)
+        if file_path.endswith(".py"):
+            specifiers = [
+                f".mod{m}", f"..pkg{p}.mod{m}", f"..pkg{p}", "..",
+                f"app.pkg{p}.mod{m}", f"app.pkg{p}", "os.path", "requests",
+            ]
+        else:
+            specifiers = [f"./part{m}", f"../feature{p}", f"../feature{p}/part{m}", "./styles.css", "react", "lodash/fp"]
+        imports.extend((file_path, specifier) for specifier in specifiers)
+    return files, imports
+
+
+def _time(label: str, resolve: Callable[[str, str], str | None], imports: List[Tuple[str, str]]) -> List:
+    start = time.perf_counter()
+    results = [resolve(source, specifier) for source, specifier in imports]
+    print(f"{label:>22}: {time.perf_counter() - start:8.3f} s")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--packages", type=int, default=30)
+    parser.add_argument("--modules", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp()).resolve()
+    try:
+        files, imports = _build_repo(root, args.packages, args.modules, random.Random(args.seed))
+        scanned = set(files)
+        package_roots = [Path("src")]
+        print(f"repo: {len(files)} files, {len(imports)} imports")
+
+        legacy = _time(
+            "legacy probing",
+            lambda source, specifier: legacy_resolve_internal_import(
+                repo_path=root,
+                source_file=source,
+                import_specifier=specifier,
+                package_roots=package_roots,
+                scanned_files=scanned,
+            ),
+            imports,
+        )
+        start = time.perf_counter()
+        index = ResolutionIndex(root, files, package_roots)
+        print(f"{'index build':>22}: {time.perf_counter() - start:8.3f} s")
+        indexed = _time("index lookups", index.resolve, imports)
+
+        mismatches = [
+            (source, specifier, old, new)
+            for (source, specifier), old, new in zip(imports, legacy, indexed)
+            if old != new
+        ]
+        resolved = sum(result is not None for result in indexed)
+        print(f"resolved internally: {resolved}/{len(imports)}, mismatches: {len(mismatches)}")
+        for mismatch in mismatches[:10]:
+            print("  ", mismatch)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark: JS/TS alias and workspace-package resolution on a synthetic
+monorepo.
+
+Writes hundreds of workspace packages (package.json + a tsconfig.json that
+extends a shared base config with `paths`), generates workspace, path-alias,
+baseUrl, relative and external imports for every file, and times:
+
+  - building the alias resolver (reading every config once)
+  - resolving every import --passes times without the memo, then through
+    it. resolution_cache keeps one index (and its memo) per scan, and every
+    dependency-graph build of an analysis resolves the same edges again, so
+    after the first pass the memo answers everything
+  - the workspace-package lookup alone: prefix trie vs a linear scan over
+    package names
+
+Run from backend/:
+
+    python -m benchmarks.bench_js_aliases [--packages 400] [--components 5] [--passes 3]
+"""
+import argparse
+import json
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from app.services.import_resolution import JsAliasResolver, ResolutionIndex
+
+
+def _write(root: Path, rel_path: str, content: str) -> None:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _build_monorepo(
+    root: Path, packages: int, components: int, rng: random.Random
+) -> Tuple[List[str], List[Tuple[str, str]]]:
+    _write(root, "tsconfig.base.json", json.dumps({
+        "compilerOptions": {"baseUrl": ".", "paths": {"@shared/*": ["libs/shared/*"]}},
+    }))
+    files = ["libs/shared/util.ts", "libs/shared/format.ts"]
+    for i in range(packages):
+        package = f"packages/pkg{i}"
+        _write(root, f"{package}/package.json", json.dumps({
+            "name": f"@org/pkg{i}", "main": "dist/index.js", "source": "src/index.ts",
+        }))
+        _write(root, f"{package}/tsconfig.json", json.dumps({
+            "extends": "../../tsconfig.base.json",
+            "compilerOptions": {"baseUrl": ".", "paths": {"~/*": ["./src/*"], "@shared/*": ["../../libs/shared/*"]}},
+        }))
+        files.append(f"{package}/src/index.ts")
+        files.extend(f"{package}/src/components/C{j}.tsx" for j in range(components))
+    for file_path in files:
+        _write(root, file_path, "")
+
+    imports: List[Tuple[str, str]] = []
+    for file_path in files:
+        k, j = rng.randrange(packages), rng.randrange(components + 1)
+        imports.extend((file_path, specifier) for specifier in (
+            f"@org/pkg{k}",
+            f"@org/pkg{k}/components/C{j}",
+            f"~/components/C{j}",
+            "@shared/util",
+            f"./C{j}",
+            "src/index",
+            "react",
+            "lodash/fp",
+        ))
+    return files, imports
+
+
+def _naive_package(names: List[str], specifier: str) -> Optional[str]:
+    matches = [name for name in names if specifier == name or specifier.startswith(name + "/")]
+    return max(matches, key=len) if matches else None
+
+
+def _trie_package(aliases: JsAliasResolver, specifier: str) -> Optional[str]:
+    for package in aliases._packages.prefixes_of(specifier):
+        rest = specifier[len(package.name):]
+        if not rest or rest.startswith("/"):
+            return package.name
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--packages", type=int, default=400)
+    parser.add_argument("--components", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--passes", type=int, default=3)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp()).resolve()
+    try:
+        files, imports = _build_monorepo(root, args.packages, args.components, random.Random(args.seed))
+        print(f"monorepo: {args.packages} packages, {len(files)} files, {len(imports)} imports")
+
+        start = time.perf_counter()
+        aliases = JsAliasResolver.for_repository(root, files)
+        print(f"{'alias resolver build':>24}: {time.perf_counter() - start:8.3f} s")
+
+        index = ResolutionIndex(root, files)
+        index._aliases = aliases
+        totals = {"no memo": 0.0, "memo": 0.0}
+        for run in range(1, args.passes + 1):
+            start = time.perf_counter()
+            results = [index._resolve(source, specifier) for source, specifier in imports]
+            plain = time.perf_counter() - start
+            hits_before = index.memo_hits
+            start = time.perf_counter()
+            memoized = [index.resolve(source, specifier) for source, specifier in imports]
+            memo = time.perf_counter() - start
+            assert memoized == results
+            totals["no memo"] += plain
+            totals["memo"] += memo
+            print(f"{f'pass {run}':>24}: no memo {plain:7.3f} s, memo {memo:7.3f} s"
+                  f"  ({index.memo_hits - hits_before}/{len(imports)} from the memo)")
+        print(f"{f'{args.passes} passes':>24}: no memo {totals['no memo']:7.3f} s, memo {totals['memo']:7.3f} s"
+              f"  ({totals['no memo'] / totals['memo']:.1f}x)")
+        print(f"resolved internally: {sum(r is not None for r in results)}/{len(imports)}")
+
+        names = sorted(aliases.packages)
+        specifiers = [specifier for _, specifier in imports]
+        start = time.perf_counter()
+        naive = [_naive_package(names, specifier) for specifier in specifiers]
+        naive_time = time.perf_counter() - start
+        start = time.perf_counter()
+        trie = [_trie_package(aliases, specifier) for specifier in specifiers]
+        trie_time = time.perf_counter() - start
+        assert naive == trie
+        print(f"{'package lookup, linear':>24}: {naive_time:8.3f} s")
+        print(f"{'package lookup, trie':>24}: {trie_time:8.3f} s  ({naive_time / trie_time:.0f}x)")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
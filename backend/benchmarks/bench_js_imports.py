@@ -0,0 +1,92 @@
+"""
+Benchmark: JS/TS import extraction, single-pass scanner vs the old three
+finditer passes.
+
+Builds a large bundled-but-unminified file (webpack-style module wrappers
+with comments, strings and template literals) and times both extractors on
+it, then reports what each finds. The old extractor is kept here verbatim
+for comparison. Run from backend/:
+
+    python -m benchmarks.bench_js_imports [--modules 5000] [--repeat 5]
+"""
+import argparse
+import re
+import time
+from typing import Callable, List, Set
+
+from app.services.analysis_snapshot_service import _extract_javascript_imports
+
+MODULE_TEMPLATE = '''\
+/***/ "./src/module{i}.ts":
+/*!*************************!*\\
+  !*** ./src/module{i}.ts ***!
+  \\*************************/
+/***/ (function(module, exports, __webpack_require__) {{
+"use strict";
+import {{ helper{i}, other as alias{i} }} from './helpers/h{j}';
+import type {{ Shape{i} }} from "./types/t{j}";
+export {{ render{i} }} from './render/r{j}';
+// import commented{i} from 'not-a-dependency';
+const lodash = require('lodash');
+const banner = "import banner from 'in-a-string'";
+const page = `<div class="module-{i}">${{lodash.escape(banner)}}</div>`;
+const lazy{i} = () => import('./lazy/l{j}');
+function compute{i}(values) {{
+  /* multi-line comment mentioning require('x')
+     across two lines */
+  return values.map((v) => v * {i}).filter(Boolean);
+}}
+module.exports = {{ compute{i}, page, lazy{i} }};
+/***/ }}),
+
+'''
+
+
+def legacy_extract_javascript_imports(content: str) -> List[str]:
+    imports: List[str] = []
+    seen: Set[str] = set()
+
+    patterns = [
+        r'import\s+[^;\n]*?\sfrom\s+["\']([^"\']+)["\']',
+        r'import\s+["\']([^"\']+)["\']',
+        r'require\(\s*["\']([^"\']+)["\']\s*\)',
+    ]
+
+    for pattern in patterns:
+        for match in re.finditer(pattern, content):
+            module = match.group(1).strip()
+            if module and module not in seen:
+                imports.append(module)
+                seen.add(module)
+
+    return imports
+
+
+def _time(extract: Callable[[str], List[str]], content: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        extract(content)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bundle = "".join(MODULE_TEMPLATE.format(i=i, j=i % 200) for i in range(args.modules))
+    print(f"bundle: {len(bundle) / 1e6:.1f} MB, {bundle.count(chr(10))} lines")
+
+    legacy_time = _time(legacy_extract_javascript_imports, bundle, args.repeat)
+    scan_time = _time(_extract_javascript_imports, bundle, args.repeat)
+    legacy = set(legacy_extract_javascript_imports(bundle))
+    found = set(_extract_javascript_imports(bundle))
+    print(f"legacy (3 passes) {legacy_time:6.3f} s  {len(legacy)} specifiers")
+    print(f"single pass       {scan_time:6.3f} s  {len(found)} specifiers")
+    print(f"  only legacy (false positives): {sorted(legacy - found)[:5]}")
+    print(f"  only single pass: {len(found - legacy)} (export-from, dynamic import)")
+
+
+if __name__ == "__main__":
+    main()
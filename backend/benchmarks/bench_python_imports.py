@@ -0,0 +1,85 @@
+"""
+Benchmark: Python import extraction, single-pass scanner vs ast.parse.
+
+Runs both extractors over the interpreter's standard library (every .py file
+that parses) and over a synthetic large module, reporting time and any file
+where the two disagree. Run from backend/:
+
+    python -m benchmarks.bench_python_imports [--large-lines 200000]
+"""
+import argparse
+import sysconfig
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from app.services.analysis_snapshot_service import (
+    _extract_python_imports,
+    _extract_python_imports_ast,
+)
+
+LARGE_BLOCK = '''\
+from app.core import (
+    config,
+    logging as log,
+)
+import os, sys
+
+if TYPE_CHECKING:
+    from app.models import User
+
+
+def handler_{i}(request):
+    """Docstring that mentions import fake_{i}."""
+    # import commented_{i}
+    return os.path.join(str(request), "value_{i}")
+
+'''
+
+
+def _stdlib_sources() -> List[Tuple[Path, str]]:
+    sources = []
+    for path in sorted(Path(sysconfig.get_paths()["stdlib"]).rglob("*.py")):
+        try:
+            content = path.read_text(encoding="utf-8")
+            _extract_python_imports_ast(content)
+        except (OSError, UnicodeDecodeError, SyntaxError, ValueError):
+            continue
+        sources.append((path, content))
+    return sources
+
+
+def _time(extract: Callable[[str], List[str]], contents: List[str]) -> Tuple[float, List[List[str]]]:
+    start = time.perf_counter()
+    results = [extract(content) for content in contents]
+    return time.perf_counter() - start, results
+
+
+def _compare(label: str, names: List[str], contents: List[str]) -> None:
+    ast_time, expected = _time(_extract_python_imports_ast, contents)
+    scan_time, actual = _time(_extract_python_imports, contents)
+    mismatches = [name for name, a, b in zip(names, actual, expected) if a != b]
+    megabytes = sum(len(c) for c in contents) / 1e6
+    print(f"{label}: {len(contents)} file(s), {megabytes:.1f} MB")
+    print(f"  ast.parse  {ast_time:7.2f} s")
+    print(f"  scanner    {scan_time:7.2f} s  ({ast_time / scan_time:.1f}x)")
+    print(f"  mismatches {len(mismatches)}")
+    for name in mismatches[:10]:
+        print(f"    {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--large-lines", type=int, default=200_000)
+    args = parser.parse_args()
+
+    sources = _stdlib_sources()
+    _compare("stdlib", [str(path) for path, _ in sources], [content for _, content in sources])
+
+    block_lines = LARGE_BLOCK.count("\n")
+    large = "".join(LARGE_BLOCK.format(i=i) for i in range(max(1, args.large_lines // block_lines)))
+    _compare("large module", ["<large>"], [large])
+
+
+if __name__ == "__main__":
+    main()
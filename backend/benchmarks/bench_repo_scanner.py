@@ -0,0 +1,95 @@
+"""
+Benchmark: scan_repository on a synthetic tree with a deep node_modules.
+
+Compares the pruning os.scandir walker against the previous rglob-and-filter
+implementation. Run from backend/:
+
+    python -m benchmarks.bench_repo_scanner
+"""
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from app.core.config import settings
+from app.services.ignore_rules import IGNORE_DIRS
+from app.services.repo_scanner import EXTENSION_LANGUAGE_MAP, scan_repository
+
+
+def build_synthetic_repo(root: Path, source_dirs: int = 40, files_per_dir: int = 25,
+                         node_modules_packages: int = 400, node_modules_depth: int = 4) -> Path:
+    """Create a repo with a modest source tree and a large, deep node_modules."""
+    for d in range(source_dirs):
+        directory = root / "src" / f"pkg{d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        for f in range(files_per_dir):
+            (directory / f"module{f}.py").write_text("")
+
+    for p in range(node_modules_packages):
+        directory = root / "node_modules" / f"package{p}"
+        for level in range(node_modules_depth):
+            directory = directory / "node_modules" / f"dep{level}"
+        directory.mkdir(parents=True, exist_ok=True)
+        for f in range(10):
+            (directory / f"index{f}.js").write_text("")
+
+    git_objects = root / ".git" / "objects"
+    for o in range(256):
+        (git_objects / f"{o:02x}").mkdir(parents=True, exist_ok=True)
+        (git_objects / f"{o:02x}" / "object").write_text("")
+
+    return root
+
+
+def legacy_scan_repository(repo_path: Path) -> Dict:
+    """The pre-scandir implementation, kept here as the baseline."""
+    files = []
+    file_languages = {}
+    for path in repo_path.rglob("*"):
+        if path.is_dir():
+            continue
+        if any(part in IGNORE_DIRS for part in path.parts):
+            continue
+        suffix = path.suffix.lower()
+        if suffix in EXTENSION_LANGUAGE_MAP:
+            relative_path = str(path.relative_to(repo_path))
+            files.append(relative_path)
+            file_languages[relative_path] = EXTENSION_LANGUAGE_MAP[suffix]
+    return {"files": sorted(files), "file_languages": file_languages}
+
+
+def _time(fn, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    # Keep the file index and import cache out of the real data directory.
+    data = Path(tempfile.mkdtemp(prefix="bench-data-"))
+    settings.FILE_INDEX_DIR = data / "index"
+    settings.IMPORT_CACHE_PATH = data / "imports.sqlite"
+    tmp = Path(tempfile.mkdtemp(prefix="bench-scan-")).resolve()
+    try:
+        repo = build_synthetic_repo(tmp)
+        new_result = scan_repository(repo)
+        old_result = legacy_scan_repository(repo)
+        assert new_result["files"] == old_result["files"], "walkers disagree"
+
+        legacy = _time(lambda: legacy_scan_repository(repo))
+        pruning = _time(lambda: scan_repository(repo))
+        print(f"files found:        {new_result['file_count']}")
+        print(f"rglob + filter:     {legacy * 1000:8.1f} ms")
+        print(f"scandir + pruning:  {pruning * 1000:8.1f} ms")
+        print(f"speedup:            {legacy / pruning:8.1f}x")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(data, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
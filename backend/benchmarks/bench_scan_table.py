@@ -0,0 +1,105 @@
+"""
+Benchmark: memory of the compact ScanTable vs the list + dicts scan result.
+
+Generates a large synthetic file listing in memory (no disk I/O) and measures
+the allocations of both representations with tracemalloc, plus lookup and
+iteration cost through the dict-like views. The table's path index is built
+by the first lookup, so its cost and size are reported separately, and the
+table is walked both before and after it exists. Run from backend/:
+
+    python -m benchmarks.bench_scan_table [--files 200000]
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from app.services.repo_scanner import EXTENSION_LANGUAGE_MAP
+from app.services.scan_table import ScanColumn, ScanFileList, ScanTable
+
+
+def synthetic_records(count: int):
+    rng = random.Random(7)
+    extensions = sorted(EXTENSION_LANGUAGE_MAP)
+    records = []
+    for i in range(count):
+        directory = f"services/svc{i % 40}/src/module{(i // 40) % 250}/"
+        ext = extensions[i % len(extensions)]
+        records.append((f"{directory}file_{i}{ext}", EXTENSION_LANGUAGE_MAP[ext], rng.randint(0, 50000)))
+    records.sort()
+    return records
+
+
+def legacy_representation(records):
+    files = [path for path, _, _ in records]
+    return {
+        "files": files,
+        "file_languages": {path: language for path, language, _ in records},
+        "file_sizes": {path: size for path, _, size in records},
+    }
+
+
+def compact_representation(records):
+    table = ScanTable(records)
+    return {
+        "files": ScanFileList(table),
+        "file_languages": ScanColumn(table, table.language),
+        "file_sizes": ScanColumn(table, table.size),
+    }
+
+
+def _measure(build, records):
+    # Copy the path strings under tracing, so strings a representation keeps
+    # are counted and strings it copies are not counted twice.
+    tracemalloc.start()
+    fresh = [(path.encode().decode(), language, size) for path, language, size in records]
+    result = build(fresh)
+    del fresh
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def _time(fn, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=200_000)
+    args = parser.parse_args()
+
+    records = synthetic_records(args.files)
+    legacy, legacy_bytes = _measure(legacy_representation, records)
+    compact, compact_bytes = _measure(compact_representation, records)
+    assert compact["files"] == legacy["files"]
+    assert compact["file_languages"] == legacy["file_languages"]
+
+    probes = [records[i][0] for i in range(0, len(records), max(1, len(records) // 1000))]
+    print(f"files:                     {len(records)}")
+    print(f"list + dicts:              {legacy_bytes / 2**20:8.1f} MiB")
+    print(f"ScanTable + views:         {compact_bytes / 2**20:8.1f} MiB"
+          f"  (nbytes() = {compact['files'].table.nbytes() / 2**20:.1f} MiB)")
+    print(f"reduction:                 {legacy_bytes / compact_bytes:8.1f}x")
+    table = compact["files"].table
+    walk = _time(lambda: sum(1 for _ in compact["file_languages"].items()))
+    print(f"ScanTable     full items() walk before any lookup {walk * 1000:7.1f} ms")
+    before = table.nbytes()
+    start = time.perf_counter()
+    table.index(probes[0])
+    elapsed = time.perf_counter() - start
+    print(f"ScanTable     path index built by first lookup   {elapsed * 1000:7.1f} ms,"
+          f" +{(table.nbytes() - before) / 2**20:.1f} MiB")
+    for name, result in (("list + dicts", legacy), ("ScanTable", compact)):
+        lookup = _time(lambda: [result["file_languages"][p] for p in probes])
+        iterate = _time(lambda: sum(1 for _ in result["file_languages"].items()))
+        print(f"{name:13s} {len(probes)} lookups {lookup * 1000:7.2f} ms, full items() walk {iterate * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: git index backend vs filesystem walker for scan_repository.
+
+Builds a large synthetic git checkout (tracked sources plus an untracked,
+.gitignored dependency tree) and times both backends. Run from backend/:
+
+    python -m benchmarks.bench_scanner_backends [--dirs 200] [--files-per-dir 100]
+"""
+import argparse
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from app.core.config import settings
+from app.services.repo_scanner import scan_repository
+
+
+def build_git_repo(root: Path, dirs: int, files_per_dir: int) -> Path:
+    extensions = [".py", ".ts", ".js", ".go", ".md", ".json"]
+    for d in range(dirs):
+        directory = root / f"pkg{d % 20}" / f"module{d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        for f in range(files_per_dir):
+            (directory / f"file{f}{extensions[f % len(extensions)]}").write_text("")
+
+    # Untracked and ignored: the filesystem walker still has to read .gitignore to prune it.
+    for p in range(dirs):
+        directory = root / ".cache" / f"dep{p}"
+        directory.mkdir(parents=True, exist_ok=True)
+        for f in range(files_per_dir // 2):
+            (directory / f"gen{f}.py").write_text("")
+    (root / ".gitignore").write_text(".cache/\n")
+
+    subprocess.run(["git", "-C", str(root), "init", "-q"], check=True)
+    subprocess.run(["git", "-C", str(root), "add", "-A"], check=True)
+    return root
+
+
+def _time(fn, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dirs", type=int, default=200)
+    parser.add_argument("--files-per-dir", type=int, default=100)
+    args = parser.parse_args()
+
+    # Keep the file index and import cache out of the real data directory.
+    data = Path(tempfile.mkdtemp(prefix="bench-data-"))
+    settings.FILE_INDEX_DIR = data / "index"
+    settings.IMPORT_CACHE_PATH = data / "imports.sqlite"
+    tmp = Path(tempfile.mkdtemp(prefix="bench-backends-")).resolve()
+    try:
+        repo = build_git_repo(tmp, args.dirs, args.files_per_dir)
+        git_count = scan_repository(repo, backend="git")["file_count"]
+        fs_count = scan_repository(repo, backend="filesystem")["file_count"]
+
+        git_time = _time(lambda: scan_repository(repo, backend="git"))
+        fs_time = _time(lambda: scan_repository(repo, backend="filesystem"))
+        print(f"tracked source files:   {git_count}")
+        print(f"walked source files:    {fs_count}")
+        print(f"git ls-files backend:   {git_time * 1000:8.1f} ms")
+        print(f"filesystem backend:     {fs_time * 1000:8.1f} ms")
+        print(f"speedup:                {fs_time / git_time:8.1f}x")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(data, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
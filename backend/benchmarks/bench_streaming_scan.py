@@ -0,0 +1,69 @@
+"""
+Benchmark: time-to-first-result and peak memory of iter_repository_files
+versus the list-building scan_repository on a large synthetic tree.
+Run from backend/:
+
+    python -m benchmarks.bench_streaming_scan [--files 100000]
+"""
+import argparse
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from app.core.config import settings
+from app.services.repo_scanner import iter_repository_files, scan_repository
+
+
+def build_tree(root: Path, files: int, per_dir: int = 50) -> None:
+    for i in range(files):
+        directory = root / f"pkg{i // (per_dir * 40)}" / f"mod{i // per_dir}"
+        if i % per_dir == 0:
+            directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"file{i}.py").write_text("")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Keep the file index and import cache out of the real data directory.
+    data = Path(tempfile.mkdtemp(prefix="bench-data-"))
+    settings.FILE_INDEX_DIR = data / "index"
+    settings.IMPORT_CACHE_PATH = data / "imports.sqlite"
+    tmp = Path(tempfile.mkdtemp(prefix="bench-stream-")).resolve()
+    try:
+        build_tree(tmp, args.files)
+
+        start = time.perf_counter()
+        scan_repository(tmp, backend="filesystem")
+        full_scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        next(iter(iter_repository_files(tmp, backend="filesystem")))
+        first_record = time.perf_counter() - start
+
+        tracemalloc.start()
+        scan_repository(tmp, backend="filesystem")
+        _, list_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        count = sum(1 for _ in iter_repository_files(tmp, backend="filesystem"))
+        _, stream_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"files:                         {count}")
+        print(f"scan_repository (full result): {full_scan * 1000:9.1f} ms")
+        print(f"iter_repository_files (first): {first_record * 1000:9.3f} ms")
+        print(f"peak memory, scan_repository:  {list_peak / 1e6:9.1f} MB")
+        print(f"peak memory, streaming count:  {stream_peak / 1e6:9.1f} MB")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(data, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: byte/LOC-weighted language breakdown without a second traversal.
+
+Counts os.scandir calls while scanning a synthetic tree and deriving the
+metadata, and compares against the two-pass approach (scan for paths, then
+stat/read every file again for sizes and line counts). Run from backend/:
+
+    python -m benchmarks.bench_weighted_breakdown [--dirs 300] [--files-per-dir 40] [--count-lines]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from app.core.config import settings
+from app.services.repo_metadata import extract_repo_metadata
+from app.services.repo_scanner import scan_repository
+
+
+class _CallCounter:
+    def __init__(self, fn):
+        self.fn = fn
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.fn(*args, **kwargs)
+
+
+def build_repo(root: Path, dirs: int, files_per_dir: int) -> int:
+    for d in range(dirs):
+        directory = root / f"pkg{d % 10}" / f"mod{d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        for f in range(files_per_dir):
+            if f % 4 == 0:
+                (directory / f"core{f}.c").write_text("int x = 0;\n" * 400)
+            else:
+                (directory / f"script{f}.py").write_text("x = 1\n" * 5)
+    return sum(1 for _ in os.walk(root))
+
+
+def two_pass(repo: Path, count_lines: bool) -> dict:
+    """Scan for paths only, then stat (and read) every file again."""
+    scan_result = scan_repository(repo, count_lines=False)
+    language_bytes, language_lines = Counter(), Counter()
+    for path, language in scan_result["file_languages"].items():
+        full = repo / path
+        language_bytes[language] += full.stat().st_size
+        if count_lines:
+            language_lines[language] += len(full.read_bytes().splitlines())
+    return {"language_bytes": dict(language_bytes), "language_lines": dict(language_lines)}
+
+
+def single_pass(repo: Path, count_lines: bool) -> dict:
+    return extract_repo_metadata(repo, scan_repository(repo, count_lines=count_lines))
+
+
+def _time(fn, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dirs", type=int, default=300)
+    parser.add_argument("--files-per-dir", type=int, default=40)
+    parser.add_argument("--count-lines", action="store_true")
+    args = parser.parse_args()
+
+    # Keep the file index and import cache out of the real data directory.
+    data = Path(tempfile.mkdtemp(prefix="bench-data-"))
+    settings.FILE_INDEX_DIR = data / "index"
+    settings.IMPORT_CACHE_PATH = data / "imports.sqlite"
+    tmp = Path(tempfile.mkdtemp(prefix="bench-breakdown-")).resolve()
+    real_scandir, real_stat = os.scandir, os.stat
+    try:
+        directories = build_repo(tmp, args.dirs, args.files_per_dir)
+
+        os.scandir, os.stat = _CallCounter(real_scandir), _CallCounter(real_stat)
+        metadata = single_pass(tmp, args.count_lines)
+        single_listings, single_stats = os.scandir.calls, os.stat.calls
+
+        os.scandir, os.stat = _CallCounter(real_scandir), _CallCounter(real_stat)
+        two_pass(tmp, args.count_lines)
+        double_listings, double_stats = os.scandir.calls, os.stat.calls
+        os.scandir, os.stat = real_scandir, real_stat
+
+        print(f"directories in tree:        {directories}")
+        print(f"single pass: scandir calls  {single_listings:6d}  os.stat calls {single_stats}")
+        print(f"two pass:    scandir calls  {double_listings:6d}  os.stat calls {double_stats}")
+        print(f"extra directory walks:      {max(0, single_listings - directories - 1)}"
+              " (the +1 is extract_repo_metadata's top-level listing)")
+        print(f"bytes breakdown:            {metadata['language_breakdown_bytes']}")
+        if args.count_lines:
+            print(f"lines breakdown:            {metadata['language_breakdown_lines']}")
+        print(f"single pass time:           {_time(lambda: single_pass(tmp, args.count_lines)) * 1000:8.1f} ms")
+        print(f"two pass time:              {_time(lambda: two_pass(tmp, args.count_lines)) * 1000:8.1f} ms")
+    finally:
+        os.scandir, os.stat = real_scandir, real_stat
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(data, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
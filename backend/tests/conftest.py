@@ -0,0 +1,89 @@
+import itertools
+import subprocess
+from pathlib import Path
+from typing import Callable, Dict
+
+import pytest
+
+from app.core.config import settings
+from app.services.resolution_cache import clear_resolution_cache
+from app.services.scan_cache import clear_scan_cache
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_data_dirs(tmp_path_factory):
+    """Keep persistent indexes written during tests out of ./data."""
+    original = settings.FILE_INDEX_DIR, settings.IMPORT_CACHE_PATH
+    settings.FILE_INDEX_DIR = tmp_path_factory.mktemp("file_index")
+    settings.IMPORT_CACHE_PATH = tmp_path_factory.mktemp("import_cache") / "imports.sqlite"
+    yield
+    settings.FILE_INDEX_DIR, settings.IMPORT_CACHE_PATH = original
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    """Start and end every test with empty process-wide scan and resolution caches."""
+    clear_scan_cache()
+    clear_resolution_cache()
+    yield
+    clear_scan_cache()
+    clear_resolution_cache()
+
+
+@pytest.fixture
+def make_repo(tmp_path) -> Callable[[Dict[str, str]], Path]:
+    """Factory writing {relative path: content} into a fresh directory under tmp_path."""
+    counter = itertools.count()
+
+    def _make_repo(files: Dict[str, str]) -> Path:
+        # .resolve() so paths compare equal to what the scanner reports
+        repo = (tmp_path / f"repo{next(counter)}").resolve()
+        repo.mkdir()
+        for rel_path, content in files.items():
+            full = repo / rel_path
+            full.parent.mkdir(parents=True, exist_ok=True)
+            full.write_text(content)
+        return repo
+
+    return _make_repo
+
+
+@pytest.fixture
+def git() -> Callable[..., None]:
+    """Run a git command inside a repository with a throwaway identity."""
+
+    def _git(repo: Path, *args: str) -> None:
+        subprocess.run(
+            ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            check=True,
+            capture_output=True,
+        )
+
+    return _git
+
+
+@pytest.fixture
+def commit_all(git) -> Callable[[Path, str], None]:
+    """Stage everything in a repository and commit it."""
+
+    def _commit_all(repo: Path, message: str) -> None:
+        git(repo, "add", "-A")
+        git(repo, "commit", "-q", "-m", message)
+
+    return _commit_all
+
+
+@pytest.fixture
+def make_git_repo(make_repo, git, commit_all) -> Callable[..., Path]:
+    """Like make_repo, then `git init`; files are committed unless commit=False (staged only)."""
+
+    def _make_git_repo(files: Dict[str, str], commit: bool = True) -> Path:
+        repo = make_repo(files)
+        git(repo, "init", "-q")
+        if commit:
+            commit_all(repo, "init")
+        else:
+            git(repo, "add", "-A")
+        return repo
+
+    return _make_git_repo
@@ -0,0 +1,89 @@
+"""
+Unit tests for tree-sitter AST extraction.
+"""
+import pytest
+
+from app.services.ast import tree_sitter_backend
+from app.services.ast.ast_service import extract_ast
+from app.services.ast.ast_summary_service import summarize_ast
+
+pytest.importorskip("tree_sitter")
+
+
+def _outline(node) -> list:
+    return [(child["node_type"], child["name"], _outline(child)) for child in node["children"]]
+
+
+class TestParseFile:
+    def test_python_structure(self):
+        pytest.importorskip("tree_sitter_python")
+        source = b"class A:\n    async def f(self):\n        def g():\n            pass\n\n@dec\ndef h():\n    pass\n"
+        ast_file = tree_sitter_backend.parse_file("a.py", "python", source)
+        assert _outline(ast_file["root"]) == [
+            ("class", "A", [("async_function", "f", [("function", "g", [])])]),
+            ("function", "h", []),
+        ]
+        assert ast_file["root"]["children"][1]["start_line"] == 7
+
+    def test_javascript_named_functions_only(self):
+        pytest.importorskip("tree_sitter_javascript")
+        source = (
+            b"class A { m() {} static async n() {} f = () => 1 }\n"
+            b"const g = async () => [1].map(x => x);\n"
+        )
+        ast_file = tree_sitter_backend.parse_file("a.js", "javascript", source)
+        assert _outline(ast_file["root"]) == [
+            ("class", "A", [("function", "m", []), ("async_function", "n", []), ("function", "f", [])]),
+            ("async_function", "g", []),
+        ]
+
+    def test_tsx_uses_tsx_grammar(self):
+        pytest.importorskip("tree_sitter_typescript")
+        source = b"abstract class B { y(): void {} }\nexport const C = (p: P) => <div>{p.x}</div>;\n"
+        ast_file = tree_sitter_backend.parse_file("a.tsx", "typescript", source)
+        assert _outline(ast_file["root"]) == [
+            ("class", "B", [("function", "y", [])]),
+            ("function", "C", []),
+        ]
+
+    def test_java_types_and_methods(self):
+        pytest.importorskip("tree_sitter_java")
+        source = b"class A { A() {} void m() { Runnable r = () -> {}; } enum E { X } }\n"
+        ast_file = tree_sitter_backend.parse_file("A.java", "java", source)
+        assert _outline(ast_file["root"]) == [
+            ("class", "A", [("function", "A", []), ("function", "m", []), ("class", "E", [])]),
+        ]
+
+
+class TestExtractAst:
+    def test_unsupported_language_returns_none(self, make_repo):
+        repo = make_repo({"main.go": "package main\n"})
+        assert extract_ast(repo_path=repo, language="go") is None
+        assert extract_ast(repo_path=repo, language="cobol") is None
+
+    def test_missing_backend_returns_none(self, make_repo, monkeypatch):
+        monkeypatch.setattr(tree_sitter_backend, "available", lambda language: False)
+        repo = make_repo({"a.py": "def f():\n    pass\n"})
+        assert extract_ast(repo_path=repo, language="python") is None
+
+    def test_result_feeds_summary(self, make_repo):
+        pytest.importorskip("tree_sitter_python")
+        repo = make_repo({
+            "pkg/a.py": "class A:\n    def f(self):\n        pass\n",
+            "pkg/b.py": "def g():\n    pass\n",
+            "web/x.js": "function ignored() {}\n",
+        })
+        result = extract_ast(repo_path=repo, language="python", workers=1)
+        assert [f["file_path"] for f in result["files"]] == ["pkg/a.py", "pkg/b.py"]
+        summary = summarize_ast(result)
+        assert summary["files_analyzed"] == 2
+        assert summary["total_classes"] == 1
+        assert summary["total_functions"] == 2
+        assert summary["max_nesting_depth"] == 3
+
+    def test_deterministic_across_workers_and_chunks(self, make_repo):
+        pytest.importorskip("tree_sitter_python")
+        files = {f"pkg/m{i}.py": f"class C{i}:\n    def run(self):\n        pass\n" for i in range(30)}
+        serial = extract_ast(repo_path=make_repo(files), language="python", workers=1)
+        pooled = extract_ast(repo_path=make_repo(files), language="python", workers=2, chunk_size=4)
+        assert pooled["files"] == serial["files"]
@@ -15,6 +15,8 @@ from app.services.analysis_snapshot_service import (
     _extract_go_imports,
     _extract_javascript_imports,
     _extract_python_imports,
+    _extract_python_imports_ast,
+    _extract_rust_imports,
     _resolve_internal_import,
 )
 from app.services.agentic_analysis_service import _is_noise_file
@@ -106,6 +108,45 @@ class TestExtractPythonImports:
     def test_no_imports(self):
         assert _extract_python_imports("x = 1\nprint(x)\n") == []
 
+    def test_parenthesised_multiline_from_import(self):
+        content = "from app.core import (\n    config,\n    logging as log,\n)\nimport os\n"
+        assert _extract_python_imports(content) == ["app.core", "os"]
+
+    def test_backslash_continuations(self):
+        content = "import os, \\\n    sys as system\nfrom a.b \\\n    import c\n"
+        assert _extract_python_imports(content) == ["os", "sys", "a.b"]
+
+    def test_nested_and_semicolon_separated_imports(self):
+        content = (
+            "from typing import TYPE_CHECKING\n"
+            "if TYPE_CHECKING:\n"
+            "    from app.models import User\n"
+            "try: import ujson as json\n"
+            "except ImportError: import json\n"
+            "import a; import b.c\n"
+        )
+        assert _extract_python_imports(content) == ["typing", "app.models", "ujson", "json", "a", "b.c"]
+
+    def test_ignores_imports_in_strings_and_comments(self):
+        content = (
+            "# import commented\n"
+            '"""\nimport in_docstring\n"""\n'
+            "x = 'import quoted'\n"
+            "y = r'\\'; import after_raw\n"
+            "from_import = 1\n"
+        )
+        assert _extract_python_imports(content) == ["after_raw"]
+
+    def test_bare_relative_imports(self):
+        assert _extract_python_imports("from . import a\nfrom .. import b\n") == [".", ".."]
+
+    def test_matches_ast_on_backend_sources(self):
+        sources = sorted(Path(__file__).resolve().parents[1].joinpath("app").rglob("*.py"))
+        assert sources
+        for source in sources:
+            content = source.read_text()
+            assert _extract_python_imports(content) == _extract_python_imports_ast(content), source
+
 
 # ---------------------------------------------------------------------------
 # JavaScript/TypeScript import extraction
@@ -139,6 +180,41 @@ class TestExtractJavaScriptImports:
     def test_empty_content(self):
         assert _extract_javascript_imports("") == []
 
+    def test_export_from(self):
+        content = "export * from './all';\nexport { a as b } from \"./named\";\nexport type { T } from './t';\n"
+        assert _extract_javascript_imports(content) == ["./all", "./named", "./t"]
+
+    def test_dynamic_import(self):
+        content = "const lazy = () => import('./lazy');\nconst m = await import(\n  \"./multi\"\n);\n"
+        assert _extract_javascript_imports(content) == ["./lazy", "./multi"]
+
+    def test_typescript_import_forms(self):
+        content = (
+            "import type { Props } from './types';\n"
+            "import fs = require('fs');\n"
+            "import {\n  a,\n  type B,\n  c as d,\n} from '@scope/pkg';\n"
+        )
+        assert _extract_javascript_imports(content) == ["./types", "fs", "@scope/pkg"]
+
+    def test_ignores_comments_strings_and_templates(self):
+        content = (
+            "// import a from 'line-comment';\n"
+            "/* require('block-comment') */\n"
+            "const s = \"import b from 'in-string'\";\n"
+            "const t = `require('in-template')`;\n"
+            "obj.require('method');\n"
+            "const url = import.meta.url;\n"
+            "import real from './real';\n"
+        )
+        assert _extract_javascript_imports(content) == ["./real"]
+
+    def test_minified_spacing(self):
+        assert _extract_javascript_imports('import{a}from"x";export*from"y";') == ["x", "y"]
+
+    def test_source_order(self):
+        content = "const z = require('z');\nimport a from 'a';\nexport * from 'm';\n"
+        assert _extract_javascript_imports(content) == ["z", "a", "m"]
+
 
 # ---------------------------------------------------------------------------
 # Java import extraction
@@ -169,6 +245,10 @@ class TestExtractJavaImports:
     def test_no_imports(self):
         assert _extract_java_imports("public class Foo {}") == []
 
+    def test_wildcard_imports(self):
+        code = "import java.util.*;\nimport static org.junit.Assert.*;\n"
+        assert _extract_java_imports(code) == ["java.util.*", "org.junit.Assert.*"]
+
 
 # ---------------------------------------------------------------------------
 # Go import extraction
@@ -198,6 +278,53 @@ class TestExtractGoImports:
     def test_empty_content(self):
         assert _extract_go_imports("") == []
 
+    def test_every_block_up_to_first_declaration(self):
+        code = (
+            "package main\n\n"
+            "import (\n\t\"fmt\" // formatting (see docs)\n\t_ \"embed\"\n)\n\n"
+            "import (\n\t. \"math\"; \"os\"\n\t`raw/path`\n)\n"
+            "import alias \"example.com/mod/b\"\n\n"
+            "func main() {}\n\n"
+            "import \"after/declaration\"\n"
+        )
+        assert _extract_go_imports(code) == ["fmt", "embed", "math", "os", "raw/path", "example.com/mod/b"]
+
+    def test_cgo_preamble_is_ignored(self):
+        code = (
+            "package main\n\n"
+            "// import \"line-comment\"\n"
+            "/*\n#include <stdio.h>\nimport \"block-comment\"\n*/\n"
+            "import \"C\"\n\n"
+            "import \"unsafe\"\n"
+        )
+        assert _extract_go_imports(code) == ["C", "unsafe"]
+
+
+class TestExtractRustImports:
+    def test_use_trees_are_expanded(self):
+        code = (
+            "use std::collections::HashMap;\n"
+            "pub(crate) use crate::models::{self, user::User, Post as P};\n"
+            "use ::serde::{Deserialize,\n    Serialize};\n"
+            "use super::super::db::*;\n"
+        )
+        assert _extract_rust_imports(code) == [
+            "std::collections::HashMap",
+            "crate::models",
+            "crate::models::user::User",
+            "crate::models::Post",
+            "serde::Deserialize",
+            "serde::Serialize",
+            "super::super::db",
+        ]
+
+    def test_mod_declarations_and_extern_crate(self):
+        code = "extern crate alias;\npub mod api;\nmod util;\nmod inline { fn f() {} }\n"
+        assert _extract_rust_imports(code) == ["api", "util", "alias"]
+
+    def test_empty_content(self):
+        assert _extract_rust_imports("") == []
+
 
 # ---------------------------------------------------------------------------
 # _extract_imports_for_file dispatch
@@ -358,6 +485,88 @@ class TestComputeDependencyGraphSummary:
             assert top["source"] == "hub.py"
             assert top["imports_count"] == 4
 
+    def test_go_module_imports_become_internal_edges(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp).resolve()
+            (repo / "cmd/server").mkdir(parents=True)
+            (repo / "internal/store").mkdir(parents=True)
+            (repo / "go.mod").write_text("module example.com/svc\n\ngo 1.22\n")
+            (repo / "cmd/server/main.go").write_text("package main\n")
+            (repo / "internal/store/store.go").write_text("package store\n")
+            (repo / "internal/store/cache.go").write_text("package store\n")
+            state = self._make_state([
+                {"source": "cmd/server/main.go", "imports": ["example.com/svc/internal/store", "fmt"]},
+            ], repo)
+            result = _compute_dependency_graph_summary(state)
+            assert result["internal_edges"] == [
+                {"from": "cmd/server/main.go", "to": "internal/store/store.go"},
+            ]
+
+    def test_rust_mod_and_use_paths_become_internal_edges(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp).resolve()
+            (repo / "src/models").mkdir(parents=True)
+            (repo / "Cargo.toml").write_text('[package]\nname = "svc"\nversion = "0.1.0"\n')
+            (repo / "src/main.rs").write_text("mod models;\n")
+            (repo / "src/models/mod.rs").write_text("pub mod user;\n")
+            (repo / "src/models/user.rs").write_text("")
+            state = self._make_state([
+                {"source": "src/main.rs", "imports": ["models", "crate::models::user::User", "std::fmt"]},
+            ], repo)
+            result = _compute_dependency_graph_summary(state)
+            assert result["internal_edges"] == [
+                {"from": "src/main.rs", "to": "src/models/mod.rs"},
+                {"from": "src/main.rs", "to": "src/models/user.rs"},
+            ]
+
+    def test_java_imports_resolve_through_package_declarations(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp).resolve()
+            (repo / "src/main/java/com/acme/app").mkdir(parents=True)
+            (repo / "src/main/java/com/acme/model").mkdir(parents=True)
+            (repo / "src/main/java/com/acme/app/App.java").write_text("package com.acme.app;\n")
+            (repo / "src/main/java/com/acme/model/User.java").write_text("package com.acme.model;\n")
+            (repo / "src/main/java/com/acme/model/Role.java").write_text("package com.acme.model;\n")
+            state = self._make_state([
+                {"source": "src/main/java/com/acme/app/App.java", "imports": ["com.acme.model.User", "java.util.List"]},
+            ], repo)
+            result = _compute_dependency_graph_summary(state)
+            assert result["internal_edges"] == [
+                {"from": "src/main/java/com/acme/app/App.java", "to": "src/main/java/com/acme/model/User.java"},
+            ]
+
+    def test_c_includes_resolve_through_include_dirs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp).resolve()
+            (repo / "include/net").mkdir(parents=True)
+            (repo / "src").mkdir()
+            (repo / "include/net/socket.h").write_text("")
+            (repo / "src/socket.c").write_text("")
+            (repo / "src/internal.h").write_text("")
+            state = self._make_state([
+                {"source": "src/socket.c", "imports": ["net/socket.h", "internal.h", "stdio.h"]},
+            ], repo)
+            result = _compute_dependency_graph_summary(state)
+            assert result["internal_edges"] == [
+                {"from": "src/socket.c", "to": "include/net/socket.h"},
+                {"from": "src/socket.c", "to": "src/internal.h"},
+            ]
+
+    def test_tsconfig_aliases_become_internal_edges(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp).resolve()
+            (repo / "src/components").mkdir(parents=True)
+            (repo / "tsconfig.json").write_text('{"compilerOptions": {"paths": {"@/*": ["./src/*"]}}}')
+            (repo / "src/main.ts").write_text("")
+            (repo / "src/components/Button.tsx").write_text("")
+            state = self._make_state([
+                {"source": "src/main.ts", "imports": ["@/components/Button", "react"]},
+            ], repo)
+            result = _compute_dependency_graph_summary(state)
+            assert result["internal_edges"] == [
+                {"from": "src/main.ts", "to": "src/components/Button.tsx"},
+            ]
+
     def test_internal_edges_capped_at_500(self):
         with tempfile.TemporaryDirectory() as tmp:
             repo = Path(tmp).resolve()
@@ -0,0 +1,126 @@
+"""
+Unit tests for the incremental dependency graph.
+"""
+import shutil
+from pathlib import Path
+
+import pytest
+
+from app.services import import_resolution
+from app.services.analysis_snapshot_service import (
+    _copy_state,
+    _mark_explored,
+    _record_dependency_edge,
+    _resolved_import_targets,
+)
+from app.services.dependency_graph import (
+    DependencyGraph,
+    attach_dependency_graph,
+    attached_dependency_graph,
+    detach_dependency_graph,
+)
+from app.services.import_indexer import merge_dependency_edges
+
+
+def _make_state(repo: Path, edges=(), explored=()) -> dict:
+    return {
+        "repo_id": "r",
+        "current_summary": {"local_path": str(repo)},
+        "package_roots": [],
+        "explored_files": list(explored),
+        "dependency_edges": [dict(edge) for edge in edges],
+    }
+
+
+REPO_FILES = {
+    "web/index.js": "",
+    "web/api.js": "",
+    "web/ui/button.js": "",
+    "web/ui/form.js": "",
+}
+
+
+class TestDependencyGraph:
+    def test_incremental_updates_match_a_rebuild(self, make_repo):
+        repo = make_repo(REPO_FILES)
+        state = _make_state(repo, explored=["web/index.js"])
+        graph = attach_dependency_graph(state)
+        for source, imports in [
+            ("web/index.js", ["./api", "./ui/button", "react"]),
+            ("web/ui/form.js", ["./button", "react", "react-dom"]),
+            ("web/api.js", ["axios"]),
+            ("web/index.js", ["./api", "./ui/form", "react", "lodash/fp"]),
+        ]:
+            _record_dependency_edge(state, {"file_path": source, "imported_modules": imports})
+        _mark_explored(state, "web/ui/form.js")
+        merge_dependency_edges(state, [{"source": "web/api.js", "imports": ["./ui/form"]}])
+
+        rebuilt = DependencyGraph.for_state(state)
+        assert graph.summary() == rebuilt.summary()
+        assert graph.import_targets() == rebuilt.import_targets()
+        assert graph.import_targets() == {"web/api.js", "web/ui/form.js", "web/ui/button.js"}
+        counts = {item["module"]: item["count"] for item in graph.summary()["most_imported_modules"]}
+        assert counts["react"] == counts["./ui/form"] == 2
+        assert counts["lodash/fp"] == 1
+        assert "./ui/button" not in counts
+        assert "axios" not in counts
+
+    def test_only_explored_sources_contribute_targets(self, make_repo):
+        repo = make_repo(REPO_FILES)
+        graph = DependencyGraph(repo)
+        graph.set_imports("web/index.js", ["./api"])
+        graph.set_imports("web/ui/form.js", ["./button"])
+        assert not graph.import_targets()
+        graph.mark_explored("web/index.js")
+        assert graph.import_targets() == {"web/api.js"}
+        graph.set_imports("web/index.js", ["./ui/form"])
+        assert graph.import_targets() == {"web/ui/form.js"}
+        graph.remove("web/index.js")
+        assert not graph.import_targets()
+        assert graph.summary()["internal_edges"] == [{"from": "web/ui/form.js", "to": "web/ui/button.js"}]
+
+    def test_new_file_resolves_only_its_own_imports(self, make_repo, monkeypatch):
+        repo = make_repo(REPO_FILES)
+        state = _make_state(repo, edges=[
+            {"source": "web/index.js", "imports": ["./api", "./ui/form"]},
+            {"source": "web/ui/form.js", "imports": ["./button"]},
+        ])
+        graph = attach_dependency_graph(state)
+        summary = graph.summary()
+        assert graph.summary() is summary
+
+        resolved = []
+        real_resolve = import_resolution.ResolutionIndex._resolve
+
+        def counting(self, source_file, specifier):
+            resolved.append((source_file, specifier))
+            return real_resolve(self, source_file, specifier)
+
+        monkeypatch.setattr(import_resolution.ResolutionIndex, "_resolve", counting)
+        _record_dependency_edge(state, {"file_path": "web/api.js", "imported_modules": ["./ui/button", "axios"]})
+        assert resolved == [("web/api.js", "./ui/button"), ("web/api.js", "axios")]
+        assert graph.summary() is not summary
+        assert {"from": "web/api.js", "to": "web/ui/button.js"} in graph.summary()["internal_edges"]
+
+    def test_copied_state_gets_an_independent_graph(self, make_repo):
+        repo = make_repo(REPO_FILES)
+        state = _make_state(repo, edges=[{"source": "web/index.js", "imports": ["./api"]}])
+        attach_dependency_graph(state)
+        copied = _copy_state(state)
+        _mark_explored(copied, "web/index.js")
+        assert _resolved_import_targets(copied) == {"web/api.js"}
+        assert not _resolved_import_targets(state)
+        detach_dependency_graph(copied)
+        assert attached_dependency_graph(copied) is None
+        assert _resolved_import_targets(copied) == {"web/api.js"}
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_rebuilt_after_rescan(self, make_git_repo, commit_all):
+        repo = make_git_repo(REPO_FILES)
+        state = _make_state(repo, edges=[{"source": "web/index.js", "imports": ["./utils"]}], explored=["web/index.js"])
+        graph = attach_dependency_graph(state)
+        assert not graph.import_targets()
+        (repo / "web/utils.js").write_text("")
+        commit_all(repo, "more")
+        assert _resolved_import_targets(state) == {"web/utils.js"}
+        assert attached_dependency_graph(state) is not graph
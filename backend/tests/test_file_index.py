@@ -0,0 +1,86 @@
+"""
+Unit tests for the persistent file fingerprint index.
+"""
+import os
+from pathlib import Path
+
+from app.services import repo_scanner
+from app.services.analysis_snapshot_service import IMPORT_EXTRACTOR_VERSION, _inspect_file
+from app.services.file_index import get_file_index, remove_file_index
+from app.services.repo_scanner import scan_repository
+
+
+def _state(repo: Path) -> dict:
+    return {"current_summary": {"local_path": str(repo)}}
+
+
+class TestFileIndex:
+    def test_inspect_records_fingerprint(self, make_repo):
+        repo = make_repo({"app/main.py": "import os\nimport sys\n"})
+        _inspect_file(_state(repo), "app/main.py")
+        stat = (repo / "app/main.py").stat()
+        record = get_file_index(repo).lookup(
+            "app/main.py", stat.st_size, stat.st_mtime_ns, IMPORT_EXTRACTOR_VERSION
+        )
+        assert record["line_count"] == 2
+        assert record["imports"] == ["os", "sys"]
+        assert record["language"] == "python"
+        assert len(record["content_hash"]) == 40
+
+    def test_unchanged_file_is_served_from_index(self, make_repo):
+        repo = make_repo({"main.py": "import os\n"})
+        target = repo / "main.py"
+        _inspect_file(_state(repo), "main.py")
+        stat = target.stat()
+        # Same size and mtime but different bytes: only the index can explain "os".
+        target.write_text("import re\n")
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert _inspect_file(_state(repo), "main.py")["imported_modules"] == ["os"]
+
+    def test_changed_file_is_reread(self, make_repo):
+        repo = make_repo({"main.py": "import os\n"})
+        _inspect_file(_state(repo), "main.py")
+        target = repo / "main.py"
+        target.write_text("import json\nimport re\n")
+        stat = target.stat()
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert _inspect_file(_state(repo), "main.py")["imported_modules"] == ["json", "re"]
+
+    def test_stale_extractor_version_misses(self, make_repo):
+        repo = make_repo({"main.py": "import os\n"})
+        _inspect_file(_state(repo), "main.py")
+        stat = (repo / "main.py").stat()
+        index = get_file_index(repo)
+        assert index.lookup("main.py", stat.st_size, stat.st_mtime_ns, IMPORT_EXTRACTOR_VERSION + 1) is None
+
+    def test_scan_line_counts_come_from_index(self, make_repo, monkeypatch):
+        repo = make_repo({"a.py": "a\nb\n", "b.py": "x\n"})
+        _inspect_file(_state(repo), "a.py")
+        counted = []
+        real_count = repo_scanner.file_io.count_lines
+
+        def counting(path):
+            counted.append(path.name)
+            return real_count(path)
+
+        monkeypatch.setattr(repo_scanner.file_io, "count_lines", counting)
+        assert scan_repository(repo, count_lines=True)["file_line_counts"] == {"a.py": 2, "b.py": 1}
+        assert counted == ["b.py"]
+        assert scan_repository(repo, count_lines=True)["file_line_counts"] == {"a.py": 2, "b.py": 1}
+        assert counted == ["b.py"]
+        (repo / "b.py").write_text("x\ny\nz\n")
+        assert scan_repository(repo, count_lines=True)["file_line_counts"] == {"a.py": 2, "b.py": 3}
+        assert counted == ["b.py", "b.py"]
+        # a scanner-only row carries no imports, so it is not an import hit
+        stat = (repo / "b.py").stat()
+        assert get_file_index(repo).lookup("b.py", stat.st_size, stat.st_mtime_ns, IMPORT_EXTRACTOR_VERSION) is None
+
+    def test_prune_and_remove(self, make_repo):
+        repo = make_repo({"a.py": "", "b.py": ""})
+        _inspect_file(_state(repo), "a.py")
+        _inspect_file(_state(repo), "b.py")
+        index = get_file_index(repo)
+        assert index.prune(["a.py"]) == 1
+        db_path = index.db_path
+        remove_file_index(repo)
+        assert not db_path.exists()
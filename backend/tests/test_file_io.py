@@ -0,0 +1,108 @@
+"""
+Unit tests for bounded-memory inspection reads.
+"""
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from app.services import file_io
+from app.services.agentic_analysis_service import _file_preview
+from app.services.analysis_snapshot_service import _extract_go_imports
+
+
+@pytest.fixture
+def write(tmp_path):
+    def _write(name: str, data: bytes) -> Path:
+        path = tmp_path / name
+        path.write_bytes(data)
+        return path
+
+    return _write
+
+
+class TestReadSource:
+    def test_hash_and_lines_match_whole_file(self, write, monkeypatch):
+        monkeypatch.setattr(file_io, "CHUNK_SIZE", 7)
+        data = b"line one\nline two\r\nline three"
+        digest, line_count, text = file_io.read_source(write("a.py", data))
+        assert digest == hashlib.sha1(data).hexdigest()
+        assert line_count == 3
+        assert text == data.decode()
+
+    def test_empty_file(self, write):
+        assert file_io.read_source(write("e.py", b"")) == (hashlib.sha1(b"").hexdigest(), 0, "")
+
+    def test_go_header_stops_before_first_declaration(self, write, monkeypatch):
+        monkeypatch.setattr(file_io, "CHUNK_SIZE", 16)
+        data = b'package main\n\nimport (\n\t"fmt"\n\t"os"\n)\n\nfunc main() {\n\tfmt.Println("import \\"x\\"")\n}\n'
+        digest, line_count, text = file_io.read_source(write("main.go", data), header_language="go")
+        assert text == 'package main\n\nimport (\n\t"fmt"\n\t"os"\n)\n\n'
+        assert digest == hashlib.sha1(data).hexdigest()
+        assert line_count == 10
+
+    def test_java_header_skips_license_and_stops_at_annotation(self, write):
+        data = (
+            b"/*\n * Licensed under ...\n */\npackage a.b;\n\n"
+            b"import java.util.List;\nimport static a.C.f;\n\n"
+            b"@Deprecated\npublic final class A {}\n"
+        )
+        text = file_io.read_source(write("A.java", data), header_language="java")[2]
+        assert text.endswith("import static a.C.f;\n\n")
+
+    @pytest.mark.parametrize("chunk_size", [8, 1 << 20])
+    def test_go_header_skips_cgo_preamble(self, write, monkeypatch, chunk_size):
+        monkeypatch.setattr(file_io, "CHUNK_SIZE", chunk_size)
+        data = (
+            b"package app\n\n"
+            b"/*\n#include <stdlib.h>\nconst char *version(void);\ntype int handle;\n*/\n"
+            b'import "C"\n\n'
+            b'// func helpers below\nimport (\n\t"fmt" // const note\n\t"example.com/app/internal/store"\n)\n\n'
+            b"const name = \"app\"\n\nimport \"late\"\n"
+        )
+        path = write("cgo.go", data)
+        text = file_io.read_source(path, header_language="go")[2]
+        assert _extract_go_imports(text) == ["C", "fmt", "example.com/app/internal/store"]
+        assert text.endswith(")\n\n")
+        assert file_io.read_header(path, "go") == text
+
+    def test_read_header_stops_early(self, write, monkeypatch):
+        monkeypatch.setattr(file_io, "CHUNK_SIZE", 16)
+        data = b"package a.b;\n\nimport x.Y;\n\nclass A {\n" + b"    int f;\n" * 1000 + b"}\n"
+        chunks = []
+        real_chunks = file_io._chunks
+
+        def counting(path):
+            for chunk in real_chunks(path):
+                chunks.append(len(chunk))
+                yield chunk
+
+        monkeypatch.setattr(file_io, "_chunks", counting)
+        assert file_io.read_header(write("A.java", data), "java") == "package a.b;\n\nimport x.Y;\n\n"
+        assert sum(chunks) < 64
+
+    def test_header_languages_only(self, write):
+        data = b"import os\n\ndef f():\n    import json\n"
+        assert file_io.read_source(write("a.py", data), header_language="python")[2] == data.decode()
+
+
+class TestPreviewAndLines:
+    def test_count_lines(self, write):
+        assert file_io.count_lines(write("a.txt", b"a\nb\nc")) == 3
+        assert file_io.count_lines(write("b.txt", b"a\n")) == 1
+        assert file_io.count_lines(Path("/nonexistent/file")) == 0
+
+    def test_preview_reads_bounded_prefix(self, write, monkeypatch):
+        monkeypatch.setattr(file_io, "PREVIEW_MAX_BYTES", 10)
+        lines, total = file_io.read_preview(write("a.txt", b"one\ntwo\nthree\nfour\n"), max_lines=40)
+        assert lines == ["one", "two", "th"]
+        assert total == 4
+
+    def test_file_preview_reports_remaining_lines(self, write):
+        path = write("big.py", "".join(f"x{i} = {i}\n" for i in range(100)).encode())
+        preview = _file_preview(path)
+        assert preview.splitlines()[0] == "x0 = 0"
+        assert preview.endswith("... (60 more lines)")
+
+    def test_iter_lines_strips_endings(self, write):
+        assert list(file_io.iter_lines(write("a.txt", b"a\r\nb\nc"))) == ["a", "b", "c"]
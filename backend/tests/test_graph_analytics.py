@@ -0,0 +1,111 @@
+"""
+Unit tests for CSR graph analytics.
+"""
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.services.dependency_graph import DependencyGraph
+from app.services.graph_analytics import (
+    CSRGraph,
+    analyze,
+    pagerank,
+    strongly_connected_components,
+    topological_layers,
+)
+
+
+# a -> b -> c -> a is a cycle; d imports into it, f imports d; e imports itself
+EDGES = [("a", "b"), ("b", "c"), ("c", "a"), ("d", "a"), ("c", "e"), ("e", "e"), ("f", "d")]
+
+
+def _reachable(edges, start):
+    seen, todo = {start}, [start]
+    while todo:
+        node = todo.pop()
+        for source, target in edges:
+            if source == node and target not in seen:
+                seen.add(target)
+                todo.append(target)
+    return seen
+
+
+class TestCSRGraph:
+    def test_from_edges_assigns_ids_in_path_order(self):
+        graph = CSRGraph.from_edges(reversed(EDGES))
+        assert graph.nodes == ["a", "b", "c", "d", "e", "f"]
+        assert graph.indptr.tolist() == [0, 1, 2, 4, 5, 6, 7]
+        assert graph.indices.tolist() == [1, 2, 0, 4, 0, 4, 3]
+        assert graph.in_degree().tolist() == [2, 1, 1, 1, 2, 0]
+        assert graph.out_degree().tolist() == [1, 1, 2, 1, 1, 1]
+
+    def test_neighbours_concatenates_slices(self):
+        graph = CSRGraph.from_edges(EDGES)
+        assert graph.neighbours(np.array([2, 5, 0])).tolist() == [0, 4, 3, 1]
+        assert graph.neighbours(np.array([], dtype=np.int64)).tolist() == []
+
+    def test_transpose_and_subgraph(self):
+        graph = CSRGraph.from_edges(EDGES)
+        assert graph.transpose().neighbours(np.array([0])).tolist() == [2, 3]
+        sub = graph.subgraph(np.array([0, 1, 2]))
+        assert sub.indptr.tolist() == [0, 1, 2, 3]
+        assert sub.indices.tolist() == [1, 2, 0]
+
+
+class TestAnalytics:
+    def test_pagerank_matches_reference_iteration(self):
+        graph = CSRGraph.from_edges(EDGES + [("b", "d")])
+        n, damping = graph.node_count, 0.85
+        out = {i: graph.indices[graph.indptr[i]:graph.indptr[i + 1]].tolist() for i in range(n)}
+        rank = [1.0 / n] * n
+        for _ in range(200):
+            dangling = sum(rank[i] for i in range(n) if not out[i])
+            updated = [(1 - damping) / n + damping * dangling / n] * n
+            for i in range(n):
+                for j in out[i]:
+                    updated[j] += damping * rank[i] / len(out[i])
+            rank = updated
+        assert pagerank(graph, tolerance=1e-12) == pytest.approx(rank, abs=1e-9)
+        assert pagerank(graph).sum() == pytest.approx(1.0)
+
+    def test_components_match_mutual_reachability(self):
+        rng = random.Random(7)
+        for _ in range(20):
+            nodes = [f"n{i:02d}" for i in range(rng.randint(2, 30))]
+            edges = {(rng.choice(nodes), rng.choice(nodes)) for _ in range(rng.randint(1, 45))}
+            graph = CSRGraph.from_edges(edges)
+            labels = strongly_connected_components(graph)
+            reach = {node: _reachable(edges, node) for node in graph.nodes}
+            for i, u in enumerate(graph.nodes):
+                for j, v in enumerate(graph.nodes):
+                    assert (labels[i] == labels[j]) == (v in reach[u] and u in reach[v])
+
+    def test_layers_follow_longest_import_chain(self):
+        graph = CSRGraph.from_edges(EDGES + [("f", "e")])
+        layers = topological_layers(graph, strongly_connected_components(graph))
+        assert dict(zip(graph.nodes, layers.tolist())) == {"e": 0, "a": 1, "b": 1, "c": 1, "d": 2, "f": 3}
+
+    def test_analyze_summary_fields(self):
+        summary = analyze(CSRGraph.from_edges(EDGES))
+        assert summary["import_cycles"] == [{"size": 3, "files": ["a", "b", "c"]}]
+        assert summary["central_files"][0]["file"] == "e"
+        assert summary["highest_fan_in"][:2] == [{"file": "a", "fan_in": 2}, {"file": "e", "fan_in": 2}]
+        assert summary["highest_fan_out"][0] == {"file": "c", "fan_out": 2}
+        assert [layer["files"] for layer in summary["layers"]] == [["e"], ["a", "b", "c"], ["d"], ["f"]]
+
+    def test_empty_graph(self):
+        assert analyze(CSRGraph.from_edges([])) == {
+            "central_files": [], "highest_fan_in": [], "highest_fan_out": [], "import_cycles": [], "layers": [],
+        }
+
+    def test_dependency_graph_summary_reports_cycles(self, make_repo):
+        repo = make_repo({"a.js": "", "b.js": "", "main.js": ""})
+        graph = DependencyGraph(repo)
+        graph.set_imports("a.js", ["./b"])
+        graph.set_imports("b.js", ["./a"])
+        graph.set_imports("main.js", ["./a", "react"])
+        summary = graph.summary()
+        assert summary["import_cycles"] == [{"size": 2, "files": ["a.js", "b.js"]}]
+        assert summary["layers"][1] == {"layer": 1, "file_count": 1, "files": ["main.js"]}
@@ -0,0 +1,149 @@
+"""
+Unit tests for the scanner ignore-rule engine.
+"""
+import shutil
+
+import pytest
+
+from app.core.config import settings
+from app.services.ignore_rules import IgnoreRules, _compile_gitignore_line
+from app.services.repo_scanner import scan_repository
+
+
+def _rules(*lines: str, base: str = "") -> IgnoreRules:
+    return IgnoreRules(tuple(p for p in (_compile_gitignore_line(l, base) for l in lines) if p))
+
+
+class TestGitignorePatterns:
+    def test_unanchored_name_matches_at_any_depth(self):
+        rules = _rules("*.gen.py")
+        assert rules.ignores_path("a.gen.py") is True
+        assert rules.ignores_path("deep/pkg/a.gen.py") is True
+        assert rules.ignores_path("a.py") is False
+
+    def test_anchored_pattern_only_matches_from_base(self):
+        rules = _rules("/generated")
+        assert rules.ignores_path("generated/schema.py") is True
+        assert rules.ignores_path("src/generated/schema.py") is False
+
+    def test_directory_only_pattern(self):
+        rules = _rules("out/")
+        assert rules.ignores_path("out/main.js") is True
+        assert rules.ignores_path("src/out/main.js") is True
+        assert rules.ignores_path("out") is False
+
+    def test_anchored_directory_only_pattern(self):
+        rules = _rules("/lib/")
+        assert rules.ignores_path("lib/util.ts") is True
+        assert rules.ignores_path("src/lib/util.ts") is False
+        assert rules.ignores_path("lib") is False
+
+    def test_double_star(self):
+        rules = _rules("docs/**/*.py")
+        assert rules.ignores_path("docs/conf.py") is True
+        assert rules.ignores_path("docs/a/b/conf.py") is True
+        assert rules.ignores_path("src/docs/conf.py") is False
+
+    def test_negation_reincludes(self):
+        rules = _rules("*.py", "!keep.py")
+        assert rules.ignores_path("drop.py") is True
+        assert rules.ignores_path("keep.py") is False
+
+    def test_last_matching_pattern_wins(self):
+        rules = _rules("!keep.py", "*.py")
+        assert rules.ignores_path("keep.py") is True
+        rules = _rules("*.py", "!*.py", "drop.py")
+        assert rules.ignores_path("drop.py") is True
+        assert rules.ignores_path("keep.py") is False
+
+    def test_nested_base_scopes_patterns(self):
+        rules = _rules("*.js", base="web/")
+        assert rules.ignores_path("web/app.js") is True
+        assert rules.ignores_path("api/app.js") is False
+
+    def test_comments_and_blank_lines_skipped(self):
+        assert _compile_gitignore_line("# comment", "") is None
+        assert _compile_gitignore_line("   ", "") is None
+
+    def test_builtin_noise_without_patterns(self):
+        rules = IgnoreRules()
+        assert rules.ignores_path("Vendor/lib/x.go") is True
+        assert rules.ignores_path("static/app.min.js") is True
+        assert rules.ignores_path("src/vendored.go") is False
+
+
+class TestScannerIgnoreRules:
+    def test_filesystem_walk_honours_nested_gitignore(self, make_repo):
+        repo = make_repo({
+            ".gitignore": "generated/\n",
+            "app/main.py": "",
+            "generated/schema.py": "",
+            "web/.gitignore": "*.js\n!keep.js\n",
+            "web/bundle.js": "",
+            "web/keep.js": "",
+            "api/bundle.js": "",
+        })
+        files = scan_repository(repo, backend="filesystem")["files"]
+        assert files == ["api/bundle.js", "app/main.py", "web/keep.js"]
+
+    def test_override_file_applies(self, make_repo):
+        repo = make_repo({
+            settings.SCANNER_IGNORE_FILE: "proto_gen/\n",
+            "app/main.py": "",
+            "proto_gen/api_pb2.py": "",
+        })
+        assert scan_repository(repo, backend="filesystem")["files"] == ["app/main.py"]
+
+    def test_override_negation_beats_gitignore(self, make_repo):
+        repo = make_repo({
+            ".gitignore": "*.py\n",
+            settings.SCANNER_IGNORE_FILE: "!keep.py\n",
+            "keep.py": "",
+            "drop.py": "",
+            "web/.gitignore": "*.js\n",
+            "web/keep.py": "",
+            "web/app.js": "",
+        })
+        assert scan_repository(repo, backend="filesystem")["files"] == ["keep.py", "web/keep.py"]
+
+    def test_vendor_and_minified_files_skipped(self, make_repo):
+        repo = make_repo({
+            "app/main.go": "",
+            "vendor/github.com/x/y.go": "",
+            "static/app.min.js": "",
+        })
+        assert scan_repository(repo, backend="filesystem")["files"] == ["app/main.go"]
+
+    def test_max_file_size(self, make_repo, monkeypatch):
+        monkeypatch.setattr(settings, "SCANNER_MAX_FILE_SIZE_KB", 1)
+        repo = make_repo({"small.py": "x = 1\n", "huge.py": "x = 1\n" * 400})
+        assert scan_repository(repo, backend="filesystem")["files"] == ["small.py"]
+
+    def test_sniff_drops_minified_and_binary(self, make_repo, monkeypatch):
+        monkeypatch.setattr(settings, "SCANNER_SNIFF_MIN_KB", 1)
+        repo = make_repo({
+            "src/app.js": "const a = 1;\n" * 200,
+            "src/bundle.js": "var a=1;" * 500,
+            "src/blob.py": "",
+        })
+        (repo / "src/blob.py").write_bytes(b"\0\1\2" * 1000)
+        assert scan_repository(repo, backend="filesystem")["files"] == ["src/app.js"]
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_git_backend_applies_override_and_noise_rules(self, make_git_repo):
+        repo = make_git_repo({
+            settings.SCANNER_IGNORE_FILE: "*_pb2.py\n",
+            "app/main.py": "",
+            "app/api_pb2.py": "",
+            "vendor/lib.py": "",
+        }, commit=False)
+        assert scan_repository(repo, backend="git") == scan_repository(repo, backend="filesystem")
+        assert scan_repository(repo, backend="git")["files"] == ["app/main.py"]
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_git_backend_keeps_tracked_files_matching_gitignore(self, make_git_repo, git):
+        repo = make_git_repo({"lib/index.ts": "", "src/lib/util.ts": "", "src/main.ts": ""}, commit=False)
+        (repo / ".gitignore").write_text("/lib/\nsrc/main.ts\n")
+        git(repo, "add", ".gitignore")
+        assert scan_repository(repo, backend="git")["files"] == ["lib/index.ts", "src/lib/util.ts", "src/main.ts"]
+        assert scan_repository(repo, backend="filesystem")["files"] == ["src/lib/util.ts"]
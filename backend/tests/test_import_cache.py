@@ -0,0 +1,93 @@
+"""
+Unit tests for the content-hash import extraction cache.
+"""
+import pytest
+
+from app.services import analysis_snapshot_service, import_cache
+from app.services.analysis_snapshot_service import _inspect_file
+from app.services.import_cache import (
+    batched_writes,
+    cached_imports,
+    clear_import_cache,
+    import_cache_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_import_cache():
+    clear_import_cache(disk=True)
+    yield
+    clear_import_cache(disk=True)
+
+
+class _Extractor:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.result
+
+
+class TestCachedImports:
+    def test_memory_tier_hit(self):
+        extract = _Extractor(["os"])
+        assert cached_imports("abc", "python", 1, extract) == ["os"]
+        assert cached_imports("abc", "python", 1, extract) == ["os"]
+        assert extract.calls == 1
+        stats = import_cache_stats()
+        assert stats["misses"] == 1 and stats["memory_hits"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_disk_tier_survives_memory_reset(self):
+        cached_imports("abc", "python", 1, _Extractor(["os"]))
+        clear_import_cache()
+        extract = _Extractor(["never"])
+        assert cached_imports("abc", "python", 1, extract) == ["os"]
+        assert extract.calls == 0
+        assert import_cache_stats()["disk_hits"] == 1
+
+    def test_language_and_version_are_part_of_the_key(self):
+        cached_imports("abc", "python", 1, _Extractor(["os"]))
+        assert cached_imports("abc", "javascript", 1, _Extractor(["./x"])) == ["./x"]
+        assert cached_imports("abc", "python", 2, _Extractor(["sys"])) == ["sys"]
+        assert import_cache_stats()["misses"] == 3
+
+    def test_batched_misses_stored_in_one_write(self, monkeypatch):
+        batches = []
+        store_many = import_cache._disk_store_many
+
+        def _recording(rows):
+            batches.append(len(rows))
+            store_many(rows)
+
+        monkeypatch.setattr(import_cache, "_disk_store_many", _recording)
+        with batched_writes():
+            for digest in ("a", "b", "c"):
+                cached_imports(digest, "python", 1, _Extractor([digest]))
+            assert batches == []
+        assert batches == [3]
+        clear_import_cache()
+        assert cached_imports("b", "python", 1, _Extractor(["never"])) == ["b"]
+        assert import_cache_stats()["disk_hits"] == 1
+
+
+class TestInspectUsesImportCache:
+    def test_identical_file_in_two_repos_parsed_once(self, make_repo, monkeypatch):
+        content = "import os\nfrom app import utils\n"
+        first = make_repo({"app/main.py": content})
+        fork = make_repo({"app/main.py": content})
+
+        calls = []
+        original = analysis_snapshot_service._extract_imports_for_file
+
+        def _counting(**kwargs):
+            calls.append(kwargs["language"])
+            return original(**kwargs)
+
+        monkeypatch.setattr(analysis_snapshot_service, "_extract_imports_for_file", _counting)
+        a = _inspect_file({"current_summary": {"local_path": str(first)}}, "app/main.py")
+        b = _inspect_file({"current_summary": {"local_path": str(fork)}}, "app/main.py")
+        assert a["imported_modules"] == b["imported_modules"] == ["os", "app"]
+        assert calls == ["python"]
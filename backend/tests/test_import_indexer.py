@@ -0,0 +1,104 @@
+"""
+Unit tests for bulk whole-repo import extraction.
+"""
+
+from app.services import import_indexer
+from app.services.analysis_snapshot_service import _resolved_import_targets
+from app.core.config import settings
+from app.services.import_indexer import (
+    index_repository_imports,
+    merge_dependency_edges,
+    prune_dependency_edges,
+)
+
+
+REPO_FILES = {
+    "app/main.py": "import os\nfrom app import utils\n",
+    "app/utils.py": "import json\nimport os\n",
+    "web/index.js": "import x from './x';\nconst y = require('lodash');\n",
+    "web/x.js": "",
+    "cmd/main.go": 'package main\n\nimport "fmt"\n',
+    "README.md": "import nothing\n",
+}
+
+
+class TestIndexRepositoryImports:
+    def test_edges_for_every_scanned_file(self, make_repo):
+        repo = make_repo(REPO_FILES)
+        edges = index_repository_imports(repo, workers=1)
+        assert [e["source"] for e in edges] == [
+            "app/main.py", "app/utils.py", "cmd/main.go", "web/index.js", "web/x.js",
+        ]
+        by_source = {e["source"]: e["imports"] for e in edges}
+        assert by_source["app/utils.py"] == ["json", "os"]
+        assert by_source["web/index.js"] == ["./x", "lodash"]
+        assert by_source["cmd/main.go"] == ["fmt"]
+
+    def test_deterministic_across_workers_and_chunks(self, make_repo):
+        files = {f"pkg/m{i}.py": f"import mod{i % 7}\nimport os\n" for i in range(40)}
+        repo = make_repo(files)
+        serial = index_repository_imports(repo, workers=1, chunk_size=64)
+        pooled = index_repository_imports(make_repo(files), workers=2, chunk_size=3)
+        assert pooled == serial
+
+    def test_second_run_served_from_file_index(self, make_repo, monkeypatch):
+        repo = make_repo(REPO_FILES)
+        first = index_repository_imports(repo, workers=1)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("file should not be re-read")
+
+        monkeypatch.setattr(import_indexer, "_extract_chunk", _fail)
+        assert index_repository_imports(repo, workers=1) == first
+
+    def test_small_batches_skip_the_pool_by_default(self, make_repo, monkeypatch):
+        repo = make_repo({f"pkg/m{i}.py": "import os\n" for i in range(10)})
+        monkeypatch.setattr(settings, "IMPORT_INDEX_WORKERS", 4)
+        monkeypatch.setattr(settings, "IMPORT_INDEX_CHUNK_SIZE", 2)
+
+        def _no_pool(*args, **kwargs):
+            raise AssertionError("process pool should not start")
+
+        monkeypatch.setattr(import_indexer, "ProcessPoolExecutor", _no_pool)
+        assert len(index_repository_imports(repo)) == 10
+
+    def test_paths_restricts_to_given_files(self, make_repo):
+        repo = make_repo(REPO_FILES)
+        edges = index_repository_imports(repo, paths=["app/utils.py", "README.md", "gone.py"], workers=1)
+        assert edges == [{"source": "app/utils.py", "imports": ["json", "os"]}]
+
+
+class TestMergeDependencyEdges:
+    def test_merge_replaces_and_sorts(self):
+        state = {"dependency_edges": [{"source": "b.py", "imports": ["old"]}]}
+        merge_dependency_edges(state, [
+            {"source": "b.py", "imports": ["new"]},
+            {"source": "a.py", "imports": ["os"]},
+        ])
+        assert state["dependency_edges"] == [
+            {"source": "a.py", "imports": ["os"]},
+            {"source": "b.py", "imports": ["new"]},
+        ]
+
+    def test_prune_keeps_explored_sources(self):
+        state = {
+            "explored_files": ["a.py"],
+            "dependency_edges": [
+                {"source": "a.py", "imports": ["os"]},
+                {"source": "b.py", "imports": ["json"]},
+            ],
+        }
+        prune_dependency_edges(state)
+        assert state["dependency_edges"] == [{"source": "a.py", "imports": ["os"]}]
+
+    def test_import_targets_only_follow_explored_files(self, make_repo):
+        repo = make_repo({**REPO_FILES, "web/other.js": "", "web/y.js": ""})
+        state = {
+            "current_summary": {"local_path": str(repo)},
+            "explored_files": ["web/index.js"],
+            "dependency_edges": [
+                {"source": "web/index.js", "imports": ["./x", "lodash"]},
+                {"source": "web/other.js", "imports": ["./y"]},
+            ],
+        }
+        assert _resolved_import_targets(state) == {"web/x.js"}
@@ -0,0 +1,409 @@
+"""
+Unit tests for repo-level import resolution.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.import_resolution import (
+    GoModule,
+    GoResolver,
+    IncludeResolver,
+    JavaResolver,
+    ResolutionIndex,
+    RustResolver,
+)
+
+
+class TestResolutionIndex:
+    # Never created: JS/Python resolution must not touch the filesystem.
+    REPO = Path("/nonexistent/repo")
+
+    def test_js_probe_order(self):
+        index = ResolutionIndex(self.REPO, [
+            "src/app.js",
+            "src/util.ts",
+            "src/util.js",
+            "src/util/index.js",
+            "src/widgets/index.tsx",
+            "src/widgets/index.jsx",
+            "src/styles.module.ts",
+        ])
+        assert index.resolve("src/app.js", "./util") == "src/util.js"
+        assert index.resolve("src/app.js", "./util.ts") == "src/util.ts"
+        assert index.resolve("src/app.js", "./widgets") == "src/widgets/index.jsx"
+        assert index.resolve("src/app.js", "./styles.module") == "src/styles.module.ts"
+        assert index.resolve("src/widgets/index.jsx", "../util") == "src/util.js"
+        assert index.resolve("src/app.js", "./styles.css") is None  # not a scanned file
+        assert index.resolve("src/app.js", "../../outside") is None
+
+    def test_python_relative_imports(self):
+        index = ResolutionIndex(self.REPO, [
+            "pkg/__init__.py",
+            "pkg/sub/__init__.py",
+            "pkg/sub/mod.py",
+            "pkg/sub/helpers.py",
+            "pkg/models.py",
+            "top.py",
+        ])
+        assert index.resolve("pkg/sub/mod.py", ".helpers") == "pkg/sub/helpers.py"
+        assert index.resolve("pkg/sub/mod.py", ".") == "pkg/sub/__init__.py"
+        assert index.resolve("pkg/sub/mod.py", "..") == "pkg/__init__.py"
+        assert index.resolve("pkg/sub/mod.py", "..models") == "pkg/models.py"
+        assert index.resolve("pkg/sub/mod.py", "..sub.helpers") == "pkg/sub/helpers.py"
+        assert index.resolve("pkg/sub/mod.py", "...top") == "top.py"
+        assert index.resolve("pkg/sub/mod.py", "....top") is None
+        assert index.resolve("pkg/sub/mod.py", ".missing") is None
+
+    def test_python_modules_under_package_roots(self):
+        files = [
+            "src/app/__init__.py",
+            "src/app/core.py",
+            "src/app/core/__init__.py",
+            "app/legacy.py",
+            "tools/app/__init__.py",
+            "odd.name/mod.py",
+        ]
+        index = ResolutionIndex(self.REPO, files, ["src", "."])
+        assert index.resolve("main.py", "app") == "src/app/__init__.py"
+        assert index.resolve("main.py", "app.core") == "src/app/core.py"
+        assert index.resolve("main.py", "app.legacy") == "app/legacy.py"
+        assert index.resolve("main.py", "tools.app") == "tools/app/__init__.py"
+        assert index.resolve("main.py", "odd.name.mod") is None
+        assert index.resolve("main.py", "requests") is None
+        assert ResolutionIndex(self.REPO, files).resolve("main.py", "app") is None
+        # absolute roots inside the repository are accepted
+        tools = ResolutionIndex(self.REPO, files, [self.REPO / "tools"])
+        assert tools.resolve("x.py", "app") == "tools/app/__init__.py"
+
+
+    def test_memo_is_keyed_by_scope(self):
+        index = ResolutionIndex(self.REPO, ["a/x.js", "a/y.js", "a/util.js", "a/b/z.js"])
+        assert index.scope("a/x.js") == index.scope("a/y.js") != index.scope("a/b/z.js")
+        assert index.scope("cmd/main.go") == index.scope("pkg/x.go")
+        assert index.scope("src/lib.rs") != index.scope("src/main.rs")
+        for source in ("a/x.js", "a/y.js", "a/x.js"):
+            assert index.resolve(source, "./util") == "a/util.js"
+        assert index.resolve("a/b/z.js", "./util") is None
+        assert (index.memo_misses, index.memo_hits) == (2, 2)
+
+
+JS_MONOREPO = {
+    "tsconfig.json": json.dumps({"extends": "./tsconfig.base"}),
+    "tsconfig.base.json": (
+        "{\n  // shared options\n  \"compilerOptions\": {\n"
+        "    \"baseUrl\": \".\",\n"
+        "    \"paths\": {\"@org/*\": [\"packages/*/src\"], \"@shared\": [\"libs/shared/index.ts\"],},\n"
+        "  },\n}\n"
+    ),
+    "apps/web/tsconfig.json": json.dumps({
+        "extends": "@org/config/tsconfig.app.json",
+        "compilerOptions": {"baseUrl": ".", "paths": {"@/*": ["./src/*"], "@/legacy/*": ["./old/*", "./src/*"]}},
+    }),
+    "apps/web/src/main.tsx": "",
+    "apps/web/src/components/Button.tsx": "",
+    "apps/web/old/api.ts": "",
+    "apps/admin/jsconfig.json": json.dumps({"compilerOptions": {"baseUrl": "src"}}),
+    "apps/admin/src/index.js": "",
+    "apps/admin/src/utils/format.js": "",
+    "packages/config/package.json": json.dumps({"name": "@org/config"}),
+    "packages/config/tsconfig.app.json": json.dumps({"extends": "../../tsconfig.base.json"}),
+    "packages/config/index.js": "",
+    "packages/ui/package.json": json.dumps({"name": "@org/ui", "main": "dist/index.js", "source": "src/index.ts"}),
+    "packages/ui/src/index.ts": "",
+    "packages/ui/src/button.tsx": "",
+    "packages/ui-kit/package.json": json.dumps({"name": "@org/ui-kit"}),
+    "packages/ui-kit/index.js": "",
+    "libs/shared/index.ts": "",
+    "tools/cli.js": "",
+}
+
+
+class TestJsAliasResolution:
+    @pytest.fixture
+    def index(self, make_repo) -> ResolutionIndex:
+        repo = make_repo(JS_MONOREPO)
+        return ResolutionIndex(repo, [f for f in JS_MONOREPO if not f.endswith(".json")])
+
+    def test_tsconfig_paths_through_extends(self, index):
+        main = "apps/web/src/main.tsx"
+        assert index.resolve(main, "@/components/Button") == "apps/web/src/components/Button.tsx"
+        # longest pattern wins, then its targets in order
+        assert index.resolve(main, "@/legacy/api") == "apps/web/old/api.ts"
+        assert index.resolve(main, "@/legacy/components/Button") == "apps/web/src/components/Button.tsx"
+        # paths are replaced wholesale by the child config
+        assert index.resolve(main, "@shared") is None
+        assert index.resolve(main, "src/components/Button") == "apps/web/src/components/Button.tsx"
+
+    def test_inherited_base_url_anchors_paths(self, make_repo):
+        files = {
+            "tsconfig.json": json.dumps({"compilerOptions": {"baseUrl": "."}}),
+            "web/tsconfig.json": json.dumps({
+                "extends": "../tsconfig.json",
+                "compilerOptions": {"paths": {"~/*": ["web/src/*"]}},
+            }),
+            "web/src/a.ts": "",
+            "web/src/b.ts": "",
+        }
+        repo = make_repo(files)
+        index = ResolutionIndex(repo, ["web/src/a.ts", "web/src/b.ts"])
+        assert index.resolve("web/src/a.ts", "~/b") == "web/src/b.ts"
+        assert index.resolve("web/src/a.ts", "web/src/b") == "web/src/b.ts"
+
+    def test_js_and_python_in_one_directory_do_not_share_the_memo(self, make_repo):
+        files = {"tsconfig.json": json.dumps({"compilerOptions": {"baseUrl": "."}})}
+        files.update({name: "" for name in ("app.js", "utils.js", "tool.py", "utils.py")})
+        repo = make_repo(files)
+        expected = [("app.js", "utils.js"), ("tool.py", "utils.py")]
+        for order in (expected, expected[::-1]):
+            index = ResolutionIndex(repo, [f for f in files if not f.endswith(".json")], [repo])
+            assert [(source, index.resolve(source, "utils")) for source, _ in order] == order
+
+    def test_base_config_and_base_url(self, index):
+        assert index.resolve("tools/cli.js", "@shared") == "libs/shared/index.ts"
+        assert index.resolve("tools/cli.js", "@org/ui") == "packages/ui/src/index.ts"
+        assert index.resolve("apps/admin/src/index.js", "utils/format") == "apps/admin/src/utils/format.js"
+        assert index.resolve("apps/admin/src/index.js", "react") is None
+
+    def test_workspace_packages(self, index):
+        admin = "apps/admin/src/index.js"
+        assert index.resolve(admin, "@org/ui") == "packages/ui/src/index.ts"
+        assert index.resolve(admin, "@org/ui/button") == "packages/ui/src/button.tsx"
+        assert index.resolve(admin, "@org/ui-kit") == "packages/ui-kit/index.js"
+        assert index.resolve(admin, "@org/config") == "packages/config/index.js"
+        assert index.resolve(admin, "@org/missing") is None
+
+
+class TestGoResolver:
+    def test_reads_root_and_nested_modules(self, make_repo):
+        files = {
+            "go.mod": "module github.com/org/repo\n\ngo 1.22\n",
+            "pkg/util/util.go": "package util\n",
+            "tools/go.mod": 'module "github.com/org/repo/tools"\n',
+            "tools/gen/gen.go": "package gen\n",
+            "main.go": "package main\n",
+        }
+        repo = make_repo(files)
+        resolver = GoResolver.for_repository(repo, [f for f in files if f.endswith(".go")])
+        assert resolver.modules == [
+            GoModule("github.com/org/repo/tools", "tools"),
+            GoModule("github.com/org/repo", ""),
+        ]
+        assert resolver.resolve("github.com/org/repo/pkg/util") == "pkg/util/util.go"
+        assert resolver.resolve("github.com/org/repo/tools/gen") == "tools/gen/gen.go"
+        assert resolver.resolve("github.com/org/repo") == "main.go"
+        assert resolver.resolve("github.com/org/repo/missing") is None
+        assert resolver.resolve("github.com/org/repository/pkg/util") is None
+        assert resolver.resolve("fmt") is None
+
+    def test_local_replace_directives(self, make_repo):
+        files = {
+            "svc/go.mod": (
+                "module example.com/svc\n\n"
+                "replace example.com/lib => ../lib\n"
+                "replace (\n\texample.com/remote v1.0.0 => example.com/fork v1.0.1\n)\n"
+            ),
+            "svc/main.go": "package main\n",
+            "lib/lib.go": "package lib\n",
+        }
+        repo = make_repo(files)
+        resolver = GoResolver.for_repository(repo, ["svc/main.go", "lib/lib.go"])
+        assert resolver.resolve("example.com/lib") == "lib/lib.go"
+        assert resolver.resolve("example.com/remote") is None
+
+    def test_representative_file_per_package(self):
+        resolver = GoResolver(
+            [GoModule("m", "")],
+            ["a/zeta.go", "a/alpha_test.go", "a/beta.go", "b/doc.go", "b/impl.go", "c/c.go", "c/a.go"],
+        )
+        assert resolver.resolve("m/a") == "a/beta.go"
+        assert resolver.resolve("m/b") == "b/doc.go"
+        assert resolver.resolve("m/c") == "c/c.go"
+
+    def test_repo_without_go_mod(self, make_repo):
+        repo = make_repo({"main.go": "package main\n"})
+        assert GoResolver.for_repository(repo, ["main.go"]).resolve("main") is None
+
+
+RUST_WORKSPACE = {
+    "Cargo.toml": (
+        '[workspace]\nmembers = ["crates/*"]\n\n'
+        '[workspace.dependencies]\ncore-lib = { path = "crates/core-lib" }\n'
+    ),
+    "crates/core-lib/Cargo.toml": '[package]\nname = "core-lib"\nversion = "0.1.0"\n',
+    "crates/core-lib/src/lib.rs": "pub mod models;\n",
+    "crates/core-lib/src/models/mod.rs": "pub mod user;\n",
+    "crates/core-lib/src/models/user.rs": "use super::super::util;\n",
+    "crates/core-lib/src/util.rs": "",
+    "crates/app/Cargo.toml": (
+        '[package]\nname = "app"\nversion = "0.1.0"\n\n'
+        '[dependencies]\ncore-lib = { workspace = true }\n'
+        'storage = { path = "../core-lib", package = "core-lib" }\nserde = "1"\n'
+    ),
+    "crates/app/src/main.rs": "mod handlers;\n",
+    "crates/app/src/handlers.rs": "mod auth;\n",
+    "crates/app/src/handlers/auth.rs": "",
+    "crates/app/src/bin/tool/main.rs": "mod helper;\n",
+    "crates/app/src/bin/tool/helper.rs": "",
+    "crates/app/tests/it.rs": "mod common;\n",
+    "crates/app/tests/common/mod.rs": "",
+}
+
+
+class TestRustResolver:
+    @pytest.fixture
+    def resolver(self, make_repo) -> RustResolver:
+        repo = make_repo(RUST_WORKSPACE)
+        return RustResolver.for_repository(repo, [f for f in RUST_WORKSPACE if f.endswith(".rs")])
+
+    def test_crates_from_workspace_manifests(self, resolver):
+        crates = {crate.name: crate for crate in resolver.crates}
+        assert set(crates) == {"core_lib", "app"}
+        assert crates["core_lib"].lib == "crates/core-lib/src/lib.rs"
+        assert crates["app"].lib is None
+        assert crates["app"].dependencies == {"core_lib": "crates/core-lib", "storage": "crates/core-lib"}
+
+    def test_mod_declarations_follow_file_layout(self, resolver):
+        assert resolver.resolve("crates/core-lib/src/lib.rs", "models") == "crates/core-lib/src/models/mod.rs"
+        assert resolver.resolve("crates/core-lib/src/models/mod.rs", "user") == "crates/core-lib/src/models/user.rs"
+        assert resolver.resolve("crates/app/src/main.rs", "handlers") == "crates/app/src/handlers.rs"
+        assert resolver.resolve("crates/app/src/handlers.rs", "auth") == "crates/app/src/handlers/auth.rs"
+        assert resolver.resolve("crates/app/src/bin/tool/main.rs", "helper") == "crates/app/src/bin/tool/helper.rs"
+        assert resolver.resolve("crates/app/tests/it.rs", "common") == "crates/app/tests/common/mod.rs"
+
+    def test_crate_self_and_super_paths(self, resolver):
+        user = "crates/core-lib/src/models/user.rs"
+        assert resolver.resolve(user, "crate::util::helper") == "crates/core-lib/src/util.rs"
+        assert resolver.resolve(user, "crate::Thing") == "crates/core-lib/src/lib.rs"
+        assert resolver.resolve(user, "super::Model") == "crates/core-lib/src/models/mod.rs"
+        assert resolver.resolve(user, "super::super::util") == "crates/core-lib/src/util.rs"
+        assert resolver.resolve(user, "super::super::super::outside") is None
+        assert resolver.resolve("crates/core-lib/src/models/mod.rs", "self::user::User") == user
+        assert resolver.resolve("crates/app/src/handlers/auth.rs", "crate::handlers") == "crates/app/src/handlers.rs"
+
+    def test_other_crates_and_external_paths(self, resolver):
+        main = "crates/app/src/main.rs"
+        assert resolver.resolve(main, "core_lib::models::user::User") == "crates/core-lib/src/models/user.rs"
+        assert resolver.resolve(main, "storage::Thing") == "crates/core-lib/src/lib.rs"
+        assert resolver.resolve(main, "serde::Deserialize") is None
+        assert resolver.resolve(main, "std::collections::HashMap") is None
+        assert resolver.resolve("unknown.rs", "crate::x") is None
+
+
+class TestJavaResolver:
+    def test_package_declarations_not_paths(self, make_repo):
+        files = {
+            "core/src/main/java/com/acme/model/User.java": (
+                "/*\n * Copyright\n * package not.this;\n */\n"
+                "package com.acme.model; // models\n\nimport java.util.List;\n\npublic class User {}\n"
+            ),
+            "core/src/main/java/com/acme/model/Role.java": "package com.acme.model;\n\nenum Role {}\n",
+            "core/src/main/java/com/acme/model/package-info.java": "package com.acme.model;\n",
+            "web/src/Misplaced.java": "package com.acme.web;\nclass Misplaced {}\n",
+            "scripts/Tool.java": "class Tool {}\n",
+        }
+        repo = make_repo(files)
+        resolver = JavaResolver.for_repository(repo, list(files))
+        user = "core/src/main/java/com/acme/model/User.java"
+        assert resolver.resolve("com.acme.model.User") == user
+        assert resolver.resolve("com.acme.web.Misplaced") == "web/src/Misplaced.java"
+        assert resolver.resolve("Tool") == "scripts/Tool.java"
+        assert resolver.resolve("com.acme.model.Missing") is None
+        assert resolver.resolve("java.util.List") is None
+
+    def test_wildcards_nested_types_and_static_members(self):
+        resolver = JavaResolver({
+            "src/a/b/Zeta.java": "a.b",
+            "src/a/b/Alpha.java": "a.b",
+            "src/a/b/package-info.java": "a.b",
+        })
+        assert resolver.resolve("a.b.*") == "src/a/b/Alpha.java"
+        assert resolver.resolve("a.b.Zeta.*") == "src/a/b/Zeta.java"
+        assert resolver.resolve("a.b.Zeta.Inner") == "src/a/b/Zeta.java"
+        assert resolver.resolve("a.b.Zeta.helper") == "src/a/b/Zeta.java"
+        assert resolver.resolve("a.c.*") is None
+        assert resolver.resolve("a.b") is None
+
+
+class TestIncludeResolver:
+    def test_include_directories_from_cmake(self, make_repo):
+        files = {
+            "CMakeLists.txt": (
+                "project(demo)\n"
+                "# include_directories(commented/out)\n"
+                "include_directories(third_party/fmt ${PROJECT_SOURCE_DIR}/generated)\n"
+                "add_subdirectory(lib)\n"
+            ),
+            "lib/CMakeLists.txt": (
+                "target_include_directories(core PUBLIC\n"
+                "    $<BUILD_INTERFACE:${CMAKE_CURRENT_SOURCE_DIR}/api>\n"
+                "    $<INSTALL_INTERFACE:include>\n"
+                "  PRIVATE \"src\" ${CMAKE_BINARY_DIR}/gen)\n"
+            ),
+            "lib/api/core/core.h": "",
+            "lib/src/impl.hpp": "",
+            "lib/src/core.cc": "",
+            "third_party/fmt/fmt/format.h": "",
+            "generated/version.h": "",
+        }
+        repo = make_repo(files)
+        resolver = IncludeResolver.for_repository(repo, [f for f in files if "CMake" not in f])
+        assert resolver.include_dirs == ["third_party/fmt", "generated", "lib/api", "lib/src"]
+        assert resolver.resolve("lib/src/core.cc", "core/core.h") == "lib/api/core/core.h"
+        assert resolver.resolve("lib/src/core.cc", "impl.hpp") == "lib/src/impl.hpp"
+        assert resolver.resolve("lib/src/core.cc", "fmt/format.h") == "third_party/fmt/fmt/format.h"
+        assert resolver.resolve("lib/src/core.cc", "version.h") == "generated/version.h"
+        assert resolver.resolve("lib/src/core.cc", "vector") is None
+
+    def test_include_directories_from_compile_commands(self, make_repo):
+        database = [
+            {
+                "directory": "/build/machine/proj/build",
+                "command": "c++ -I../vendor/inc -isystem /usr/include -I /build/machine/proj/src -c ../src/main.cpp",
+                "file": "../src/main.cpp",
+            },
+            {
+                "directory": "/build/machine/proj/build",
+                "arguments": ["cc", "-iquote", "../tools", "-c", "../tools/t.c"],
+                "file": "../tools/t.c",
+            },
+        ]
+        files = {
+            "build/compile_commands.json": json.dumps(database),
+            "src/main.cpp": "",
+            "tools/t.c": "",
+            "vendor/inc/lib.h": "",
+        }
+        repo = make_repo(files)
+        resolver = IncludeResolver.for_repository(repo, ["src/main.cpp", "tools/t.c", "vendor/inc/lib.h"])
+        assert resolver.include_dirs == ["vendor/inc", "src", "tools"]
+        assert resolver.resolve("src/main.cpp", "lib.h") == "vendor/inc/lib.h"
+
+    def test_search_order_without_build_metadata(self):
+        resolver = IncludeResolver(
+            ["include"],
+            [
+                "include/util.h",
+                "src/util.h",
+                "src/main.c",
+                "src/net/socket.c",
+                "src/net/common/config.h",
+                "other/common/config.h",
+                "include/proj/log.hpp",
+            ],
+        )
+        # quoted-include semantics: the including file's directory wins
+        assert resolver.resolve("src/main.c", "util.h") == "src/util.h"
+        assert resolver.resolve("src/net/socket.c", "util.h") == "include/util.h"
+        assert resolver.resolve("src/net/socket.c", "./../util.h") == "src/util.h"
+        assert resolver.resolve("src/main.c", "proj/log.hpp") == "include/proj/log.hpp"
+        # no include directory covers it: the nearest file with that suffix
+        assert resolver.resolve("src/net/socket.c", "common/config.h") == "src/net/common/config.h"
+        assert resolver.resolve("src/main.c", "../../outside.h") is None
+        assert resolver.resolve("src/main.c", "stdio.h") is None
+
+    def test_absolute_include_is_external(self):
+        resolver = IncludeResolver([], ["src/main.c", "src/usr/include/stdio.h", "usr/include/stdio.h"])
+        assert resolver.resolve("src/main.c", "/usr/include/stdio.h") is None
+        assert resolver.resolve("src/main.c", "//usr/include/stdio.h") is None
@@ -0,0 +1,117 @@
+"""
+Unit tests for diff-driven incremental re-analysis.
+"""
+import shutil
+
+import pytest
+
+from app.services.analysis_snapshot_service import (
+    _inspect_file,
+    _record_dependency_edge,
+    _record_inspected_fact,
+    build_analysis_snapshot,
+)
+from app.services.analysis_state_store import _get_git_commit_hash, save_state
+from app.services.incremental_analysis import changed_files_between, refresh_cached_state
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _explore(state: dict, file_path: str) -> None:
+    inspected = _inspect_file(state, file_path)
+    state["explored_files"].append(file_path)
+    _record_inspected_fact(state, inspected)
+    _record_dependency_edge(state, inspected)
+
+
+class TestChangedFilesBetween:
+    def test_reports_changed_and_deleted(self, make_git_repo, commit_all):
+        repo = make_git_repo({"a.py": "", "b.py": ""})
+        old = _get_git_commit_hash(str(repo))
+        (repo / "a.py").write_text("import os\n")
+        (repo / "b.py").unlink()
+        (repo / "c.py").write_text("")
+        commit_all(repo, "change")
+        new = _get_git_commit_hash(str(repo))
+        changed, deleted = changed_files_between(repo, old, new)
+        assert sorted(changed) == ["a.py", "c.py"]
+        assert deleted == ["b.py"]
+
+    def test_unknown_commit_returns_none(self, make_git_repo):
+        repo = make_git_repo({"a.py": ""})
+        assert changed_files_between(repo, "0" * 40, "HEAD") is None
+
+
+class TestRefreshCachedState:
+    def test_updates_only_changed_entries(self, make_git_repo, commit_all, tmp_path):
+        repo = make_git_repo({
+            "app/__init__.py": "",
+            "app/main.py": "from .utils import helper\n",
+            "app/utils.py": "def helper(): pass\n",
+            "app/old.py": "import json\n",
+        })
+        state = build_analysis_snapshot(repo)["analysis_state"]
+        for file_path in ("app/main.py", "app/utils.py", "app/old.py"):
+            _explore(state, file_path)
+        cache_dir = tmp_path
+        save_state(state["repo_id"], str(repo), state, cache_dir)
+
+        (repo / "app/main.py").write_text("import os\nfrom .utils import helper\n")
+        (repo / "app/old.py").unlink()
+        (repo / "app/new.py").write_text("")
+        commit_all(repo, "push")
+
+        updated = refresh_cached_state(state["repo_id"], str(repo), cache_dir)
+
+        assert updated["explored_files"] == ["app/main.py", "app/utils.py"]
+        facts = {fact["file_path"]: fact for fact in updated["inspected_facts"]}
+        assert set(facts) == {"app/main.py", "app/utils.py"}
+        assert facts["app/main.py"]["imported_modules"] == ["os", ".utils"]
+        assert {e["source"] for e in updated["dependency_edges"]} == {"app/main.py", "app/utils.py"}
+        assert updated["current_summary"]["file_count"] == 4
+        assert {"from": "app/main.py", "to": "app/utils.py"} in (
+            updated["dependency_graph_summary"]["internal_edges"]
+        )
+
+    def test_bulk_edges_stay_out_of_saved_state(self, make_git_repo, commit_all, tmp_path):
+        repo = make_git_repo({"app/main.py": "from app import utils\n", "app/utils.py": "import json\n"})
+        state = build_analysis_snapshot(repo)["analysis_state"]
+        _explore(state, "app/main.py")
+        # Saved by an older version, with a bulk-indexed edge of an unexplored file.
+        state["dependency_edges"].append({"source": "app/utils.py", "imports": ["json"]})
+        save_state(state["repo_id"], str(repo), state, tmp_path)
+
+        (repo / "app/utils.py").write_text("import json\nimport os\n")
+        commit_all(repo, "push")
+
+        updated = refresh_cached_state(state["repo_id"], str(repo), tmp_path)
+        assert [e["source"] for e in updated["dependency_edges"]] == ["app/main.py"]
+        assert "os" in {
+            module["module"] for module in updated["dependency_graph_summary"]["most_imported_modules"]
+        }
+
+    def test_same_commit_returns_saved_state(self, make_git_repo, tmp_path):
+        repo = make_git_repo({"main.py": ""})
+        state = build_analysis_snapshot(repo)["analysis_state"]
+        cache_dir = tmp_path
+        save_state(state["repo_id"], str(repo), state, cache_dir)
+        assert refresh_cached_state(state["repo_id"], str(repo), cache_dir) == state
+
+    def test_missing_state_returns_none(self, make_git_repo, tmp_path):
+        repo = make_git_repo({"main.py": ""})
+        assert refresh_cached_state("nope", str(repo), tmp_path) is None
+
+    def test_recomputes_repo_type_and_top_level_dirs(self, make_git_repo, commit_all, tmp_path):
+        repo = make_git_repo({"app/main.py": ""})
+        state = build_analysis_snapshot(repo)["analysis_state"]
+        save_state(state["repo_id"], str(repo), state, tmp_path)
+
+        (repo / "frontend").mkdir()
+        (repo / "frontend/index.ts").write_text("")
+        commit_all(repo, "add frontend")
+
+        updated = refresh_cached_state(state["repo_id"], str(repo), tmp_path)
+        fresh = build_analysis_snapshot(repo)["analysis_state"]["current_summary"]
+        assert updated["current_summary"]["repo_type"] == fresh["repo_type"] == "mixed"
+        assert updated["current_summary"]["top_level_dirs"] == fresh["top_level_dirs"]
+        assert "frontend" in updated["current_summary"]["top_level_dirs"]
@@ -0,0 +1,231 @@
+"""
+Unit tests for the repository scanner.
+"""
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from app.services import repo_scanner
+from app.services.analysis_snapshot_service import _build_next_candidates
+from app.services.repo_metadata import dominant_language, extract_repo_metadata
+from app.services.repo_scanner import apply_file_changes, iter_repository_files, scan_repository
+
+
+class TestScanRepository:
+    def test_result_shape(self, make_repo):
+        repo = make_repo({"app/main.py": "", "web/index.ts": "", "README.md": ""})
+        result = scan_repository(repo)
+        assert result["repo"] == repo.name
+        assert result["files"] == ["app/main.py", "web/index.ts"]
+        assert result["file_count"] == 2
+        assert result["languages"] == ["python", "typescript"]
+        assert result["file_languages"] == {"app/main.py": "python", "web/index.ts": "typescript"}
+
+    def test_prunes_ignored_directories(self, make_repo):
+        repo = make_repo({
+            "src/app.js": "",
+            "node_modules/lib/index.js": "",
+            "node_modules/lib/node_modules/dep/index.js": "",
+            "src/__pycache__/cached.py": "",
+            ".git/hooks/pre-commit.py": "",
+        })
+        assert scan_repository(repo)["files"] == ["src/app.js"]
+
+    def test_files_sorted(self, make_repo):
+        repo = make_repo({"b.py": "", "a/z.py": "", "a/b.py": ""})
+        assert scan_repository(repo)["files"] == ["a/b.py", "a/z.py", "b.py"]
+
+    def test_suffix_case_insensitive(self, make_repo):
+        repo = make_repo({"Main.JAVA": ""})
+        assert scan_repository(repo)["file_languages"] == {"Main.JAVA": "java"}
+
+    def test_missing_path_raises(self):
+        with pytest.raises(ValueError):
+            scan_repository(Path(tempfile.gettempdir()) / "does-not-exist-codenarrator")
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitIndexBackend:
+    def test_respects_gitignore(self, make_git_repo):
+        repo = make_git_repo({
+            ".gitignore": "generated/\n",
+            "app/main.py": "",
+            "generated/schema.py": "",
+        }, commit=False)
+        result = scan_repository(repo, backend="git")
+        assert result["files"] == ["app/main.py"]
+
+    def test_untracked_files_are_not_listed(self, make_git_repo):
+        repo = make_git_repo({"app/main.py": ""}, commit=False)
+        (repo / "app/scratch.py").write_text("")
+        assert scan_repository(repo, backend="git")["files"] == ["app/main.py"]
+        assert "app/scratch.py" in scan_repository(repo, backend="filesystem")["files"]
+
+    def test_matches_filesystem_backend_on_clean_checkout(self, make_git_repo):
+        repo = make_git_repo({
+            "src/index.ts": "",
+            "src/util/helpers.js": "",
+            "server/main.go": "",
+            "build/out.js": "",
+        }, commit=False)
+        assert scan_repository(repo, backend="git") == scan_repository(repo, backend="filesystem")
+
+    def test_sizes_and_presence_follow_the_working_tree(self, make_git_repo):
+        repo = make_git_repo({"app/main.py": "import os\n", "app/old.py": "", "app/odd name.py": "x = 1\n"})
+        (repo / "app/main.py").write_text("import os, sys\n")  # not re-staged
+        (repo / "app/old.py").unlink()  # tracked, deleted from disk
+        records = sorted(iter_repository_files(repo, backend="git"))
+        assert records == [("app/main.py", "python", 15), ("app/odd name.py", "python", 6)]
+
+    def test_falls_back_for_non_git_path(self, make_repo):
+        repo = make_repo({"app/main.py": ""})
+        assert scan_repository(repo, backend="git")["files"] == ["app/main.py"]
+
+    def test_unknown_backend_rejected(self, make_repo):
+        repo = make_repo({"app/main.py": ""})
+        with pytest.raises(ValueError):
+            scan_repository(repo, backend="svn")
+
+
+class TestApplyFileChanges:
+    def test_patches_only_given_paths(self, make_repo):
+        repo = make_repo({"a.py": "", "b.py": "", "web/app.js": ""})
+        previous = scan_repository(repo, backend="filesystem")
+        patched = apply_file_changes(
+            previous,
+            changed_files=["c.go", "README.md", "node_modules/x/index.js"],
+            deleted_files=["web/app.js"],
+        )
+        assert patched["files"] == ["a.py", "b.py", "c.go"]
+        assert patched["languages"] == ["go", "python"]
+        assert patched["file_count"] == 3
+        # The input result is shared through the scan cache and must not change.
+        assert previous["file_count"] == 3
+        assert "web/app.js" in previous["files"]
+
+    def test_nested_gitignore_applies_to_changed_paths(self, make_repo):
+        repo = make_repo({".gitignore": "*.gen.py\n", "pkg/.gitignore": "fixtures/\n", "pkg/a.py": ""})
+        previous = scan_repository(repo)
+        changed = ["pkg/fixtures/data.py", "pkg/sub/b.gen.py", "pkg/sub/c.py"]
+        for path in changed:
+            (repo / path).parent.mkdir(parents=True, exist_ok=True)
+            (repo / path).write_text("")
+        patched = apply_file_changes(previous, changed, [], repo)
+        assert patched["files"] == ["pkg/a.py", "pkg/sub/c.py"]
+        assert patched == scan_repository(repo)
+
+    def test_ignore_file_change_rescans(self, make_repo):
+        repo = make_repo({".gitignore": "legacy/\n", "app.py": "", "legacy/old.py": ""})
+        previous = scan_repository(repo)
+        (repo / ".gitignore").write_text("")
+        patched = apply_file_changes(previous, [".gitignore"], [], repo)
+        assert patched["files"] == ["app.py", "legacy/old.py"]
+
+
+class TestParallelWalk:
+    def test_identical_to_serial_walk(self, make_repo):
+        files = {
+            f"pkg{a}/sub{b}/mod{c}.{ext}": ""
+            for a in range(4)
+            for b in range(5)
+            for c, ext in enumerate(["py", "ts", "go", "txt"])
+        }
+        files["node_modules/dep/index.js"] = ""
+        repo = make_repo(files)
+        serial = scan_repository(repo, backend="filesystem")
+        parallel = scan_repository(repo, backend="filesystem", workers=4)
+        assert parallel == serial
+        assert list(parallel["file_languages"]) == serial["files"]
+        assert parallel["file_count"] == 60
+
+    def test_wide_tree_overflow_walked_inline(self, make_repo, monkeypatch):
+        repo = make_repo({f"d{i}/sub/m.py": "" for i in range(300)})
+        serial = scan_repository(repo, backend="filesystem")
+        inline = []
+        walk = repo_scanner._walk_source_files
+
+        def _recording(root, rules, prefix=""):
+            inline.append(prefix)
+            return walk(root, rules, prefix)
+
+        monkeypatch.setattr(repo_scanner, "_walk_source_files", _recording)
+        parallel = scan_repository(repo, backend="filesystem", workers=2)
+        assert parallel == serial
+        # workers=2 queues at most 128 directories; the rest of the 300 are walked inline.
+        assert len(inline) == 300 - 128
+
+
+class TestIterRepositoryFiles:
+    def test_yields_path_language_size_records(self, make_repo):
+        repo = make_repo({"app/main.py": "import os\n", "web/app.ts": "", "notes.txt": "x"})
+        records = sorted(iter_repository_files(repo, backend="filesystem"))
+        assert records == [("app/main.py", "python", 10), ("web/app.ts", "typescript", 0)]
+        assert records[0].language == "python"
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_git_backend_streams_same_records(self, make_git_repo):
+        repo = make_git_repo({"app/main.py": "import os\n", "lib/util.go": "package lib\n"}, commit=False)
+        assert sorted(iter_repository_files(repo, backend="git")) == sorted(
+            iter_repository_files(repo, backend="filesystem")
+        )
+
+    def test_invalid_path_raises_before_iteration(self):
+        with pytest.raises(ValueError):
+            iter_repository_files(Path(tempfile.gettempdir()) / "does-not-exist-codenarrator")
+
+
+class TestWeightedBreakdown:
+    @pytest.fixture
+    def skewed_repo(self, make_repo) -> Path:
+        files = {f"scripts/s{i}.py": "x = 1\n" for i in range(40)}
+        files.update({f"core/big{i}.c": "int x;\n" * 5000 for i in range(3)})
+        return make_repo(files)
+
+    def test_sizes_and_byte_totals_collected_in_scan(self, make_repo):
+        repo = make_repo({"a.py": "abc\n", "lib/b.go": "package b\n"})
+        result = scan_repository(repo)
+        assert result["file_sizes"] == {"a.py": 4, "lib/b.go": 10}
+        assert result["language_bytes"] == {"python": 4, "go": 10}
+        assert "file_line_counts" not in result
+
+    def test_huge_files_still_weigh_in_by_default(self, make_repo):
+        repo = make_repo({"gen/tables.c": "int x;\n" * 200_000, "main.py": "x = 1\n"})
+        result = scan_repository(repo)
+        assert result["files"] == ["gen/tables.c", "main.py"]
+        assert result["language_bytes"] == {"c": 1_400_000, "python": 6}
+
+    def test_count_lines(self, make_repo):
+        repo = make_repo({"a.py": "a\nb\nc", "b.py": "", "c.ts": "x\r\ny\r\n"})
+        result = scan_repository(repo, count_lines=True)
+        assert result["file_line_counts"] == {"a.py": 3, "b.py": 0, "c.ts": 2}
+        assert result["language_lines"] == {"python": 3, "typescript": 2}
+
+    def test_metadata_exposes_all_weightings(self, skewed_repo):
+        repo = skewed_repo
+        metadata = extract_repo_metadata(repo, scan_repository(repo, count_lines=True))
+        assert metadata["language_breakdown"] == {"python": 40, "c": 3}
+        assert metadata["language_breakdown_bytes"] == {"python": 240, "c": 105000}
+        assert metadata["language_breakdown_lines"] == {"python": 40, "c": 15000}
+        assert dominant_language(metadata) == "c"
+
+    def test_candidates_follow_byte_dominant_language(self, skewed_repo):
+        repo = skewed_repo
+        scan_result = scan_repository(repo)
+        metadata = extract_repo_metadata(repo, scan_result)
+        candidates = _build_next_candidates(scan_result, metadata, limit=5)
+        assert "dominant language 'c'" in candidates[0]["reason"]
+
+    def test_dominant_language_falls_back_to_file_counts(self):
+        metadata = {"language_breakdown": {"go": 2, "python": 2}, "language_breakdown_bytes": {"go": 0}}
+        assert dominant_language(metadata) == "go"
+
+    def test_apply_file_changes_keeps_sizes_current(self, make_repo):
+        repo = make_repo({"a.py": "x\n", "b.py": "y\n"})
+        previous = scan_repository(repo, count_lines=True)
+        (repo / "a.py").write_text("x\ny\nz\n")
+        (repo / "c.go").write_text("package c\n")
+        (repo / "b.py").unlink()
+        patched = apply_file_changes(previous, ["a.py", "c.go"], ["b.py"], repo)
+        assert patched == scan_repository(repo, count_lines=True)
@@ -0,0 +1,64 @@
+"""
+Unit tests for the per-scan-generation resolution index cache.
+"""
+import shutil
+
+import pytest
+
+from app.services.resolution_cache import (
+    get_resolution_index,
+    resolution_cache_stats,
+)
+from app.services.scan_cache import invalidate_scan_cache
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+REPO_FILES = {
+    "web/a.js": "",
+    "web/b.js": "",
+    "web/utils.js": "",
+    "web/nested/c.js": "",
+}
+
+
+class TestResolutionCache:
+    def test_index_and_memo_reused_across_calls(self, make_git_repo):
+        repo = make_git_repo(REPO_FILES)
+        index = get_resolution_index(repo)
+        assert index.resolve("web/a.js", "./utils") == "web/utils.js"
+        # same directory, same specifier: answered from the memo
+        assert get_resolution_index(repo).resolve("web/b.js", "./utils") == "web/utils.js"
+        assert get_resolution_index(repo).resolve("web/nested/c.js", "./utils") is None
+        stats = resolution_cache_stats()
+        assert stats["index_builds"] == 1
+        assert stats["index_hits"] == 2
+        assert stats["resolutions"] == 2
+        assert stats["resolutions_avoided"] == 1
+
+    def test_rescan_invalidates_memo(self, make_git_repo, commit_all):
+        repo = make_git_repo(REPO_FILES)
+        first = get_resolution_index(repo)
+        assert first.resolve("web/nested/c.js", "./utils") is None
+        (repo / "web/nested/utils.js").write_text("")
+        commit_all(repo, "more")
+        second = get_resolution_index(repo)
+        assert second is not first
+        assert second.resolve("web/nested/c.js", "./utils") == "web/nested/utils.js"
+        invalidate_scan_cache(repo)
+        assert get_resolution_index(repo) is not second
+        stats = resolution_cache_stats()
+        assert stats["index_builds"] == 3
+        assert stats["entries"] == 1
+        assert stats["resolutions"] == 2  # counters of dropped indexes are kept
+
+    def test_package_roots_get_their_own_index(self, make_git_repo):
+        repo = make_git_repo({"src/app/__init__.py": "", "src/app/core.py": ""})
+        assert get_resolution_index(repo).resolve("x.py", "app.core") is None
+        assert get_resolution_index(repo, ["src"]).resolve("x.py", "app.core") == "src/app/core.py"
+        assert resolution_cache_stats()["entries"] == 2
+
+    def test_non_git_paths_get_a_fresh_index(self, make_repo):
+        repo = make_repo({"main.py": ""})
+        assert get_resolution_index(repo) is not get_resolution_index(repo)
+        assert resolution_cache_stats()["uncached"] == 2
@@ -0,0 +1,61 @@
+"""
+Unit tests for the shared scan-result cache.
+"""
+import shutil
+
+import pytest
+
+from app.services.scan_cache import (
+    get_scan_result,
+    invalidate_scan_cache,
+    scan_cache_stats,
+    scan_generation,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+class TestScanCache:
+    def test_second_lookup_is_a_hit(self, make_git_repo):
+        repo = make_git_repo({"app/main.py": ""})
+        first = get_scan_result(repo)
+        second = get_scan_result(repo)
+        assert first is second
+        stats = scan_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_new_commit_changes_key(self, make_git_repo, commit_all):
+        repo = make_git_repo({"app/main.py": ""})
+        get_scan_result(repo)
+        (repo / "app/extra.py").write_text("")
+        commit_all(repo, "more")
+        assert "app/extra.py" in get_scan_result(repo)["files"]
+        assert scan_cache_stats()["entries"] == 1
+
+    def test_invalidate_forces_rescan(self, make_git_repo):
+        repo = make_git_repo({"app/main.py": ""})
+        get_scan_result(repo)
+        invalidate_scan_cache(repo)
+        get_scan_result(repo)
+        assert scan_cache_stats()["misses"] == 2
+
+    def test_non_git_paths_are_not_cached(self, make_repo):
+        repo = make_repo({"main.py": ""})
+        get_scan_result(repo)
+        get_scan_result(repo)
+        stats = scan_cache_stats()
+        assert stats["uncached"] == 2
+        assert stats["entries"] == 0
+
+    def test_generation_changes_with_the_cached_scan(self, make_git_repo):
+        repo = make_git_repo({"app/main.py": ""})
+        assert scan_generation(repo) is None
+        get_scan_result(repo)
+        first = scan_generation(repo)
+        get_scan_result(repo)
+        assert scan_generation(repo) == first
+        invalidate_scan_cache(repo)
+        assert scan_generation(repo) is None
+        get_scan_result(repo)
+        assert scan_generation(repo) not in (None, first)
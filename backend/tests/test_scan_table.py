@@ -0,0 +1,93 @@
+"""
+Unit tests for the compact scan result table.
+"""
+import json
+import sys
+
+import pytest
+
+from app.services.scan_table import ScanColumn, ScanFileList, ScanTable
+
+RECORDS = [
+    ("README.py", "python", 10),
+    ("app/api/routes.py", "python", 200),
+    ("app/main.py", "python", 50),
+    ("web/src/index.ts", "typescript", 75),
+]
+
+
+@pytest.fixture
+def table() -> ScanTable:
+    return ScanTable(RECORDS, line_counts=[1, 20, 5, 7])
+
+
+class TestScanTable:
+    def test_round_trips_records(self, table):
+        assert list(table.records()) == RECORDS
+        assert len(table) == 4
+        assert table.line_count(1) == 20
+
+    def test_directory_prefixes_stored_once(self):
+        table = ScanTable((f"pkg/mod/file{i}.py", "python", 0) for i in range(100))
+        assert table._dirs == ["pkg/mod/"]
+        assert table._names.startswith("file0.pyfile1.py")
+
+    def test_index_lookup(self, table):
+        assert table.index("app/main.py") == 2
+        assert table.index("app/missing.py") == -1
+        assert table.index("") == -1
+
+    def test_index_lookup_on_large_table(self):
+        paths = sorted(f"pkg{i % 37}/mod{i}.py" for i in range(5000))
+        table = ScanTable((path, "python", 0) for path in paths)
+        assert [table.index(path) for path in paths] == list(range(len(paths)))
+        assert table.index("pkg1/mod5000.py") == -1
+        assert table.index("pkg1/") == -1
+
+    def test_empty_table_lookup(self):
+        assert ScanTable([]).index("a.py") == -1
+
+    def test_without_line_counts(self):
+        table = ScanTable(RECORDS)
+        assert table.has_line_counts is False
+        assert table.line_count(0) == 0
+
+
+class TestScanViews:
+    def test_file_list_behaves_like_list(self, table):
+        files = ScanFileList(table)
+        paths = [r[0] for r in RECORDS]
+        assert files == paths
+        assert paths == files
+        assert list(files) == paths
+        assert files[-1] == "web/src/index.ts"
+        assert files[1:3] == paths[1:3]
+        assert "app/main.py" in files
+        assert "app" not in files
+        with pytest.raises(IndexError):
+            files[4]
+
+    def test_column_behaves_like_dict(self, table):
+        languages = ScanColumn(table, table.language)
+        expected = {path: language for path, language, _ in RECORDS}
+        assert languages == expected
+        assert dict(languages.items()) == expected
+        assert languages["web/src/index.ts"] == "typescript"
+        assert languages.get("nope.py") is None
+        assert "app/main.py" in languages
+        assert sorted(languages.values()) == sorted(expected.values())
+        with pytest.raises(KeyError):
+            languages["nope.py"]
+
+    def test_views_serialise_via_plain_containers(self, table):
+        payload = json.dumps({"files": list(ScanFileList(table)), "sizes": dict(ScanColumn(table, table.size))})
+        assert json.loads(payload)["sizes"]["app/main.py"] == 50
+
+    def test_smaller_than_list_and_dict(self):
+        records = [(f"src/pkg{i % 50}/module_{i}.py", "python", i) for i in range(5000)]
+        records.sort()
+        table = ScanTable(records)
+        paths = [r[0] for r in records]
+        legacy = sys.getsizeof(paths) + sum(sys.getsizeof(p) for p in paths)
+        legacy += sys.getsizeof({p: "python" for p in paths})
+        assert table.nbytes() < legacy / 2